@@ -24,9 +24,12 @@ class ProjectType(Enum):
     GENERIC = "generic"
 
 
-@dataclass
+@dataclass(slots=True)
 class Project:
-    """Represents a registered project in Kata."""
+    """Represents a registered project in Kata.
+
+    Slotted, since a registry or scan can hold many projects at once.
+    """
 
     name: str  # Unique identifier, derived from directory name
     path: str  # Absolute path to project root
@@ -1,8 +1,10 @@
 """Global settings storage for Kata."""
 
+import atexit
 import json
 import logging
-from dataclasses import asdict, dataclass
+import threading
+from dataclasses import asdict, dataclass, replace
 from typing import Any
 
 from kata.core.config import KATA_CONFIG_DIR
@@ -15,6 +17,9 @@ SETTINGS_FILE = KATA_CONFIG_DIR / "settings.json"
 # Legacy loop config file (for migration)
 LEGACY_LOOP_CONFIG = KATA_CONFIG_DIR / "loop_config.json"
 
+# Serializes writers of SETTINGS_FILE, which all share one temp file
+_SAVE_LOCK = threading.Lock()
+
 # Available themes (Kata custom themes)
 AVAILABLE_THEMES = [
     "kata-dark",
@@ -108,23 +113,25 @@ def load_settings() -> Settings:
 def save_settings(settings: Settings) -> None:
     """Save settings to JSON file with atomic write.
 
-    Uses write-to-temp-then-rename pattern for atomicity.
+    Uses write-to-temp-then-rename pattern for atomicity. Safe to call from
+    several threads; writes are serialized.
     """
     KATA_CONFIG_DIR.mkdir(parents=True, exist_ok=True)
 
     temp_file = SETTINGS_FILE.with_suffix(".tmp")
-    try:
-        with open(temp_file, "w") as f:
-            json.dump(settings.to_dict(), f, indent=2)
-            f.write("\n")  # Trailing newline
+    with _SAVE_LOCK:
+        try:
+            with open(temp_file, "w") as f:
+                json.dump(settings.to_dict(), f, indent=2)
+                f.write("\n")  # Trailing newline
 
-        # Atomic rename
-        temp_file.rename(SETTINGS_FILE)
-    except Exception as e:
-        # Clean up temp file on failure
-        if temp_file.exists():
-            temp_file.unlink()
-        raise RuntimeError(f"Failed to save settings: {e}") from e
+            # Atomic rename
+            temp_file.rename(SETTINGS_FILE)
+        except Exception as e:
+            # Clean up temp file on failure
+            if temp_file.exists():
+                temp_file.unlink()
+            raise RuntimeError(f"Failed to save settings: {e}") from e
 
 
 # Singleton for app-wide access
@@ -139,11 +146,8 @@ def get_settings() -> Settings:
     return _settings
 
 
-def update_settings(**kwargs: Any) -> Settings:
-    """Update specific settings and persist immediately.
-
-    Example: update_settings(loop_enabled=True, refresh_interval=10)
-    """
+def _apply_updates(**kwargs: Any) -> Settings:
+    """Apply updates to the in-memory settings and re-validate them."""
     settings = get_settings()
 
     for key, value in kwargs.items():
@@ -152,13 +156,100 @@ def update_settings(**kwargs: Any) -> Settings:
 
     # Re-validate after updates
     settings.__post_init__()
+    return settings
+
+
+def update_settings(**kwargs: Any) -> Settings:
+    """Update specific settings and persist immediately.
 
+    Example: update_settings(loop_enabled=True, refresh_interval=10)
+    """
+    settings = _apply_updates(**kwargs)
     save_settings(settings)
     return settings
 
 
+class SettingsPersistenceQueue:
+    """Coalesces settings writes onto a background thread.
+
+    Any number of updates scheduled within ``delay`` seconds result in a single
+    write of the latest in-memory settings (latest value wins).
+    """
+
+    def __init__(self, delay: float = 0.5) -> None:
+        """Initialize the queue.
+
+        Args:
+            delay: Seconds to wait for further updates before writing
+        """
+        self._delay = delay
+        self._lock = threading.Lock()
+        # Held across checking for and writing pending settings, so a flush
+        # waits for a write the timer thread has already started
+        self._write_lock = threading.Lock()
+        self._timer: threading.Timer | None = None
+        self._pending = False
+
+    def schedule(self) -> None:
+        """Schedule a write of the current settings if none is pending."""
+        with self._lock:
+            self._pending = True
+            if self._timer is None:
+                self._timer = threading.Timer(self._delay, self._write_pending)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self) -> None:
+        """Write pending settings to disk now, waiting for any write in progress."""
+        with self._lock:
+            timer, self._timer = self._timer, None
+        if timer is not None:
+            timer.cancel()
+        self._write_pending()
+
+    def _write_pending(self) -> None:
+        """Write the current settings if an update is pending."""
+        with self._write_lock:
+            with self._lock:
+                if self._timer is threading.current_thread():
+                    self._timer = None
+                pending, self._pending = self._pending, False
+
+            settings = _settings
+            if not pending or settings is None:
+                return
+
+            try:
+                save_settings(replace(settings))
+            except RuntimeError as e:
+                logger.warning(f"{e}")
+
+
+_persistence_queue = SettingsPersistenceQueue()
+atexit.register(_persistence_queue.flush)
+
+
+def queue_settings_update(**kwargs: Any) -> Settings:
+    """Update specific settings in memory and persist them in the background.
+
+    Rapid successive calls are coalesced into a single disk write. Use
+    flush_settings() to force pending writes out (e.g. when a screen closes).
+
+    Example: queue_settings_update(default_group="Work")
+    """
+    settings = _apply_updates(**kwargs)
+    _persistence_queue.schedule()
+    return settings
+
+
+def flush_settings() -> None:
+    """Write any settings queued by queue_settings_update() to disk."""
+    _persistence_queue.flush()
+
+
 def reload_settings() -> Settings:
     """Force reload settings from disk."""
     global _settings
+    _persistence_queue.flush()
     _settings = load_settings()
     return _settings
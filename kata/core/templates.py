@@ -1,14 +1,14 @@
 """tmuxp YAML template generation for projects."""
 
+import os
 from enum import Enum
 from pathlib import Path
 from typing import Any
 
-import yaml
-
-from kata.core.config import ensure_config_dirs, get_project_config_path
+from kata.core.config import KATA_CONFIG_FILENAME, ensure_config_dirs, get_project_config_path
 from kata.core.models import Project, ProjectType
 from kata.utils.paths import sanitize_session_name
+from kata.utils.safe_yaml import safe_dumper
 
 
 class LayoutPreset(Enum):
@@ -326,9 +326,18 @@ def write_template(
     template = render_template(project, project_type, layout_preset)
     config_path = get_project_config_path(project.path)
 
+    import yaml
+
     # Write YAML with proper formatting
     with open(config_path, "w", encoding="utf-8") as f:
-        yaml.dump(template, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+        yaml.dump(
+            template,
+            f,
+            Dumper=safe_dumper(),
+            default_flow_style=False,
+            sort_keys=False,
+            allow_unicode=True,
+        )
 
     return config_path
 
@@ -354,7 +363,8 @@ def template_exists(project: Project) -> bool:
     Returns:
         True if template exists
     """
-    return get_template_path(project).exists()
+    # Joined as strings; no Path is needed just to stat the file
+    return os.path.exists(os.path.join(project.path, KATA_CONFIG_FILENAME))
 
 
 def generate_adhoc_config(
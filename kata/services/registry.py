@@ -1,12 +1,16 @@
 """Registry service for managing projects."""
 
+import itertools
 import json
 from pathlib import Path
 from typing import Any
 
 from kata.core.config import REGISTRY_FILE, ensure_config_dirs
 from kata.core.models import Project
-from kata.utils.paths import normalize_path
+from kata.utils.paths import clear_resolve_cache, normalize_path
+
+# Global change counter so versions are unique across Registry instances
+_versions = itertools.count(1)
 
 
 class DuplicatePathError(Exception):
@@ -24,13 +28,32 @@ class ProjectNotFoundError(Exception):
 class Registry:
     """Manages the project registry."""
 
-    def __init__(self) -> None:
-        """Initialize the registry."""
+    def __init__(self, *, persistent: bool = True) -> None:
+        """Initialize the registry.
+
+        Args:
+            persistent: Load from and save to REGISTRY_FILE; if False the
+                registry starts empty and lives only in memory
+        """
         self._projects: dict[str, Project] = {}
+        self._version = 0
+        self._persistent = persistent
         self._load()
 
+    @property
+    def version(self) -> int:
+        """Counter that changes whenever the registry is loaded or modified.
+
+        Lets callers cache data derived from the registry and cheaply detect
+        when it needs recomputing.
+        """
+        return self._version
+
     def _load(self) -> None:
         """Load registry from disk."""
+        self._version = next(_versions)
+        if not self._persistent:
+            return
         ensure_config_dirs()
 
         if not REGISTRY_FILE.exists():
@@ -49,6 +72,10 @@ class Registry:
 
     def _save(self) -> None:
         """Save registry to disk."""
+        self._version = next(_versions)
+        clear_resolve_cache()
+        if not self._persistent:
+            return
         ensure_config_dirs()
 
         data: dict[str, Any] = {
@@ -67,6 +94,8 @@ class Registry:
         Raises:
             DuplicatePathError: If a project with the same path already exists
         """
+        # Resolve afresh so the duplicate check sees current symlinks
+        clear_resolve_cache()
         normalized_path = normalize_path(project.path)
 
         # Check for duplicate path
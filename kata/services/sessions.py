@@ -10,6 +10,7 @@ from typing import TYPE_CHECKING
 from kata.core.config import get_project_config_path, migrate_project_config
 from kata.core.models import Project, SessionStatus
 from kata.utils.paths import sanitize_session_name
+from kata.utils.safe_yaml import safe_dumper
 
 if TYPE_CHECKING:
     import libtmux
@@ -359,7 +360,13 @@ def launch_adhoc_session(directory: str, session_name: str | None = None) -> str
             prefix="kata-adhoc-",
             delete=False,
         ) as f:
-            yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(
+                config,
+                f,
+                Dumper=safe_dumper(),
+                default_flow_style=False,
+                sort_keys=False,
+            )
             temp_path = f.name
 
         try:
@@ -683,7 +690,14 @@ def save_current_session_layout(project: Project) -> Path:
 
     try:
         with open(config_path, "w", encoding="utf-8") as f:
-            yaml.dump(base, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+            yaml.dump(
+                base,
+                f,
+                Dumper=safe_dumper(),
+                default_flow_style=False,
+                sort_keys=False,
+                allow_unicode=True,
+            )
     except Exception as e:
         raise SessionError(f"Failed to write config: {e}")
 
@@ -18,10 +18,12 @@ from kata.tui.screens.context_menu import ContextMenuScreen, MenuAction
 from kata.tui.screens.search import SearchModal
 from kata.tui.screens.settings import SettingsScreen
 from kata.tui.screens.wizard import AddWizard
-from kata.tui.themes import KATA_THEMES
+from kata.tui.themes import KATA_THEMES, KATA_THEMES_BY_NAME
 from kata.tui.widgets.preview import PreviewPane
 from kata.tui.widgets.recents import RecentsPanel
 from kata.tui.widgets.tree import ProjectTree
+from kata.utils.detection import clear_project_type_cache
+from kata.utils.git import clear_git_status_cache
 from kata.utils.zoxide import ZoxideEntry
 
 
@@ -61,7 +63,7 @@ class KataDashboard(App):
         # Reload settings fresh from disk to get current theme
         settings = reload_settings()
         theme_name = settings.theme
-        if theme_name in [t.name for t in KATA_THEMES]:
+        if theme_name in KATA_THEMES_BY_NAME:
             self.theme = theme_name
         else:
             self.theme = "kata-dark"
@@ -241,6 +243,9 @@ class KataDashboard(App):
 
     def action_refresh(self) -> None:
         """Refresh the project tree."""
+        # An explicit refresh shouldn't be served from cached lookups
+        clear_git_status_cache()
+        clear_project_type_cache()
         try:
             tree = self.query_one(ProjectTree)
             tree.refresh_projects()
@@ -4,10 +4,11 @@ from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Vertical
 from textual.screen import ModalScreen
+from textual.timer import Timer
 from textual.widgets import Input, OptionList, Static
 from textual.widgets.option_list import Option
 
-from kata.core.models import Project, SessionStatus
+from kata.core.models import Project, ProjectType, SessionStatus
 from kata.services.registry import get_registry
 from kata.services.sessions import get_all_session_statuses
 from kata.utils.detection import detect_project_type
@@ -23,6 +24,10 @@ PROJECT_TYPE_ICONS = {
     "generic": "󰉋",
 }
 
+# Icons keyed by detected type, with the generic icon as the fallback
+_GENERIC_ICON = PROJECT_TYPE_ICONS["generic"]
+_ICON_BY_TYPE = {t: PROJECT_TYPE_ICONS.get(t.value, _GENERIC_ICON) for t in ProjectType}
+
 
 class SearchModal(ModalScreen[Project | ZoxideEntry | None]):
     """Modal search screen for quick switching."""
@@ -80,6 +85,9 @@ class SearchModal(ModalScreen[Project | ZoxideEntry | None]):
         Binding("up", "focus_results", "Up", show=False),
     ]
 
+    # Quiet period before a changed query re-renders the results
+    SEARCH_DEBOUNCE = 0.05
+
     def __init__(self) -> None:
         """Initialize the search modal."""
         super().__init__()
@@ -88,6 +96,8 @@ class SearchModal(ModalScreen[Project | ZoxideEntry | None]):
         self._items: list[Project | ZoxideEntry] = []
         self._index_map: dict[int, int] = {}  # option_index -> items_index
         self._statuses: dict[str, SessionStatus] = {}
+        self._query = ""
+        self._search_timer: Timer | None = None
 
     def compose(self) -> ComposeResult:
         """Compose the modal."""
@@ -123,6 +133,8 @@ class SearchModal(ModalScreen[Project | ZoxideEntry | None]):
 
         query_lower = query.lower()
         option_idx = 0
+        # Collected and added in one batch so the list is rebuilt once
+        options: list[Option] = []
 
         # Filter projects
         filtered_projects = [
@@ -140,21 +152,19 @@ class SearchModal(ModalScreen[Project | ZoxideEntry | None]):
 
         # Add projects section
         if filtered_projects:
-            option_list.add_option(Option("[bold cyan]󰉋 Projects[/bold cyan]", disabled=True))
+            options.append(Option("[bold cyan]󰉋 Projects[/bold cyan]", disabled=True))
             option_idx += 1
 
             for project in filtered_projects:
                 status = self._statuses.get(project.name, SessionStatus.IDLE)
                 indicator = self._get_status_indicator(status)
                 project_type = detect_project_type(project.path)
-                type_icon = PROJECT_TYPE_ICONS.get(
-                    project_type.value, PROJECT_TYPE_ICONS["generic"]
-                )
+                type_icon = _ICON_BY_TYPE.get(project_type, _GENERIC_ICON)
 
                 label = (
                     f"  {indicator} {type_icon} {project.name}  [dim]{project.group.lower()}[/dim]"
                 )
-                option_list.add_option(Option(label))
+                options.append(Option(label))
                 self._index_map[option_idx] = len(self._items)
                 self._items.append(project)
                 option_idx += 1
@@ -162,29 +172,29 @@ class SearchModal(ModalScreen[Project | ZoxideEntry | None]):
         # Add zoxide section
         if filtered_zoxide:
             if filtered_projects:
-                option_list.add_option(
+                options.append(
                     Option("[dim]─────────────────────────────────────────[/dim]", disabled=True)
                 )
                 option_idx += 1
-            option_list.add_option(
+            options.append(
                 Option("[bold yellow]󰋚 Recent (not registered)[/bold yellow]", disabled=True)
             )
             option_idx += 1
 
             for entry in filtered_zoxide:
                 project_type = detect_project_type(entry.path)
-                type_icon = PROJECT_TYPE_ICONS.get(
-                    project_type.value, PROJECT_TYPE_ICONS["generic"]
-                )
+                type_icon = _ICON_BY_TYPE.get(project_type, _GENERIC_ICON)
 
                 label = f"  [dim]◇[/dim] [yellow]{type_icon}[/yellow] {entry.name}  [dim]{entry.path}[/dim]"
-                option_list.add_option(Option(label))
+                options.append(Option(label))
                 self._index_map[option_idx] = len(self._items)
                 self._items.append(entry)
                 option_idx += 1
 
         if not self._items:
-            option_list.add_option(Option("[dim]No matches[/dim]", disabled=True))
+            options.append(Option("[dim]No matches[/dim]", disabled=True))
+
+        option_list.add_options(options)
 
         # Pre-select first selectable item
         self._select_first_item()
@@ -208,17 +218,40 @@ class SearchModal(ModalScreen[Project | ZoxideEntry | None]):
 
     def _fuzzy_match(self, query: str, target: str) -> bool:
         """Check if query fuzzy matches target."""
-        if not query:
+        query_len = len(query)
+        if not query_len:
             return True
         query_idx = 0
         for char in target:
-            if query_idx < len(query) and char == query[query_idx]:
+            if char == query[query_idx]:
                 query_idx += 1
-        return query_idx == len(query)
+                if query_idx == query_len:
+                    return True
+        return False
 
     def on_input_changed(self, event: Input.Changed) -> None:
-        """Handle search input changes."""
-        self._render_items(event.value)
+        """Handle search input changes.
+
+        Unchanged values are ignored, and rendering is debounced so that rapid
+        typing coalesces into a single re-render of the results.
+        """
+        if event.value == self._query:
+            return
+        self._query = event.value
+        if self._search_timer is not None:
+            self._search_timer.stop()
+        self._search_timer = self.set_timer(self.SEARCH_DEBOUNCE, self._apply_query)
+
+    def _apply_query(self) -> None:
+        """Render results for the current query."""
+        self._search_timer = None
+        self._render_items(self._query)
+
+    def _flush_query(self) -> None:
+        """Render any pending query immediately, so results match the input."""
+        if self._search_timer is not None:
+            self._search_timer.stop()
+            self._apply_query()
 
     def on_input_submitted(self, event: Input.Submitted) -> None:
         """Handle Enter key in search input."""
@@ -230,6 +263,7 @@ class SearchModal(ModalScreen[Project | ZoxideEntry | None]):
 
     def action_select(self) -> None:
         """Select the highlighted item."""
+        self._flush_query()
         option_list = self.query_one("#search-results", OptionList)
         idx = option_list.highlighted
         if idx is not None and idx in self._index_map:
@@ -240,6 +274,7 @@ class SearchModal(ModalScreen[Project | ZoxideEntry | None]):
 
     def action_focus_results(self) -> None:
         """Focus the results list for navigation."""
+        self._flush_query()
         self.query_one("#search-results", OptionList).focus()
 
     def on_option_list_option_selected(self, event: OptionList.OptionSelected) -> None:
@@ -252,6 +287,7 @@ class SearchModal(ModalScreen[Project | ZoxideEntry | None]):
     def on_key(self, event) -> None:
         """Handle key events for navigation."""
         if event.key in ("down", "up"):
+            self._flush_query()
             results = self.query_one("#search-results", OptionList)
             if not results.has_focus:
                 results.focus()
@@ -12,14 +12,18 @@ from textual.widgets.option_list import Option
 from kata.core.settings import (
     AVAILABLE_THEMES,
     Settings,
+    flush_settings,
     get_settings,
-    update_settings,
+    queue_settings_update,
 )
 
 
 class SettingsScreen(ModalScreen[None]):
     """Modal screen for application settings."""
 
+    # Label/description rules shared with the Add Project wizard
+    CSS_PATH = "_shared.tcss"
+
     CSS = """
     SettingsScreen {
         align: center middle;
@@ -48,23 +52,11 @@ class SettingsScreen(ModalScreen[None]):
         margin-bottom: 1;
     }
 
-    SettingsScreen .setting-label {
-        width: 20;
-        height: 3;
-        content-align: left middle;
-    }
-
     SettingsScreen .setting-control {
         width: 1fr;
         height: 3;
     }
 
-    SettingsScreen .setting-description {
-        color: $text-muted;
-        margin-left: 20;
-        margin-bottom: 1;
-    }
-
     SettingsScreen #theme-list {
         height: auto;
         max-height: 8;
@@ -196,52 +188,51 @@ class SettingsScreen(ModalScreen[None]):
     @on(Switch.Changed, "#loop-switch")
     def on_loop_changed(self, event: Switch.Changed) -> None:
         """Handle loop mode toggle."""
-        update_settings(loop_enabled=event.value)
-        self._settings = get_settings()
+        if event.value == self._settings.loop_enabled:
+            return
+        self._settings = queue_settings_update(loop_enabled=event.value)
         self.post_message(self.SettingsChanged(self._settings))
 
     @on(Input.Changed, "#group-input")
     def on_group_changed(self, event: Input.Changed) -> None:
         """Handle default group change."""
         value = event.value.strip()
-        if value:
-            update_settings(default_group=value)
-            self._settings = get_settings()
-            self.post_message(self.SettingsChanged(self._settings))
+        if not value or value == self._settings.default_group:
+            return
+        self._settings = queue_settings_update(default_group=value)
+        self.post_message(self.SettingsChanged(self._settings))
 
     @on(Input.Changed, "#interval-input")
     def on_interval_changed(self, event: Input.Changed) -> None:
         """Handle refresh interval change."""
         try:
             value = int(event.value.strip())
-            # Clamp to valid range
-            value = max(1, min(60, value))
-            update_settings(refresh_interval=value)
-            self._settings = get_settings()
-            self.post_message(self.SettingsChanged(self._settings))
         except ValueError:
-            pass  # Ignore invalid input while typing
+            return  # Ignore invalid input while typing
+
+        # Clamp to valid range
+        value = max(1, min(60, value))
+        if value == self._settings.refresh_interval:
+            return
+        self._settings = queue_settings_update(refresh_interval=value)
+        self.post_message(self.SettingsChanged(self._settings))
 
     @on(OptionList.OptionSelected, "#theme-list")
     def on_theme_selected(self, event: OptionList.OptionSelected) -> None:
         """Handle theme selection."""
         if event.option.id and event.option.id != self._settings.theme:
-            update_settings(theme=event.option.id)
-            self._settings = get_settings()
+            self._settings = queue_settings_update(theme=event.option.id)
             self._theme_changed = True
 
             # Apply theme immediately
             self.app.theme = event.option.id
 
             # Update the list to show selection
-            try:
-                theme_list = self.query_one("#theme-list", OptionList)
-                theme_list.clear_options()
-                for t in AVAILABLE_THEMES:
-                    prefix = "● " if t == self._settings.theme else "  "
-                    theme_list.add_option(Option(f"{prefix}{self._format_theme_name(t)}", id=t))
-            except Exception:
-                pass
+            theme_list = self.query_one("#theme-list", OptionList)
+            theme_list.clear_options()
+            for t in AVAILABLE_THEMES:
+                prefix = "● " if t == self._settings.theme else "  "
+                theme_list.add_option(Option(f"{prefix}{self._format_theme_name(t)}", id=t))
 
             self.app.notify(
                 f"Theme: {self._format_theme_name(event.option.id)}",
@@ -252,8 +243,9 @@ class SettingsScreen(ModalScreen[None]):
     @on(Button.Pressed, "#close-btn")
     def on_close_pressed(self) -> None:
         """Handle close button."""
-        self.dismiss(None)
+        self.action_close()
 
     def action_close(self) -> None:
         """Handle escape key."""
+        flush_settings()
         self.dismiss(None)
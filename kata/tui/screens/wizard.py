@@ -1,6 +1,7 @@
 """Add Project Wizard screen for TUI."""
 
 from pathlib import Path
+from typing import Any
 
 from textual import on
 from textual.app import ComposeResult
@@ -9,6 +10,7 @@ from textual.containers import Container, Horizontal, Vertical
 from textual.message import Message
 from textual.reactive import reactive
 from textual.screen import ModalScreen
+from textual.timer import Timer
 from textual.widgets import Button, DirectoryTree, Input, OptionList, Static
 from textual.widgets.option_list import Option
 
@@ -18,6 +20,19 @@ from kata.services.registry import DuplicatePathError, get_registry
 from kata.utils.detection import detect_project_type
 from kata.utils.paths import PathValidationError, validate_project_path
 
+# Sorted group names keyed by registry version, reused across wizard opens
+_groups_cache: tuple[int, tuple[str, ...]] = (-1, ())
+
+
+def _get_sorted_groups() -> tuple[str, ...]:
+    """Return sorted registry groups, recomputing only when the registry changed."""
+    global _groups_cache
+    registry = get_registry()
+    version = registry.version
+    if _groups_cache[0] != version:
+        _groups_cache = (version, tuple(registry.get_groups()))
+    return _groups_cache[1]
+
 
 class WizardStep(Vertical):
     """Base container for wizard steps."""
@@ -28,17 +43,6 @@ class WizardStep(Vertical):
         height: 100%;
         padding: 1 2;
     }
-
-    WizardStep .step-title {
-        text-style: bold;
-        color: $text;
-        margin-bottom: 1;
-    }
-
-    WizardStep .step-description {
-        color: $text-muted;
-        margin-bottom: 1;
-    }
     """
 
 
@@ -68,6 +72,15 @@ class PathStep(WizardStep):
             super().__init__()
             self.path = path
 
+    # Quiet period before a tree selection is written to the path input
+    DIRECTORY_DEBOUNCE = 0.25
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize path step."""
+        super().__init__(*args, **kwargs)
+        self._dir_timer: Timer | None = None
+        self._pending_path: Path | None = None
+
     def compose(self) -> ComposeResult:
         """Compose the step."""
         yield Static("Step 1: Select Project Path", classes="step-title")
@@ -85,11 +98,29 @@ class PathStep(WizardStep):
 
     @on(DirectoryTree.DirectorySelected)
     def on_directory_selected(self, event: DirectoryTree.DirectorySelected) -> None:
-        """Handle directory selection from tree."""
-        self.query_one("#path-input", Input).value = str(event.path)
+        """Handle directory selection from tree.
+
+        Selections are debounced so that rapid tree navigation only writes
+        the final directory to the input (and fires a single Input.Changed).
+        """
+        self._pending_path = event.path
+        if self._dir_timer is not None:
+            self._dir_timer.stop()
+        self._dir_timer = self.set_timer(self.DIRECTORY_DEBOUNCE, self._apply_pending_path)
+
+    def _apply_pending_path(self) -> None:
+        """Write the last selected directory to the path input."""
+        self._dir_timer = None
+        if self._pending_path is not None:
+            self.query_one("#path-input", Input).value = str(self._pending_path)
+            self._pending_path = None
 
     def get_path(self) -> Path:
         """Get the selected path."""
+        # Flush a pending tree selection so Next never reads a stale value
+        if self._dir_timer is not None:
+            self._dir_timer.stop()
+            self._apply_pending_path()
         path_str = self.query_one("#path-input", Input).value.strip()
         if path_str:
             return Path(path_str).expanduser().resolve()
@@ -129,14 +160,12 @@ class GroupStep(WizardStep):
         )
         yield Input(value="Uncategorized", placeholder="Group name...", id="group-input")
 
-        # Get existing groups
-        registry = get_registry()
-        groups = registry.get_groups()
+        # Get existing groups (already sorted)
+        groups = _get_sorted_groups()
 
         if groups:
             yield Static("Existing groups:", classes="group-hint")
-            options = [Option(g) for g in sorted(groups)]
-            yield OptionList(*options, id="existing-groups")
+            yield OptionList(*[Option(g) for g in groups], id="existing-groups")
 
     @on(OptionList.OptionSelected)
     def on_option_selected(self, event: OptionList.OptionSelected) -> None:
@@ -265,6 +294,36 @@ class LayoutStep(WizardStep):
 
     layout_preset: reactive[LayoutPreset] = reactive(LayoutPreset.STANDARD)
 
+    # ASCII art previews for each layout preset
+    _PREVIEWS: dict[LayoutPreset, str] = {
+        LayoutPreset.MINIMAL: (
+            "[dim]┌────────────┐[/dim]\n"
+            "[dim]│[/dim]   editor   [dim]│[/dim]\n"
+            "[dim]└────────────┘[/dim]"
+        ),
+        LayoutPreset.STANDARD: (
+            "[dim]┌────────┐ ┌───────┐ ┌───────┐[/dim]\n"
+            "[dim]│[/dim] editor [dim]│ │[/dim] shell [dim]│ │[/dim] tests [dim]│[/dim]\n"
+            "[dim]└────────┘ └───────┘ └───────┘[/dim]"
+        ),
+        LayoutPreset.FULL: (
+            "[dim]┌────────┬────┐ ┌───────┐ ┌───────┐ ┌───────┐ ┌───────┐[/dim]\n"
+            "[dim]│[/dim] editor [dim]│[/dim]git [dim]│ │[/dim] shell [dim]│ │[/dim] tests [dim]│ │[/dim] build [dim]│ │[/dim] logs  [dim]│[/dim]\n"
+            "[dim]└────────┴────┘ └───────┘ └───────┘ └───────┘ └───────┘[/dim]"
+        ),
+        LayoutPreset.CUSTOM: (
+            "[dim]┌────────────┐[/dim]\n"
+            "[dim]│[/dim]   editor   [dim]│[/dim]  [yellow]← Edit YAML after creation[/yellow]\n"
+            "[dim]└────────────┘[/dim]"
+        ),
+    }
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize layout step."""
+        super().__init__(*args, **kwargs)
+        # Set on mount; None means the preview widget doesn't exist yet
+        self._preview_widget: Static | None = None
+
     def compose(self) -> ComposeResult:
         """Compose the step."""
         yield Static("Step 4: Choose Layout", classes="step-title")
@@ -286,53 +345,16 @@ class LayoutStep(WizardStep):
 
     def on_mount(self) -> None:
         """Initialize preview."""
-        self._update_preview()
+        self._preview_widget = self.query_one("#layout-preview", Static)
+        self._preview_widget.update(self._PREVIEWS[self.layout_preset])
         # Select standard by default
-        try:
-            option_list = self.query_one("#layout-list", OptionList)
-            option_list.highlighted = 1  # Standard is second option
-        except Exception:
-            pass
+        option_list = self.query_one("#layout-list", OptionList)
+        option_list.highlighted = 1  # Standard is second option
 
     def watch_layout_preset(self, preset: LayoutPreset) -> None:
         """React to layout preset changes."""
-        if self.is_mounted:
-            self._update_preview()
-
-    def _update_preview(self) -> None:
-        """Update the ASCII preview based on selected layout."""
-        try:
-            preview = self.query_one("#layout-preview", Static)
-            preview.update(self._render_preview(self.layout_preset))
-        except Exception:
-            pass
-
-    def _render_preview(self, preset: LayoutPreset) -> str:
-        """Render ASCII art preview for a layout preset."""
-        if preset == LayoutPreset.MINIMAL:
-            return (
-                "[dim]┌────────────┐[/dim]\n"
-                "[dim]│[/dim]   editor   [dim]│[/dim]\n"
-                "[dim]└────────────┘[/dim]"
-            )
-        elif preset == LayoutPreset.STANDARD:
-            return (
-                "[dim]┌────────┐ ┌───────┐ ┌───────┐[/dim]\n"
-                "[dim]│[/dim] editor [dim]│ │[/dim] shell [dim]│ │[/dim] tests [dim]│[/dim]\n"
-                "[dim]└────────┘ └───────┘ └───────┘[/dim]"
-            )
-        elif preset == LayoutPreset.FULL:
-            return (
-                "[dim]┌────────┬────┐ ┌───────┐ ┌───────┐ ┌───────┐ ┌───────┐[/dim]\n"
-                "[dim]│[/dim] editor [dim]│[/dim]git [dim]│ │[/dim] shell [dim]│ │[/dim] tests [dim]│ │[/dim] build [dim]│ │[/dim] logs  [dim]│[/dim]\n"
-                "[dim]└────────┴────┘ └───────┘ └───────┘ └───────┘ └───────┘[/dim]"
-            )
-        else:  # CUSTOM
-            return (
-                "[dim]┌────────────┐[/dim]\n"
-                "[dim]│[/dim]   editor   [dim]│[/dim]  [yellow]← Edit YAML after creation[/yellow]\n"
-                "[dim]└────────────┘[/dim]"
-            )
+        if (widget := self._preview_widget) is not None:
+            widget.update(self._PREVIEWS[preset])
 
     @on(OptionList.OptionSelected)
     def on_option_selected(self, event: OptionList.OptionSelected) -> None:
@@ -372,6 +394,9 @@ class LayoutStep(WizardStep):
 class AddWizard(ModalScreen):
     """Modal wizard for adding a new project."""
 
+    # Title/description rules shared with the settings screen
+    CSS_PATH = "_shared.tcss"
+
     CSS = """
     AddWizard {
         align: center middle;
@@ -451,6 +476,7 @@ class AddWizard(ModalScreen):
     _path: Path | None = None
     _group: str = "Uncategorized"
     _initial_path: str | None = None
+    _advance_pending: bool = False
 
     def __init__(
         self,
@@ -491,12 +517,9 @@ class AddWizard(ModalScreen):
         self._update_step_visibility()
         # Pre-fill path if provided
         if self._initial_path:
-            try:
-                path_step = self.query_one("#path-step", PathStep)
-                path_input = path_step.query_one("#path-input", Input)
-                path_input.value = self._initial_path
-            except Exception:
-                pass
+            path_step = self.query_one("#path-step", PathStep)
+            path_input = path_step.query_one("#path-input", Input)
+            path_input.value = self._initial_path
 
     def watch_current_step(self, step: int) -> None:
         """React to step changes."""
@@ -506,35 +529,28 @@ class AddWizard(ModalScreen):
         """Show/hide steps based on current step."""
         step = self.current_step
 
+        # Widgets may not be composed yet when the watcher first fires, so use
+        # queries (empty before compose) rather than query_one + exceptions.
+
         # Update step indicator
-        try:
-            indicator = self.query_one("#step-indicator", Static)
+        for indicator in self.query("#step-indicator").results(Static):
             indicator.update(f"Step {step} of 4")
-        except Exception:
-            pass
 
         # Show/hide steps and focus active step
         step_classes = [PathStep, GroupStep, TemplateStep, LayoutStep]
         step_ids = ["#path-step", "#group-step", "#template-step", "#layout-step"]
         for i, (step_id, step_class) in enumerate(zip(step_ids, step_classes, strict=False), 1):
-            try:
-                step_widget = self.query_one(step_id, step_class)
+            for step_widget in self.query(step_id).results(step_class):
                 step_widget.display = i == step
                 # Focus the active step's input
                 if i == step:
                     self.call_later(step_widget.focus_input)
-            except Exception:
-                pass
 
         # Update buttons
-        try:
-            back_btn = self.query_one("#back-btn", Button)
-            next_btn = self.query_one("#next-btn", Button)
-
+        for back_btn in self.query("#back-btn").results(Button):
             back_btn.disabled = step == 1
+        for next_btn in self.query("#next-btn").results(Button):
             next_btn.label = "Add Project" if step == 4 else "Next"
-        except Exception:
-            pass
 
     def _show_error(self, message: str) -> None:
         """Display an error message."""
@@ -628,19 +644,26 @@ class AddWizard(ModalScreen):
         """Handle escape key."""
         self.dismiss(None)
 
-    @on(Input.Submitted)
-    def on_input_submitted(self, event: Input.Submitted) -> None:
-        """Handle Enter key in any input field - advance to next step."""
+    def _request_advance(self) -> None:
+        """Advance to the next step once the current event has been handled.
+
+        Repeated Enter presses before the advance runs are ignored, so a burst
+        of key presses can't skip several steps at once.
+        """
+        if self._advance_pending:
+            return
+        self._advance_pending = True
+        # Let the step handlers update their values first, then advance
+        self.call_after_refresh(self._do_advance)
+
+    def _do_advance(self) -> None:
+        """Run a pending advance."""
+        self._advance_pending = False
         self.on_next()
 
+    @on(Input.Submitted)
     @on(OptionList.OptionSelected, "#template-list")
-    def on_template_list_selected(self, event: OptionList.OptionSelected) -> None:
-        """Handle Enter on template list - advance to next step."""
-        # Let the step handler update the value first, then advance
-        self.call_later(self.on_next)
-
     @on(OptionList.OptionSelected, "#layout-list")
-    def on_layout_list_selected(self, event: OptionList.OptionSelected) -> None:
-        """Handle Enter on layout list - add project."""
-        # Let the step handler update the value first, then add project
-        self.call_later(self.on_next)
+    def on_enter_pressed(self, event: Input.Submitted | OptionList.OptionSelected) -> None:
+        """Handle Enter in an input or the template/layout lists - advance."""
+        self._request_advance()
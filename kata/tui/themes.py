@@ -117,4 +117,7 @@ KATA_GLASS_LIGHT = Theme(
 )
 
 # All Kata themes
-KATA_THEMES = [KATA_DARK, KATA_LIGHT, KATA_OCEAN, KATA_WARM, KATA_GLASS, KATA_GLASS_LIGHT]
+KATA_THEMES = (KATA_DARK, KATA_LIGHT, KATA_OCEAN, KATA_WARM, KATA_GLASS, KATA_GLASS_LIGHT)
+
+# Theme lookup by name
+KATA_THEMES_BY_NAME = {theme.name: theme for theme in KATA_THEMES}
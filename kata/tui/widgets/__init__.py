@@ -1,10 +1,18 @@
-"""TUI widgets for Kata dashboard."""
+"""TUI widgets for Kata dashboard.
 
-from kata.tui.widgets.layout import LayoutDiagram
-from kata.tui.widgets.preview import PreviewPane
-from kata.tui.widgets.recents import RecentsPanel
-from kata.tui.widgets.status import StatusIndicator
-from kata.tui.widgets.tree import ProjectTree
+Widgets are imported lazily on first attribute access so that importing one
+widget doesn't pull in the dependencies of all the others.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from kata.tui.widgets.layout import LayoutDiagram
+    from kata.tui.widgets.preview import PreviewPane
+    from kata.tui.widgets.recents import RecentsPanel
+    from kata.tui.widgets.status import StatusIndicator
+    from kata.tui.widgets.tree import ProjectTree
 
 __all__ = [
     "StatusIndicator",
@@ -13,3 +21,28 @@ __all__ = [
     "PreviewPane",
     "LayoutDiagram",
 ]
+
+# Public name -> submodule that defines it
+_LAZY_IMPORTS = {
+    "StatusIndicator": "kata.tui.widgets.status",
+    "ProjectTree": "kata.tui.widgets.tree",
+    "RecentsPanel": "kata.tui.widgets.recents",
+    "PreviewPane": "kata.tui.widgets.preview",
+    "LayoutDiagram": "kata.tui.widgets.layout",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a widget on first access (PEP 562)."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # Cache so __getattr__ isn't hit again
+    return value
+
+
+def __dir__() -> list[str]:
+    """List public widgets for tab completion."""
+    return sorted(set(globals()) | set(__all__))
@@ -1,100 +1,133 @@
 """Layout diagram widget for displaying tmuxp window/pane structure."""
 
+import functools
 from dataclasses import dataclass
 from pathlib import Path
 
-import yaml
 from textual.reactive import reactive
 from textual.widget import Widget
 from textual.widgets import Static
 
 from kata.core.models import Project
 from kata.core.templates import get_template_path
+from kata.utils.safe_yaml import safe_loader
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PaneInfo:
     """Information about a tmux pane."""
 
-    commands: list[str]
+    commands: tuple[str, ...]
     layout: str = "single"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class WindowInfo:
     """Information about a tmux window."""
 
     name: str
-    panes: list[PaneInfo]
+    panes: tuple[PaneInfo, ...]
     layout: str = "tiled"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LayoutInfo:
-    """Parsed layout information from tmuxp config."""
+    """Parsed layout information from tmuxp config.
+
+    Frozen (with tuple fields) so layouts are hashable and rendered output can
+    be memoized.
+    """
 
     session_name: str
-    windows: list[WindowInfo]
+    windows: tuple[WindowInfo, ...]
     start_directory: str = ""
 
 
 def parse_tmuxp_config(config_path: Path) -> LayoutInfo | None:
     """Parse a tmuxp YAML config file.
 
+    Results are cached by path and modification time, so repeated calls for
+    an unchanged file skip re-reading and re-parsing the YAML.
+
     Args:
         config_path: Path to the tmuxp YAML config
 
     Returns:
         LayoutInfo with parsed structure, or None if parsing fails
     """
-    if not config_path.exists():
+    try:
+        mtime_ns = config_path.stat().st_mtime_ns
+    except OSError:
         return None
 
+    return _parse_tmuxp_config_cached(str(config_path), mtime_ns)
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_tmuxp_config_cached(config_path: str, mtime_ns: int) -> LayoutInfo | None:
+    """Parse a tmuxp YAML config file (cached by path and mtime).
+
+    Args:
+        config_path: Path to the tmuxp YAML config
+        mtime_ns: Modification time of the file, used only as part of the cache key
+
+    Returns:
+        LayoutInfo with parsed structure, or None if parsing fails
+    """
+    # Deferred: only needed once a config is actually parsed
+    import yaml
+
     try:
         with open(config_path, encoding="utf-8") as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=safe_loader())
 
         if not config or not isinstance(config, dict):
             return None
 
-        session_name = config.get("session_name", "unnamed")
-        start_directory = config.get("start_directory", "")
+        session_name = str(config.get("session_name", "unnamed"))
+        start_directory = str(config.get("start_directory", ""))
         windows = []
 
         for window_data in config.get("windows", []):
             if not isinstance(window_data, dict):
                 continue
 
-            window_name = window_data.get("window_name", "unnamed")
-            window_layout = window_data.get("layout", "tiled")
+            window_name = str(window_data.get("window_name", "unnamed"))
+            window_layout = str(window_data.get("layout", "tiled"))
             panes = []
 
             panes_data = window_data.get("panes", [])
             if isinstance(panes_data, list):
                 for pane_data in panes_data:
-                    commands = []
-                    if isinstance(pane_data, dict):
+                    commands: tuple[str, ...] = ()
+                    # Exact type checks first (the YAML loader only produces
+                    # plain dict/list/str); isinstance covers subclasses
+                    pane_type = type(pane_data)
+                    if pane_type is dict or isinstance(pane_data, dict):
                         shell_cmd = pane_data.get("shell_command", [])
-                        if isinstance(shell_cmd, list):
-                            commands = [c for c in shell_cmd if c and not c.strip().startswith("#")]
-                        elif isinstance(shell_cmd, str):
-                            if not shell_cmd.strip().startswith("#"):
-                                commands = [shell_cmd]
-                    elif isinstance(pane_data, str):
-                        if not pane_data.strip().startswith("#"):
-                            commands = [pane_data]
+                        cmd_type = type(shell_cmd)
+                        if cmd_type is list or isinstance(shell_cmd, list):
+                            commands = tuple(
+                                c for c in shell_cmd if c and not c.lstrip().startswith("#")
+                            )
+                        elif cmd_type is str or isinstance(shell_cmd, str):
+                            if not shell_cmd.lstrip().startswith("#"):
+                                commands = (shell_cmd,)
+                    elif pane_type is str or isinstance(pane_data, str):
+                        if not pane_data.lstrip().startswith("#"):
+                            commands = (pane_data,)
 
                     panes.append(PaneInfo(commands=commands))
 
             # Ensure at least one pane
             if not panes:
-                panes.append(PaneInfo(commands=[]))
+                panes.append(PaneInfo(commands=()))
 
-            windows.append(WindowInfo(name=window_name, panes=panes, layout=window_layout))
+            windows.append(WindowInfo(name=window_name, panes=tuple(panes), layout=window_layout))
 
         return LayoutInfo(
             session_name=session_name,
-            windows=windows,
+            windows=tuple(windows),
             start_directory=start_directory,
         )
 
@@ -102,6 +135,24 @@ def parse_tmuxp_config(config_path: Path) -> LayoutInfo | None:
         return None
 
 
+@functools.lru_cache(maxsize=32)
+def _top_border(inner_width: int) -> str:
+    """Top border of a window box."""
+    return "┌" + "─" * inner_width + "┐"
+
+
+@functools.lru_cache(maxsize=32)
+def _mid_border(inner_width: int) -> str:
+    """Separator line inside a window box."""
+    return "├" + "─" * inner_width + "┤"
+
+
+@functools.lru_cache(maxsize=32)
+def _bottom_border(inner_width: int) -> str:
+    """Bottom border of a window box."""
+    return "└" + "─" * inner_width + "┘"
+
+
 def render_window_diagram(window: WindowInfo, width: int = 30) -> list[str]:
     """Render a single window as ASCII art.
 
@@ -112,28 +163,26 @@ def render_window_diagram(window: WindowInfo, width: int = 30) -> list[str]:
     Returns:
         List of lines representing the window
     """
-    lines = []
     inner_width = width - 2
+    text_width = inner_width - 2
 
     # Window header
     title = f" {window.name} "
-    if len(title) > inner_width - 2:
+    if len(title) > text_width:
         title = title[: inner_width - 5] + "... "
-    padding = inner_width - len(title)
-    left_pad = padding // 2
-    right_pad = padding - left_pad
 
-    lines.append("┌" + "─" * inner_width + "┐")
-    lines.append("│" + " " * left_pad + title + " " * right_pad + "│")
-    lines.append("├" + "─" * inner_width + "┤")
+    lines = [
+        _top_border(inner_width),
+        f"│{title:^{inner_width}}│",
+        _mid_border(inner_width),
+    ]
 
     # Panes
     num_panes = len(window.panes)
     if num_panes == 1:
         # Single pane
-        pane = window.panes[0]
-        cmd_display = _get_command_display(pane.commands, inner_width - 2)
-        lines.append("│ " + cmd_display.ljust(inner_width - 2) + " │")
+        cmd_display = _get_command_display(window.panes[0].commands, text_width)
+        lines.append(f"│ {cmd_display:<{text_width}} │")
     elif num_panes == 2:
         # Two panes side by side or stacked based on layout
         half_width = (inner_width - 3) // 2
@@ -142,50 +191,49 @@ def render_window_diagram(window: WindowInfo, width: int = 30) -> list[str]:
 
         if window.layout in ("main-vertical", "even-horizontal"):
             # Side by side
-            lines.append("│ " + p1_cmd.ljust(half_width) + "│" + p2_cmd.ljust(half_width) + " │")
+            lines.append(f"│ {p1_cmd:<{half_width}}│{p2_cmd:<{half_width}} │")
         else:
             # Stacked
-            lines.append("│ " + p1_cmd.ljust(inner_width - 2) + " │")
-            lines.append("├" + "─" * inner_width + "┤")
-            lines.append("│ " + p2_cmd.ljust(inner_width - 2) + " │")
+            lines.append(f"│ {p1_cmd:<{text_width}} │")
+            lines.append(_mid_border(inner_width))
+            lines.append(f"│ {p2_cmd:<{text_width}} │")
     else:
         # Multiple panes - show count
         for i, pane in enumerate(window.panes[:3]):  # Show max 3
             cmd_display = _get_command_display(pane.commands, inner_width - 4)
-            lines.append(f"│ {i + 1}. {cmd_display.ljust(inner_width - 5)}│")
+            lines.append(f"│ {i + 1}. {cmd_display:<{inner_width - 5}}│")
 
         if num_panes > 3:
-            lines.append(f"│ ... +{num_panes - 3} more".ljust(inner_width) + " │")
+            more = f"│ ... +{num_panes - 3} more"
+            lines.append(f"{more:<{inner_width}} │")
 
-    lines.append("└" + "─" * inner_width + "┘")
+    lines.append(_bottom_border(inner_width))
 
     return lines
 
 
-def _get_command_display(commands: list[str], max_width: int) -> str:
+def _get_command_display(commands: tuple[str, ...], max_width: int) -> str:
     """Get display string for pane commands.
 
     Args:
-        commands: List of commands
+        commands: Pane commands
         max_width: Maximum display width
 
     Returns:
         Formatted command string
     """
-    if not commands:
-        return "[shell]"
-
     # Get first non-empty, non-comment command
-    for cmd in commands:
-        cmd = cmd.strip()
-        if cmd and not cmd.startswith("#"):
-            if len(cmd) > max_width:
-                return cmd[: max_width - 3] + "..."
-            return cmd
+    stripped = (c.strip() for c in commands)
+    cmd = next((c for c in stripped if c and c[0] != "#"), None)
+    if cmd is None:
+        return "[shell]"
 
-    return "[shell]"
+    if len(cmd) > max_width:
+        return cmd[: max_width - 3] + "..."
+    return cmd
 
 
+@functools.lru_cache(maxsize=256)
 def render_layout_diagram(layout: LayoutInfo, max_width: int = 40) -> str:
     """Render complete layout as ASCII diagram.
 
@@ -213,6 +261,7 @@ def render_layout_diagram(layout: LayoutInfo, max_width: int = 40) -> str:
     return "\n".join(lines)
 
 
+@functools.lru_cache(maxsize=256)
 def render_layout_summary(layout: LayoutInfo) -> str:
     """Render a compact layout summary with Rich markup.
 
@@ -276,6 +325,8 @@ class LayoutDiagram(Widget):
             classes: CSS classes
         """
         super().__init__(name=name, id=id, classes=classes)
+        # (project name, config mtime) of the last render, to skip redundant work
+        self._last_sig: tuple[str, int] | None = None
         self.project = project
 
     def compose(self):
@@ -299,10 +350,21 @@ class LayoutDiagram(Widget):
             return
 
         if self.project is None:
+            self._last_sig = None
             content_widget.update("[dim]Select a project to view layout[/dim]")
             return
 
         config_path = get_template_path(self.project)
+        try:
+            mtime_ns = config_path.stat().st_mtime_ns
+        except OSError:
+            mtime_ns = -1
+
+        sig = (self.project.name, mtime_ns)
+        if sig == self._last_sig:
+            return
+        self._last_sig = sig
+
         layout = parse_tmuxp_config(config_path)
 
         if layout is None:
@@ -1,20 +1,102 @@
 """Preview pane widget for displaying project details."""
 
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 from textual.reactive import reactive
 from textual.widget import Widget
 from textual.widgets import Static
 
-from kata.core.models import Project, SessionStatus
+from kata.core.models import Project, ProjectType, SessionStatus
 from kata.core.templates import get_template_path
 from kata.services.sessions import get_session_status
-from kata.tui.widgets.layout import parse_tmuxp_config, render_layout_summary
 from kata.utils.detection import detect_project_type
-from kata.utils.git import get_git_status
+from kata.utils.git import GitStatus, get_git_status
 from kata.utils.paths import sanitize_session_name
 from kata.utils.zoxide import ZoxideEntry
 
+# Project type icons (Nerd Font)
+PROJECT_TYPE_ICONS = {
+    "python": "󰌠",
+    "node": "󰎙",
+    "rust": "󱘗",
+    "go": "󰟓",
+    "ruby": "󰴭",
+    "generic": "󰉋",
+}
+
+# Icons keyed by detected type, with the generic icon as the fallback
+_GENERIC_ICON = PROJECT_TYPE_ICONS["generic"]
+_ICON_BY_TYPE = {t: PROJECT_TYPE_ICONS.get(t.value, _GENERIC_ICON) for t in ProjectType}
+
+# Session status -> (color, icon, label)
+STATUS_STYLES = {
+    "active": ("green", "◆", "running"),
+    "detached": ("yellow", "◆", "paused"),
+    "idle": ("dim", "◇", "idle"),
+}
+
+
+# Section separator
+DIVIDER = "[dim]─────────────────────────────[/dim]"
+
+
+def _format_git_line(git_status: GitStatus) -> str:
+    """Format the branch line of the info section (empty if not a git repo)."""
+    if not git_status.is_git_repo:
+        return ""
+
+    branch_display = git_status.branch or "unknown"
+    dirty = " [yellow]✱[/yellow]" if git_status.is_dirty else ""
+    sync_info = ""
+    if git_status.ahead > 0:
+        sync_info += f" [green]↑{git_status.ahead}[/green]"
+    if git_status.behind > 0:
+        sync_info += f" [red]↓{git_status.behind}[/red]"
+
+    return f"\n[dim]├─[/dim] [dim]branch[/dim]  [cyan]{branch_display}[/cyan]{dirty}{sync_info}"
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO-format timestamp (cached, as the same strings recur)."""
+    return datetime.fromisoformat(value)
+
+
+@functools.lru_cache(maxsize=128)
+def _sparkline(count: int, width: int = 10) -> str:
+    """Generate a sparkline bar showing activity level.
+
+    Memoized: the output depends only on the (small, bounded) inputs.
+
+    Args:
+        count: Number of times opened
+        width: Width of the sparkline in characters
+
+    Returns:
+        A colorized sparkline string
+    """
+    # Normalize count to a 0-width scale (cap at 50 opens for full bar)
+    max_count = 50
+    filled = min(count, max_count) * width // max_count
+
+    # Use block characters for the bar
+    blocks = "█" * filled + "░" * (width - filled)
+
+    # Color based on activity level
+    if count == 0:
+        return f"[dim]{blocks}[/dim]"
+    elif count < 5:
+        return f"[dim]{blocks}[/dim]"
+    elif count < 15:
+        return f"[cyan]{blocks}[/cyan]"
+    elif count < 30:
+        return f"[green]{blocks}[/green]"
+    else:
+        return f"[yellow]{blocks}[/yellow]"
+
 
 class PreviewPane(Widget):
     """Preview pane showing project details and stats."""
@@ -44,6 +126,28 @@ class PreviewPane(Widget):
 
     project: reactive[Project | None] = reactive(None)
 
+    # Markup skeleton for a registered project; only the fields vary
+    _PREVIEW_TEMPLATE = (
+        "[bold]{type_icon} {name}[/bold]\n"
+        "\n"
+        "[{color}]{icon} {text}[/{color}]\n"
+        "\n"
+        "[dim]├─[/dim] [dim]group[/dim]   {group}\n"
+        "[dim]├─[/dim] [dim]type[/dim]    {ptype}"
+        "{git_line}\n"
+        "[dim]└─[/dim] [dim]path[/dim]    [dim]{path}[/dim]\n"
+        "\n"
+        "{divider}\n"
+        "\n"
+        "  [dim]activity[/dim]  {sparkline}\n"
+        "  [dim]opened[/dim]    {opened}×\n"
+        "  [dim]last[/dim]      {last}"
+        "{layout_block}"
+    )
+
+    # Shared pool for running the independent status/type/git/layout lookups
+    _EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="kata-preview")
+
     def __init__(
         self,
         project: Project | None = None,
@@ -61,6 +165,10 @@ class PreviewPane(Widget):
             classes: CSS classes
         """
         super().__init__(name=name, id=id, classes=classes)
+        # Signature of the last rendered project, to skip redundant re-renders
+        self._last_sig: tuple[object, ...] | None = None
+        # Identifies the latest render, so lookups that finish late are dropped
+        self._render_token: object | None = None
         self.project = project
 
     def compose(self):
@@ -86,124 +194,96 @@ class PreviewPane(Widget):
             return
 
         if self.project is None:
+            self._last_sig = None
+            self._render_token = None
             self.add_class("-empty")
             content_widget.update("[dim]Select a project to view details[/dim]")
             return
 
-        self.remove_class("-empty")
         project = self.project
-
-        # Get status and type
-        status = get_session_status(sanitize_session_name(project.name))
-        project_type = detect_project_type(project.path)
-
-        # Get git status
-        git_status = get_git_status(project.path)
-
-        # Format dates
-        self._format_date(project.created_at)
-        last_opened = self._format_date(project.last_opened) if project.last_opened else "Never"
-
-        # Project type icons
-        type_icons = {
-            "python": "󰌠",
-            "node": "󰎙",
-            "rust": "󱘗",
-            "go": "󰟓",
-            "ruby": "󰴭",
-            "generic": "󰉋",
-        }
-        type_icon = type_icons.get(project_type.value, "󰉋")
-
-        # Status styling
-        status_styles = {
-            "active": ("green", "◆", "running"),
-            "detached": ("yellow", "◆", "paused"),
-            "idle": ("dim", "◇", "idle"),
-        }
-        status_color, status_icon, status_text = status_styles.get(
-            status.value, ("dim", "◇", "idle")
+        sig = (
+            id(project),
+            project.name,
+            project.path,
+            project.group,
+            project.last_opened,
+            project.times_opened,
         )
+        if sig == self._last_sig:
+            return
+        self._last_sig = sig
 
-        # Build header with icon
-        content = f"""[bold]{type_icon} {project.name}[/bold]
+        self.remove_class("-empty")
+        self._render_token = token = object()
+        self.run_worker(self._render_project(project, content_widget, token), group="preview")
 
-[{status_color}]{status_icon} {status_text}[/{status_color}]
-"""
+    async def _render_project(
+        self, project: Project, content_widget: Static, token: object
+    ) -> None:
+        """Look up a project's status, type, git status and layout, then render it.
 
-        # Info section with aligned labels
-        content += f"""
-[dim]├─[/dim] [dim]group[/dim]   {project.group.lower()}
-[dim]├─[/dim] [dim]type[/dim]    {project_type.value}"""
+        The lookups hit tmux and disk independently, so they run concurrently
+        in the pool while the event loop stays free for further cursor moves.
 
-        # Add git info if available
-        if git_status.is_git_repo:
-            branch_display = git_status.branch or "unknown"
-            dirty = " [yellow]✱[/yellow]" if git_status.is_dirty else ""
-            sync_info = ""
-            if git_status.ahead > 0:
-                sync_info += f" [green]↑{git_status.ahead}[/green]"
-            if git_status.behind > 0:
-                sync_info += f" [red]↓{git_status.behind}[/red]"
+        Args:
+            project: Project to render
+            content_widget: Static to render into
+            token: Render token; the result is dropped if a newer render started
+        """
+        # Deferred so importing the preview doesn't load the layout parser
+        from kata.tui.widgets.layout import parse_tmuxp_config, render_layout_summary
+
+        loop = asyncio.get_running_loop()
+        executor = self._EXECUTOR
+        status, project_type, git_status, layout = await asyncio.gather(
+            loop.run_in_executor(executor, get_session_status, sanitize_session_name(project.name)),
+            loop.run_in_executor(executor, detect_project_type, project.path),
+            loop.run_in_executor(executor, get_git_status, project.path),
+            loop.run_in_executor(executor, parse_tmuxp_config, get_template_path(project)),
+        )
+        if token is not self._render_token:
+            return
 
-            content += f"\n[dim]├─[/dim] [dim]branch[/dim]  [cyan]{branch_display}[/cyan]{dirty}{sync_info}"
+        # Format dates
+        last_opened = (
+            self._format_date(project.last_opened, datetime.now())
+            if project.last_opened
+            else "Never"
+        )
 
-        content += f"\n[dim]└─[/dim] [dim]path[/dim]    [dim]{project.path}[/dim]"
+        type_icon = _ICON_BY_TYPE.get(project_type, _GENERIC_ICON)
+        status_color, status_icon, status_text = STATUS_STYLES.get(
+            status.value, STATUS_STYLES["idle"]
+        )
 
         # Activity sparkline (visual representation of usage)
-        sparkline = self._generate_sparkline(project.times_opened)
-
-        # Stats section
-        content += f"""
-
-[dim]─────────────────────────────[/dim]
-
-  [dim]activity[/dim]  {sparkline}
-  [dim]opened[/dim]    {project.times_opened}×
-  [dim]last[/dim]      {last_opened}"""
-
-        # Add layout summary
-        config_path = get_template_path(project)
-        layout = parse_tmuxp_config(config_path)
-        if layout:
-            layout_summary = render_layout_summary(layout)
-            content += f"""
+        sparkline = _sparkline(project.times_opened)
 
-[dim]─────────────────────────────[/dim]
-
-[dim]{layout_summary}[/dim]"""
+        # Layout summary (optional trailing section)
+        layout_block = (
+            f"\n\n{DIVIDER}\n\n[dim]{render_layout_summary(layout)}[/dim]" if layout else ""
+        )
 
+        content = self._PREVIEW_TEMPLATE.format_map(
+            {
+                "type_icon": type_icon,
+                "name": project.name,
+                "color": status_color,
+                "icon": status_icon,
+                "text": status_text,
+                "group": project.group.lower(),
+                "ptype": project_type.value,
+                "git_line": _format_git_line(git_status),
+                "path": project.path,
+                "divider": DIVIDER,
+                "sparkline": sparkline,
+                "opened": project.times_opened,
+                "last": last_opened,
+                "layout_block": layout_block,
+            }
+        )
         content_widget.update(content)
 
-    def _generate_sparkline(self, count: int, width: int = 10) -> str:
-        """Generate a sparkline bar showing activity level.
-
-        Args:
-            count: Number of times opened
-            width: Width of the sparkline in characters
-
-        Returns:
-            A colorized sparkline string
-        """
-        # Normalize count to a 0-width scale (cap at 50 opens for full bar)
-        max_count = 50
-        filled = min(count, max_count) * width // max_count
-
-        # Use block characters for the bar
-        blocks = "█" * filled + "░" * (width - filled)
-
-        # Color based on activity level
-        if count == 0:
-            return f"[dim]{blocks}[/dim]"
-        elif count < 5:
-            return f"[dim]{blocks}[/dim]"
-        elif count < 15:
-            return f"[cyan]{blocks}[/cyan]"
-        elif count < 30:
-            return f"[green]{blocks}[/green]"
-        else:
-            return f"[yellow]{blocks}[/yellow]"
-
     def _get_status_indicator(self, status: SessionStatus) -> str:
         """Get the status indicator for a session status."""
         indicators = {
@@ -213,8 +293,13 @@ class PreviewPane(Widget):
         }
         return indicators.get(status, "[dim]◇[/dim]")
 
-    def _format_date(self, date_val: str | datetime | None) -> str:
-        """Format a date string or datetime for display."""
+    def _format_date(self, date_val: str | datetime | None, now: datetime | None = None) -> str:
+        """Format a date string or datetime for display.
+
+        Args:
+            date_val: Date to format
+            now: Reference time, so callers formatting several dates can share one
+        """
         if not date_val:
             return "Unknown"
 
@@ -223,9 +308,10 @@ class PreviewPane(Widget):
             if isinstance(date_val, datetime):
                 dt = date_val
             else:
-                dt = datetime.fromisoformat(str(date_val))
+                dt = _parse_iso(str(date_val))
 
-            now = datetime.now()
+            if now is None:
+                now = datetime.now()
             diff = now - dt
 
             if diff.days == 0:
@@ -252,11 +338,12 @@ class PreviewPane(Widget):
             project: Project to display, or None to show empty state
         """
         self.project = project
-        # Force immediate update
+        # Start the update now; the lookups finish in a worker
         self._update_content()
 
     def refresh_status(self) -> None:
         """Refresh the status display for current project."""
+        self._last_sig = None
         self._update_content()
 
     def update_zoxide(self, entry: ZoxideEntry) -> None:
@@ -266,6 +353,7 @@ class PreviewPane(Widget):
             entry: Zoxide entry to display
         """
         self.project = None  # Clear project
+        self._last_sig = None
         self.remove_class("-empty")
 
         try:
@@ -273,56 +361,40 @@ class PreviewPane(Widget):
         except Exception:
             return
 
-        # Get project type for the directory
-        project_type = detect_project_type(entry.path)
-
-        # Get git status
-        git_status = get_git_status(entry.path)
+        self._render_token = token = object()
+        self.run_worker(self._render_zoxide(entry, content_widget, token), group="preview")
 
-        # Project type icons
-        type_icons = {
-            "python": "󰌠",
-            "node": "󰎙",
-            "rust": "󱘗",
-            "go": "󰟓",
-            "ruby": "󰴭",
-            "generic": "󰉋",
-        }
-        type_icons.get(project_type.value, "󰉋")
-
-        # Build content
-        content = f"""[bold][yellow]󰉋[/yellow] {entry.name}[/bold]
-
-[dim]◇ not registered[/dim]
-"""
-
-        # Info section
-        content += f"""
-[dim]├─[/dim] [dim]type[/dim]    {project_type.value}"""
-
-        # Add git info if available
-        if git_status.is_git_repo:
-            branch_display = git_status.branch or "unknown"
-            dirty = " [yellow]✱[/yellow]" if git_status.is_dirty else ""
-            sync_info = ""
-            if git_status.ahead > 0:
-                sync_info += f" [green]↑{git_status.ahead}[/green]"
-            if git_status.behind > 0:
-                sync_info += f" [red]↓{git_status.behind}[/red]"
-
-            content += f"\n[dim]├─[/dim] [dim]branch[/dim]  [cyan]{branch_display}[/cyan]{dirty}{sync_info}"
-
-        content += f"\n[dim]└─[/dim] [dim]path[/dim]    [dim]{entry.path}[/dim]"
-
-        # Zoxide score
-        content += f"""
-
-[dim]─────────────────────────────[/dim]
-
-  [dim]zoxide score[/dim]  {entry.score:.1f}
-
-[dim]─────────────────────────────[/dim]
+    async def _render_zoxide(
+        self, entry: ZoxideEntry, content_widget: Static, token: object
+    ) -> None:
+        """Look up a zoxide entry's project type and git status, then render it.
 
-[dim]Press [/dim][bold]a[/bold][dim] to add as project[/dim]"""
+        Args:
+            entry: Zoxide entry to render
+            content_widget: Static to render into
+            token: Render token; the result is dropped if a newer render started
+        """
+        # Get project type and git status concurrently
+        loop = asyncio.get_running_loop()
+        project_type, git_status = await asyncio.gather(
+            loop.run_in_executor(self._EXECUTOR, detect_project_type, entry.path),
+            loop.run_in_executor(self._EXECUTOR, get_git_status, entry.path),
+        )
+        if token is not self._render_token:
+            return
 
-        content_widget.update(content)
+        parts = [
+            f"[bold][yellow]󰉋[/yellow] {entry.name}[/bold]\n\n",
+            "[dim]◇ not registered[/dim]\n",
+            # Info section
+            f"\n[dim]├─[/dim] [dim]type[/dim]    {project_type.value}",
+            _format_git_line(git_status),
+            f"\n[dim]└─[/dim] [dim]path[/dim]    [dim]{entry.path}[/dim]",
+            # Zoxide score
+            f"\n\n{DIVIDER}\n\n",
+            f"  [dim]zoxide score[/dim]  {entry.score:.1f}\n\n",
+            f"{DIVIDER}\n\n",
+            "[dim]Press [/dim][bold]a[/bold][dim] to add as project[/dim]",
+        ]
+
+        content_widget.update("".join(parts))
@@ -1,14 +1,21 @@
 """Recents panel widget for displaying zoxide entries."""
 
+import asyncio
+import functools
 import os
+import re
+from collections.abc import Sequence
 
 from textual.binding import Binding
 from textual.message import Message
+from textual.timer import Timer
 from textual.widget import Widget
 from textual.widgets import OptionList, Static
 from textual.widgets.option_list import Option
 
+from kata.core.models import ProjectType
 from kata.services.registry import get_registry
+from kata.tui.widgets.preview import PreviewPane
 from kata.utils.detection import detect_project_type
 from kata.utils.zoxide import ZoxideEntry, is_zoxide_available, query_zoxide
 
@@ -22,6 +29,53 @@ PROJECT_TYPE_ICONS = {
     "generic": "󰉋",
 }
 
+# Icons keyed by detected type, with the generic icon as the fallback
+_GENERIC_ICON = PROJECT_TYPE_ICONS["generic"]
+_ICON_BY_TYPE = {t: PROJECT_TYPE_ICONS.get(t.value, _GENERIC_ICON) for t in ProjectType}
+
+# Home directory, resolved once for shortening displayed paths
+_HOME = os.path.expanduser("~")
+
+# Option label: icon, name, shortened path
+_LABEL = "[yellow]{}[/yellow] {}  [dim]{}[/dim]"
+
+# (registry version, registered project paths) of the last lookup
+_registered_paths_cache: tuple[int, set[str]] = (-1, set())
+
+
+def _get_registered_paths() -> set[str]:
+    """Return registered project paths, recomputing only when the registry changed."""
+    global _registered_paths_cache
+    registry = get_registry()
+    version = registry.version
+    if _registered_paths_cache[0] != version:
+        _registered_paths_cache = (version, {p.path for p in registry.list_all()})
+    return _registered_paths_cache[1]
+
+
+def _format_label(entry: ZoxideEntry) -> str:
+    """Format the option label for a zoxide entry: icon, name, shortened path."""
+    type_icon = _ICON_BY_TYPE.get(detect_project_type(entry.path), _GENERIC_ICON)
+
+    # Shorten path for display (show ~/ for home)
+    rest = entry.path.removeprefix(_HOME)
+    display_path = "~" + rest if rest != entry.path else entry.path
+
+    return _LABEL.format(type_icon, entry.name, display_path)
+
+
+@functools.lru_cache(maxsize=64)
+def _fuzzy_pattern(query: str) -> re.Pattern[str]:
+    """Compile a regex matching targets that contain query's characters in order.
+
+    Each character is matched as ``[^c]*c`` from the start of the target, so
+    the C regex engine finds the leftmost subsequence without backtracking.
+    """
+    return re.compile(
+        "".join(f"[^{re.escape(c)}]*{re.escape(c)}" for c in query),
+        re.DOTALL,
+    )
+
 
 class RecentsPanel(Widget, can_focus=True):
     """Panel showing recent directories from zoxide."""
@@ -71,6 +125,9 @@ class RecentsPanel(Widget, can_focus=True):
         Binding("a", "add_selected", "Add", show=False),
     ]
 
+    # Quiet period before a filter query re-renders the list
+    FILTER_DEBOUNCE = 0.05
+
     class RecentSelected(Message, bubble=True):
         """Message sent when a recent entry is selected."""
 
@@ -103,6 +160,22 @@ class RecentsPanel(Widget, can_focus=True):
         super().__init__(name=name, id=id, classes=classes)
         self._entries: list[ZoxideEntry] = []
         self._all_entries: list[ZoxideEntry] = []
+        # Lowercased names, index-parallel with _all_entries
+        self._names_lower: list[str] = []
+        # Rendered option labels, index-parallel with _all_entries
+        self._labels: list[str] = []
+        # Longest name and all characters used in names, to reject queries early
+        self._max_name_len = 0
+        self._name_chars: frozenset[str] = frozenset()
+        # Last applied query and the indices it matched, for narrowing
+        self._last_query = ""
+        self._match_indices: list[int] = []
+        self._filter_timer: Timer | None = None
+        # Entry paths currently rendered as options (None if showing a placeholder)
+        self._option_ids: list[str] | None = None
+        self._option_list: OptionList | None = None
+        self._preview_cache: PreviewPane | None = None
+        self._pending_query = ""
 
     def compose(self):
         """Compose the widget."""
@@ -112,89 +185,160 @@ class RecentsPanel(Widget, can_focus=True):
         )
         yield OptionList(id="recents-list")
 
+    def _get_option_list(self) -> OptionList:
+        """Return the recents option list, looked up once and then reused."""
+        if self._option_list is None:
+            self._option_list = self.query_one("#recents-list", OptionList)
+        return self._option_list
+
+    def _get_preview(self) -> PreviewPane:
+        """Return the app's preview pane, looked up once and then reused."""
+        if self._preview_cache is None:
+            self._preview_cache = self.app.query_one(PreviewPane)
+        return self._preview_cache
+
     def on_mount(self) -> None:
         """Load recents on mount."""
-        self.refresh_recents()
+        self._preview_cache = None
+        self.run_worker(self.refresh_recents(), exclusive=True)
+
+    async def refresh_recents(self) -> None:
+        """Refresh the recents list from zoxide.
 
-    def refresh_recents(self) -> None:
-        """Refresh the recents list from zoxide."""
-        option_list = self.query_one("#recents-list", OptionList)
+        The zoxide query runs in a thread so the subprocess call doesn't block
+        the UI; a placeholder is shown until it returns, and any filter typed
+        meanwhile is applied once the entries arrive.
+        """
+        option_list = self._get_option_list()
         option_list.clear_options()
+        self._option_ids = None
         self._entries.clear()
         self._all_entries.clear()
+        self._names_lower = []
+        self._labels = []
+        self._max_name_len = 0
+        self._name_chars = frozenset()
+        self._last_query = ""
 
         if not is_zoxide_available():
             option_list.add_option(Option("[dim]zoxide not available[/dim]", disabled=True))
             return
 
-        # Get registered project paths to exclude
-        registry = get_registry()
-        registered_paths = {p.path for p in registry.list_all()}
+        option_list.add_option(Option("[dim]Loading…[/dim]", disabled=True))
 
-        # Query zoxide entries
-        entries = query_zoxide(limit=50, exclude_paths=registered_paths)
+        # Query zoxide entries, excluding registered project paths
+        registered_paths = _get_registered_paths()
+        entries = await asyncio.to_thread(query_zoxide, limit=50, exclude_paths=registered_paths)
 
+        option_list.clear_options()
         if not entries:
             option_list.add_option(Option("[dim]No recent directories[/dim]", disabled=True))
             return
 
         self._all_entries = entries
+        self._names_lower = [e.name.lower() for e in entries]
+        self._labels = [_format_label(e) for e in entries]
+        self._max_name_len = max(map(len, self._names_lower))
+        self._name_chars = frozenset("".join(self._names_lower))
         self._entries = entries
 
-        self._render_entries(entries)
+        # A filter typed while loading matched against no entries; apply it now
+        if self._pending_query:
+            self._last_query = ""
+            self._apply_filter()
+            return
 
-    def _render_entries(self, entries: list[ZoxideEntry]) -> None:
-        """Render entries to the option list."""
-        option_list = self.query_one("#recents-list", OptionList)
-        option_list.clear_options()
+        self._render_entries(range(len(entries)))
+
+    def _render_entries(self, indices: Sequence[int]) -> None:
+        """Render entries to the option list.
+
+        Options shared with the previous render as a leading run are kept and
+        only the differing tail is replaced, so narrowing a filter doesn't
+        rebuild the whole list.
+
+        Args:
+            indices: Positions in _all_entries of the entries to show, in order
+        """
+        option_list = self._get_option_list()
+        all_entries = self._all_entries
+        entries = [all_entries[i] for i in indices]
         self._entries = entries
 
         if not entries:
+            option_list.clear_options()
+            self._option_ids = None
             option_list.add_option(Option("[dim]No matches[/dim]", disabled=True))
             return
 
-        home = os.path.expanduser("~")
-
-        for entry in entries:
-            project_type = detect_project_type(entry.path)
-            type_icon = PROJECT_TYPE_ICONS.get(project_type.value, PROJECT_TYPE_ICONS["generic"])
-
-            # Shorten path for display (show ~/ for home)
-            display_path = entry.path
-            if display_path.startswith(home):
-                display_path = "~" + display_path[len(home) :]
-
-            # Format: icon name path
-            label = f"[yellow]{type_icon}[/yellow] {entry.name}  [dim]{display_path}[/dim]"
-            option_list.add_option(Option(label, id=entry.path))
+        new_ids = [entry.path for entry in entries]
+        old_ids = self._option_ids
+        keep = 0
+        if old_ids is not None:
+            for old_id, new_id in zip(old_ids, new_ids, strict=False):
+                if old_id != new_id:
+                    break
+                keep += 1
+
+        stale = len(old_ids) - keep if old_ids is not None else 0
+        if old_ids is None or stale > keep:
+            # Nothing (or little) worth keeping: rebuild from scratch
+            option_list.clear_options()
+            keep = 0
+        else:
+            # Drop the stale tail from the end so indices stay valid
+            for index in range(len(old_ids) - 1, keep - 1, -1):
+                option_list.remove_option_at_index(index)
+
+        labels = self._labels
+        # Added in one batch so the list is rebuilt once
+        option_list.add_options([Option(labels[i], id=all_entries[i].path) for i in indices[keep:]])
+
+        self._option_ids = new_ids
 
     def filter_recents(self, query: str) -> None:
         """Filter recents by search query.
 
+        Filtering is debounced so that rapid typing coalesces into a single
+        re-render of the option list.
+
         Args:
             query: Search query to filter by (fuzzy match on name)
         """
+        self._pending_query = query
+        if self._filter_timer is not None:
+            self._filter_timer.stop()
+        self._filter_timer = self.set_timer(self.FILTER_DEBOUNCE, self._apply_filter)
+
+    def _apply_filter(self) -> None:
+        """Filter and render entries for the last requested query."""
+        self._filter_timer = None
+        query = self._pending_query.lower()
         if not query:
-            self._render_entries(self._all_entries)
+            self._last_query = ""
+            self._render_entries(range(len(self._all_entries)))
             return
 
-        query_lower = query.lower()
-        filtered = [e for e in self._all_entries if self._fuzzy_match(query_lower, e.name.lower())]
-        self._render_entries(filtered)
+        names = self._names_lower
+        if len(query) > self._max_name_len or not self._name_chars.issuperset(query):
+            # Longer than every name, or uses a character no name has
+            candidates: Sequence[int] = ()
+        elif self._last_query and query.startswith(self._last_query):
+            # Extending the previous query can only narrow its matches, so
+            # rescan just those; anything else (e.g. backspace) starts over
+            candidates = self._match_indices
+        else:
+            candidates = range(len(names))
 
-    def _fuzzy_match(self, query: str, target: str) -> bool:
-        """Check if query fuzzy matches target."""
-        if not query:
-            return True
-        query_idx = 0
-        for char in target:
-            if query_idx < len(query) and char == query[query_idx]:
-                query_idx += 1
-        return query_idx == len(query)
+        match = _fuzzy_pattern(query).match
+        self._match_indices = [i for i in candidates if match(names[i])]
+        self._last_query = query
+
+        self._render_entries(self._match_indices)
 
     def get_selected_entry(self) -> ZoxideEntry | None:
         """Get the currently selected zoxide entry."""
-        option_list = self.query_one("#recents-list", OptionList)
+        option_list = self._get_option_list()
         idx = option_list.highlighted
         if idx is not None and 0 <= idx < len(self._entries):
             return self._entries[idx]
@@ -213,17 +357,18 @@ class RecentsPanel(Widget, can_focus=True):
             self.post_message(self.RecentHighlighted(entry))
             # Update preview pane
             try:
-                from kata.tui.widgets.preview import PreviewPane
-
-                preview = self.app.query_one(PreviewPane)
-                preview.update_zoxide(entry)
+                self._get_preview().update_zoxide(entry)
             except Exception:
                 pass
 
+    def on_unmount(self) -> None:
+        """Drop the cached preview pane reference."""
+        self._preview_cache = None
+
     def focus_list(self) -> None:
         """Focus the option list for keyboard navigation."""
         try:
-            option_list = self.query_one("#recents-list", OptionList)
+            option_list = self._get_option_list()
             option_list.focus()
         except Exception:
             pass
@@ -6,6 +6,20 @@ from textual.widgets import Static
 
 from kata.core.models import SessionStatus
 
+# Indicator character per session status
+STATUS_INDICATORS = {
+    SessionStatus.ACTIVE: "◆",
+    SessionStatus.DETACHED: "◆",
+    SessionStatus.IDLE: "◇",
+}
+
+# CSS class per session status
+STATUS_CLASSES = {
+    SessionStatus.ACTIVE: "status-active",
+    SessionStatus.DETACHED: "status-detached",
+    SessionStatus.IDLE: "status-idle",
+}
+
 
 class StatusIndicator(Widget):
     """Widget showing session status with colored indicator."""
@@ -56,21 +70,11 @@ class StatusIndicator(Widget):
 
     def _get_indicator(self) -> str:
         """Get the indicator character for current status."""
-        indicators = {
-            SessionStatus.ACTIVE: "◆",
-            SessionStatus.DETACHED: "◆",
-            SessionStatus.IDLE: "◇",
-        }
-        return indicators.get(self.status, "◇")
+        return STATUS_INDICATORS.get(self.status, "◇")
 
     def _get_class(self) -> str:
         """Get the CSS class for current status."""
-        classes = {
-            SessionStatus.ACTIVE: "status-active",
-            SessionStatus.DETACHED: "status-detached",
-            SessionStatus.IDLE: "status-idle",
-        }
-        return classes.get(self.status, "status-idle")
+        return STATUS_CLASSES.get(self.status, "status-idle")
 
     def watch_status(self, new_status: SessionStatus) -> None:
         """React to status changes."""
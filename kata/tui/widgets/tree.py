@@ -1,18 +1,26 @@
 """Tree view widget for grouped projects."""
 
+import asyncio
+import functools
 import json
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 
 from textual.message import Message
 from textual.reactive import reactive
+from textual.timer import Timer
 from textual.widget import Widget
 from textual.widgets import Tree
+from textual.widgets.tree import TreeNode
 
 from kata.core.config import KATA_CONFIG_DIR
-from kata.core.models import Project, SessionStatus
+from kata.core.models import Project, ProjectType, SessionStatus
 from kata.services.registry import get_registry
 from kata.services.sessions import get_all_session_statuses
+from kata.utils.cache import StatusEntry, load_status_cache, lookup_status, save_status_cache
 from kata.utils.detection import detect_project_type
-from kata.utils.git import format_git_indicator_rich, get_git_status
+from kata.utils.git import GitStatus, format_git_indicator_rich
 from kata.utils.zoxide import ZoxideEntry
 
 # Project type icons (Nerd Font)
@@ -25,6 +33,10 @@ PROJECT_TYPE_ICONS = {
     "generic": "󰉋",
 }
 
+# Icons keyed by detected type, with the generic icon as the fallback
+_GENERIC_ICON = PROJECT_TYPE_ICONS["generic"]
+_ICON_BY_TYPE = {t: PROJECT_TYPE_ICONS.get(t.value, _GENERIC_ICON) for t in ProjectType}
+
 # Group icons
 GROUP_ICONS = {
     "dev": "󰛓",
@@ -34,10 +46,89 @@ GROUP_ICONS = {
     "default": "󰉋",
 }
 
+# Shown in place of the git indicator until the project's group is expanded
+GIT_PENDING = "[dim]…[/dim]"
+
 # File to persist expanded state
 TREE_STATE_FILE = KATA_CONFIG_DIR / "tree_state.json"
 
 
+# Project types and git statuses by name, with the status entries read, by path
+_LookupResult = tuple[dict[str, ProjectType], dict[str, GitStatus], dict[str, StatusEntry]]
+
+# Filter matches by group, with session statuses and the lookups for the matches
+_FilterResult = tuple[dict[str, list[Project]], dict[str, SessionStatus], _LookupResult]
+
+
+@dataclass(slots=True)
+class GroupData:
+    """Data attached to a group node."""
+
+    name: str
+
+
+@dataclass(slots=True)
+class ProjectData:
+    """Data attached to a project leaf."""
+
+    project: Project
+    label: str
+    # Label without the git indicator, kept until git status is loaded
+    base_label: str | None = None
+    needs_git: bool = False
+
+
+@dataclass(slots=True)
+class ZoxideData:
+    """Data attached to a zoxide entry leaf."""
+
+    entry: ZoxideEntry
+
+
+# Data attached to any node of the project tree
+_NodeData = GroupData | ProjectData | ZoxideData
+
+
+def _tree_structure(groups: dict[str, list[Project]]) -> tuple[tuple[str, tuple[str, ...]], ...]:
+    """Describe the tree layout: each group name with its project names, in order."""
+    return tuple((name, tuple(p.name for p in group)) for name, group in groups.items())
+
+
+@functools.lru_cache(maxsize=64)
+def _fuzzy_pattern(query: str) -> re.Pattern[str]:
+    """Compile a regex matching targets that contain query's characters in order.
+
+    Each character is matched as ``[^c]*c`` from the start of the target, so
+    the C regex engine finds the leftmost subsequence without backtracking.
+    """
+    return re.compile(
+        "".join(f"[^{re.escape(c)}]*{re.escape(c)}" for c in query),
+        re.DOTALL,
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _label_body(shortcut: int | None, project_type: ProjectType, name: str) -> str:
+    """Build the status-independent part of a project label: shortcut, type icon, name.
+
+    Cached by its inputs, so refreshes only format the indicator and git suffix.
+    """
+    type_icon = _ICON_BY_TYPE.get(project_type, _GENERIC_ICON)
+
+    # Shortcut prefix if assigned
+    shortcut_prefix = f"[cyan][{shortcut}][/cyan] " if shortcut else ""
+
+    return f"{shortcut_prefix}{type_icon} {name}"
+
+
+def _with_git_indicator(base_label: str, git_status: GitStatus) -> str:
+    """Append the git indicator (if any) to a project label."""
+    git_indicator = format_git_indicator_rich(git_status)
+    if git_indicator:
+        return f"{base_label} [dim]{git_indicator}[/dim]"
+    return base_label
+
+
 class ProjectTree(Widget):
     """Tree view for displaying projects grouped by category."""
 
@@ -99,6 +190,15 @@ class ProjectTree(Widget):
             super().__init__()
             self.entry = entry
 
+    # Shared pool for the per-project type/git lookups, which wait on disk and git
+    _EXECUTOR = ThreadPoolExecutor(max_workers=16, thread_name_prefix="kata-tree")
+
+    # Quiet period before expanded group state is written to disk
+    SAVE_STATE_DELAY = 0.3
+
+    # Quiet period before a filter query rebuilds the tree
+    FILTER_DEBOUNCE = 0.12
+
     # Track expanded groups
     _expanded_groups: reactive[set[str]] = reactive(set, init=False)
 
@@ -112,6 +212,17 @@ class ProjectTree(Widget):
         """Initialize the project tree."""
         super().__init__(name=name, id=id, classes=classes)
         self._projects_by_name: dict[str, Project] = {}
+        self._save_timer: Timer | None = None
+        self._filter_timer: Timer | None = None
+        self._pending_query = ""
+        # Project leaves by name, and the (group, project names) layout they were
+        # built for, so refreshes that don't change the layout can relabel in place
+        self._project_nodes: dict[str, TreeNode[_NodeData]] = {}
+        self._tree_structure: tuple[tuple[str, tuple[str, ...]], ...] | None = None
+        # (registry version, projects by group) with groups and projects sorted by name
+        self._groups_cache: tuple[int, dict[str, list[Project]]] = (-1, {})
+        # Last known status per project path, persisted so startup can skip git
+        self._status_cache: dict[str, StatusEntry] = load_status_cache()
         self._load_expanded_state()
 
     def compose(self):
@@ -130,54 +241,198 @@ class ProjectTree(Widget):
     def _build_tree_initial(self) -> None:
         """Build initial tree structure (status will be updated separately)."""
         tree = self.query_one("#project-tree", Tree)
-        tree.clear()
 
         registry = get_registry()
         projects = registry.list_all()
+        groups = self._get_groups()
+
+        # Reuse statuses saved by the last session where the project is unchanged;
+        # the periodic refresh re-reads everything shortly after startup
+        cached = {
+            p.name: entry
+            for p in projects
+            if (entry := self._status_cache.get(p.path)) is not None and entry.is_fresh(p.path)
+        }
+        project_types, git_statuses, entries = self._lookup_projects(
+            [p for p in projects if p.name not in cached],
+            [
+                p
+                for name, group in groups.items()
+                if name in self._expanded_groups
+                for p in group
+                if p.name not in cached
+            ],
+        )
+        self._status_cache.update(entries)
+        for name, entry in cached.items():
+            project_types[name] = entry.project_type
+            git_statuses[name] = entry.git_status
 
-        # Group projects by group name
-        groups: dict[str, list[Project]] = {}
-        for project in projects:
-            group_name = project.group or "Uncategorized"
-            if group_name not in groups:
-                groups[group_name] = []
-            groups[group_name].append(project)
+        tree.clear()
+        self._project_nodes.clear()
+        self._tree_structure = _tree_structure(groups)
 
-        # Sort groups and projects - use IDLE status initially
+        # Groups and projects come sorted - use IDLE status initially
         self._projects_by_name.clear()
-        for group_name in sorted(groups.keys()):
+        for group_name, group_projects in groups.items():
             group_key = group_name.lower()
             group_icon = GROUP_ICONS.get(group_key, GROUP_ICONS["default"])
             group_label = f"[dim]{group_icon} {group_name.lower()}[/dim]"
 
             group_node = tree.root.add(group_label, expand=group_name in self._expanded_groups)
-            group_node.data = {"type": "group", "name": group_name}
+            group_node.data = GroupData(group_name)
 
-            for project in sorted(groups[group_name], key=lambda p: p.name):
+            for project in group_projects:
                 # Use IDLE status initially - will be updated by refresh
                 indicator = self._get_status_indicator(SessionStatus.IDLE)
 
-                project_type = detect_project_type(project.path)
-                type_icon = PROJECT_TYPE_ICONS.get(
-                    project_type.value, PROJECT_TYPE_ICONS["generic"]
+                self._add_project_node(
+                    group_node,
+                    project,
+                    indicator,
+                    project_types[project.name],
+                    git_statuses.get(project.name),
                 )
+                self._projects_by_name[project.name] = project
 
-                git_status = get_git_status(project.path)
-                git_indicator = format_git_indicator_rich(git_status)
+        tree.root.expand()
 
-                # Shortcut prefix if assigned
-                shortcut_prefix = f"[cyan][{project.shortcut}][/cyan] " if project.shortcut else ""
+    def _get_groups(self) -> dict[str, list[Project]]:
+        """Return registered projects by group, with groups and projects sorted by name.
 
-                if git_indicator:
-                    label = f"{indicator} {shortcut_prefix}{type_icon} {project.name} [dim]{git_indicator}[/dim]"
-                else:
-                    label = f"{indicator} {shortcut_prefix}{type_icon} {project.name}"
+        Regrouped only when the registry version changes; callers must not
+        modify the result.
+        """
+        registry = get_registry()
+        version = registry.version
+        if self._groups_cache[0] != version:
+            groups: dict[str, list[Project]] = {}
+            for project in sorted(registry.list_all(), key=lambda p: p.name):
+                group_name = project.group or "Uncategorized"
+                if group_name not in groups:
+                    groups[group_name] = []
+                groups[group_name].append(project)
+            self._groups_cache = (version, {name: groups[name] for name in sorted(groups)})
+        return self._groups_cache[1]
 
-                project_node = group_node.add_leaf(label)
-                project_node.data = {"type": "project", "project": project}
-                self._projects_by_name[project.name] = project
+    def _lookup_projects(
+        self, projects: list[Project], git_projects: list[Project]
+    ) -> _LookupResult:
+        """Detect project types and git statuses concurrently.
 
-        tree.root.expand()
+        Git status is only looked up for projects that will be visible (those
+        in expanded groups); the rest are loaded when their group is expanded.
+        Widget state is left untouched, so this is safe to call from a thread;
+        callers merge the returned entries into the status cache.
+
+        Args:
+            projects: Projects to detect the type of
+            git_projects: Projects to get git status for
+
+        Returns:
+            Tuple of (project type by name, git status by name, status entry by path)
+        """
+        git_names = {p.name for p in git_projects}
+        type_only = [p for p in projects if p.name not in git_names]
+
+        # Both batches are submitted before either is consumed
+        types = self._EXECUTOR.map(detect_project_type, [p.path for p in type_only])
+        entries = self._EXECUTOR.map(lookup_status, [p.path for p in git_projects])
+
+        project_types = {p.name: t for p, t in zip(type_only, types, strict=True)}
+        git_statuses: dict[str, GitStatus] = {}
+        status_entries: dict[str, StatusEntry] = {}
+        for project, entry in zip(git_projects, entries, strict=True):
+            status_entries[project.path] = entry
+            project_types[project.name] = entry.project_type
+            git_statuses[project.name] = entry.git_status
+        return project_types, git_statuses, status_entries
+
+    def _project_node_data(
+        self,
+        project: Project,
+        indicator: str,
+        project_type: ProjectType,
+        git_status: GitStatus | None,
+    ) -> ProjectData:
+        """Build the node data, including the label, for a project leaf.
+
+        Args:
+            project: Project to display
+            indicator: Rendered session status indicator
+            project_type: Detected project type
+            git_status: Git status, or None to show a placeholder until loaded
+
+        Returns:
+            ProjectData for the leaf
+        """
+        base_label = f"{indicator} {_label_body(project.shortcut, project_type, project.name)}"
+        if git_status is None:
+            return ProjectData(
+                project, f"{base_label} {GIT_PENDING}", base_label=base_label, needs_git=True
+            )
+        return ProjectData(project, _with_git_indicator(base_label, git_status))
+
+    def _add_project_node(
+        self,
+        group_node: TreeNode[_NodeData],
+        project: Project,
+        indicator: str,
+        project_type: ProjectType,
+        git_status: GitStatus | None,
+    ) -> None:
+        """Add a project leaf to a group node.
+
+        Args:
+            group_node: Group node to add the project to
+            project: Project to add
+            indicator: Rendered session status indicator
+            project_type: Detected project type
+            git_status: Git status, or None to show a placeholder until loaded
+        """
+        data = self._project_node_data(project, indicator, project_type, git_status)
+        project_node = group_node.add_leaf(data.label, data=data)
+        self._project_nodes[project.name] = project_node
+
+    def on_tree_node_expanded(self, event: Tree.NodeExpanded[_NodeData]) -> None:
+        """Load git status for a group's projects the first time it is expanded."""
+        node = event.node
+        if isinstance(node.data, GroupData):
+            pending: list[tuple[TreeNode[_NodeData], str]] = []
+            for child in node.children:
+                data = child.data
+                if isinstance(data, ProjectData) and data.needs_git:
+                    data.needs_git = False
+                    pending.append((child, data.project.path))
+            if pending:
+                self.run_worker(self._load_git_status(pending), group="git")
+
+    async def _load_git_status(self, pending: list[tuple[TreeNode[_NodeData], str]]) -> None:
+        """Look up git status for project nodes off the event loop and relabel them.
+
+        Args:
+            pending: Project nodes with the paths of their projects
+        """
+        loop = asyncio.get_running_loop()
+        entries = await asyncio.gather(
+            *(loop.run_in_executor(self._EXECUTOR, lookup_status, path) for _, path in pending)
+        )
+        for (node, path), entry in zip(pending, entries, strict=True):
+            self._status_cache[path] = entry
+            # Skip nodes a refresh has relabeled in the meantime
+            data = node.data
+            if isinstance(data, ProjectData) and data.base_label is not None:
+                data.label = _with_git_indicator(data.base_label, entry.git_status)
+                data.base_label = None
+                node.set_label(data.label)
+
+    def on_unmount(self) -> None:
+        """Persist pending tree state and current project statuses for the next launch."""
+        if self._save_timer is not None:
+            self._save_timer.stop()
+            self._save_expanded_state()
+        paths = {p.path for p in self._projects_by_name.values()}
+        save_status_cache({path: e for path, e in self._status_cache.items() if path in paths})
 
     def _focus_tree(self) -> None:
         """Focus the inner tree widget."""
@@ -196,20 +451,19 @@ class ProjectTree(Widget):
                 if not group_node.is_expanded:
                     group_node.expand()
                 for project_node in group_node.children:
-                    if project_node.data and project_node.data.get("type") == "project":
+                    if isinstance(project_node.data, ProjectData):
                         # Move cursor without selecting (which would launch)
                         tree.move_cursor(project_node)
-                        project = project_node.data.get("project")
-                        if project:
-                            self.post_message(self.ProjectHighlighted(project))
-                            # Also directly update preview
-                            try:
-                                from kata.tui.widgets.preview import PreviewPane
-
-                                preview = self.app.query_one(PreviewPane)
-                                preview.update_project(project)
-                            except Exception:
-                                pass
+                        project = project_node.data.project
+                        self.post_message(self.ProjectHighlighted(project))
+                        # Also directly update preview
+                        try:
+                            from kata.tui.widgets.preview import PreviewPane
+
+                            preview = self.app.query_one(PreviewPane)
+                            preview.update_project(project)
+                        except Exception:
+                            pass
                         return
         except Exception:
             pass
@@ -225,15 +479,22 @@ class ProjectTree(Widget):
         except (OSError, json.JSONDecodeError):
             self._expanded_groups = set()
 
+    def _schedule_save_expanded_state(self) -> None:
+        """Save expanded group state after a quiet period.
+
+        Rapid expand/collapse toggles coalesce into a single write.
+        """
+        if self._save_timer is not None:
+            self._save_timer.stop()
+        self._save_timer = self.set_timer(self.SAVE_STATE_DELAY, self._save_expanded_state)
+
     def _save_expanded_state(self) -> None:
         """Save expanded group state to disk."""
+        self._save_timer = None
         try:
             TREE_STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
-            data = {"expanded_groups": list(self._expanded_groups)}
-            TREE_STATE_FILE.write_text(
-                json.dumps(data, indent=2),
-                encoding="utf-8",
-            )
+            data = {"expanded_groups": sorted(self._expanded_groups)}
+            TREE_STATE_FILE.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
         except OSError:
             pass
 
@@ -252,67 +513,73 @@ class ProjectTree(Widget):
 
         # Capture current expanded state before clearing
         for node in tree.root.children:
-            if node.data and node.data.get("type") == "group":
-                group_name = node.data.get("name")
+            if isinstance(node.data, GroupData):
+                group_name = node.data.name
                 if node.is_expanded:
                     self._expanded_groups.add(group_name)
                 else:
                     self._expanded_groups.discard(group_name)
 
-        tree.clear()
-
         # Reload registry from disk to pick up external changes (e.g., kata add)
         registry = get_registry()
         registry.reload()
         projects = registry.list_all()
+        groups = self._get_groups()
 
         # Get all session statuses in one batch call (more efficient)
         all_statuses = get_all_session_statuses()
 
-        # Group projects by group name
-        groups: dict[str, list[Project]] = {}
-        for project in projects:
-            group_name = project.group or "Uncategorized"
-            if group_name not in groups:
-                groups[group_name] = []
-            groups[group_name].append(project)
+        project_types, git_statuses, entries = self._lookup_projects(
+            projects,
+            [p for name, group in groups.items() if name in self._expanded_groups for p in group],
+        )
+        self._status_cache.update(entries)
+
+        structure = _tree_structure(groups)
+        if structure == self._tree_structure:
+            # Same groups and projects: only relabel leaves whose label changed
+            for project in projects:
+                node = self._project_nodes[project.name]
+                data = self._project_node_data(
+                    project,
+                    self._get_status_indicator(all_statuses.get(project.name, SessionStatus.IDLE)),
+                    project_types[project.name],
+                    git_statuses.get(project.name),
+                )
+                old_data = node.data
+                if not isinstance(old_data, ProjectData) or data.label != old_data.label:
+                    node.set_label(data.label)
+                node.data = data
+                self._projects_by_name[project.name] = project
+            return
+
+        tree.clear()
+        self._project_nodes.clear()
+        self._tree_structure = structure
 
-        # Sort groups and projects
+        # Groups and projects come sorted
         self._projects_by_name.clear()
-        for group_name in sorted(groups.keys()):
+        for group_name, group_projects in groups.items():
             # Get group icon
             group_key = group_name.lower()
             group_icon = GROUP_ICONS.get(group_key, GROUP_ICONS["default"])
             group_label = f"[dim]{group_icon} {group_name.lower()}[/dim]"
 
             group_node = tree.root.add(group_label, expand=group_name in self._expanded_groups)
-            group_node.data = {"type": "group", "name": group_name}
+            group_node.data = GroupData(group_name)
 
-            for project in sorted(groups[group_name], key=lambda p: p.name):
+            for project in group_projects:
                 # Use batched status, fall back to IDLE if not found
                 status = all_statuses.get(project.name, SessionStatus.IDLE)
                 indicator = self._get_status_indicator(status)
 
-                # Get project type icon
-                project_type = detect_project_type(project.path)
-                type_icon = PROJECT_TYPE_ICONS.get(
-                    project_type.value, PROJECT_TYPE_ICONS["generic"]
+                self._add_project_node(
+                    group_node,
+                    project,
+                    indicator,
+                    project_types[project.name],
+                    git_statuses.get(project.name),
                 )
-
-                # Get git status for the project
-                git_status = get_git_status(project.path)
-                git_indicator = format_git_indicator_rich(git_status)
-
-                # Shortcut prefix if assigned
-                shortcut_prefix = f"[cyan][{project.shortcut}][/cyan] " if project.shortcut else ""
-
-                if git_indicator:
-                    label = f"{indicator} {shortcut_prefix}{type_icon} {project.name} [dim]{git_indicator}[/dim]"
-                else:
-                    label = f"{indicator} {shortcut_prefix}{type_icon} {project.name}"
-
-                project_node = group_node.add_leaf(label)
-                project_node.data = {"type": "project", "project": project}
                 self._projects_by_name[project.name] = project
 
         tree.root.expand()
@@ -321,164 +588,177 @@ class ProjectTree(Widget):
         """Get the currently selected project."""
         tree = self.query_one("#project-tree", Tree)
         node = tree.cursor_node
-        if node and node.data and node.data.get("type") == "project":
-            return node.data.get("project")
+        if node is not None and isinstance(node.data, ProjectData):
+            return node.data.project
         return None
 
     def get_selected_zoxide(self) -> ZoxideEntry | None:
         """Get the currently selected zoxide entry."""
         tree = self.query_one("#project-tree", Tree)
         node = tree.cursor_node
-        if node and node.data and node.data.get("type") == "zoxide":
-            return node.data.get("entry")
+        if node is not None and isinstance(node.data, ZoxideData):
+            return node.data.entry
         return None
 
-    def on_tree_node_selected(self, event: Tree.NodeSelected) -> None:
+    def on_tree_node_selected(self, event: Tree.NodeSelected[_NodeData]) -> None:
         """Handle node selection (Enter key)."""
-        node = event.node
-        if node.data:
-            if node.data.get("type") == "project":
-                project = node.data.get("project")
-                if project:
-                    self.post_message(self.ProjectSelected(project))
-            elif node.data.get("type") == "zoxide":
-                entry = node.data.get("entry")
-                if entry:
-                    self.post_message(self.ZoxideSelected(entry))
-            elif node.data.get("type") == "group":
-                # Toggle group expansion
-                group_name = node.data.get("name")
-                if node.is_expanded:
-                    node.collapse()
-                    self._expanded_groups.discard(group_name)
-                else:
-                    node.expand()
-                    self._expanded_groups.add(group_name)
-                self._save_expanded_state()
+        data = event.node.data
+        if isinstance(data, ProjectData):
+            self.post_message(self.ProjectSelected(data.project))
+        elif isinstance(data, ZoxideData):
+            self.post_message(self.ZoxideSelected(data.entry))
+        elif isinstance(data, GroupData):
+            # Toggle group expansion
+            node = event.node
+            if node.is_expanded:
+                node.collapse()
+                self._expanded_groups.discard(data.name)
+            else:
+                node.expand()
+                self._expanded_groups.add(data.name)
+            self._schedule_save_expanded_state()
 
-    def on_tree_node_highlighted(self, event: Tree.NodeHighlighted) -> None:
+    def on_tree_node_highlighted(self, event: Tree.NodeHighlighted[_NodeData]) -> None:
         """Handle node highlight (cursor movement)."""
-        node = event.node
-        if node and node.data:
-            if node.data.get("type") == "project":
-                project = node.data.get("project")
-                if project:
-                    self.post_message(self.ProjectHighlighted(project))
-                    try:
-                        from kata.tui.widgets.preview import PreviewPane
-
-                        preview = self.app.query_one(PreviewPane)
-                        preview.update_project(project)
-                    except Exception:
-                        pass
-            elif node.data.get("type") == "zoxide":
-                entry = node.data.get("entry")
-                if entry:
-                    self.post_message(self.ZoxideHighlighted(entry))
-                    try:
-                        from kata.tui.widgets.preview import PreviewPane
-
-                        preview = self.app.query_one(PreviewPane)
-                        preview.update_zoxide(entry)
-                    except Exception:
-                        pass
+        data = event.node.data
+        if isinstance(data, ProjectData):
+            project = data.project
+            self.post_message(self.ProjectHighlighted(project))
+            try:
+                from kata.tui.widgets.preview import PreviewPane
+
+                preview = self.app.query_one(PreviewPane)
+                preview.update_project(project)
+            except Exception:
+                pass
+        elif isinstance(data, ZoxideData):
+            entry = data.entry
+            self.post_message(self.ZoxideHighlighted(entry))
+            try:
+                from kata.tui.widgets.preview import PreviewPane
+
+                preview = self.app.query_one(PreviewPane)
+                preview.update_zoxide(entry)
+            except Exception:
+                pass
 
     def expand_all(self) -> None:
         """Expand all group nodes."""
         tree = self.query_one("#project-tree", Tree)
         for child in tree.root.children:
-            if child.data and child.data.get("type") == "group":
+            if isinstance(child.data, GroupData):
                 child.expand()
-                self._expanded_groups.add(child.data.get("name", ""))
-        self._save_expanded_state()
+                self._expanded_groups.add(child.data.name)
+        self._schedule_save_expanded_state()
 
     def collapse_all(self) -> None:
         """Collapse all group nodes."""
         tree = self.query_one("#project-tree", Tree)
         for child in tree.root.children:
-            if child.data and child.data.get("type") == "group":
+            if isinstance(child.data, GroupData):
                 child.collapse()
         self._expanded_groups.clear()
-        self._save_expanded_state()
+        self._schedule_save_expanded_state()
 
     def filter_projects(self, query: str) -> None:
         """Filter projects by search query.
 
+        Filtering is debounced so that rapid typing coalesces into a single
+        rebuild of the tree.
+
         Args:
             query: Search query to filter by (fuzzy match on name)
         """
+        self._pending_query = query
+        if self._filter_timer is not None:
+            self._filter_timer.stop()
+        self._filter_timer = self.set_timer(self.FILTER_DEBOUNCE, self._apply_filter)
+
+    def _apply_filter(self) -> None:
+        """Rebuild the tree for the last requested filter query."""
+        self._filter_timer = None
+        query = self._pending_query
         if not query:
+            # Drop any filter still in flight so it can't replace the full tree
+            self.workers.cancel_group(self, "filter")
             self.refresh_projects()
             return
 
-        query_lower = query.lower()
-        tree = self.query_one("#project-tree", Tree)
-        tree.clear()
+        self.run_worker(self._filter_tree(query.lower()), group="filter", exclusive=True)
 
-        registry = get_registry()
-        projects = registry.list_all()
+    async def _filter_tree(self, query_lower: str) -> None:
+        """Rebuild the tree with the projects matching a query.
 
-        # Get all session statuses in one batch call
-        all_statuses = get_all_session_statuses()
+        Matching and the session/git lookups run in a thread so the UI stays
+        responsive; only the tree itself is rebuilt on the event loop.
 
-        # Filter registered projects and group
-        groups: dict[str, list[Project]] = {}
-        for project in projects:
-            if self._fuzzy_match(query_lower, project.name.lower()):
-                group_name = project.group or "Uncategorized"
-                if group_name not in groups:
-                    groups[group_name] = []
-                groups[group_name].append(project)
+        Args:
+            query_lower: Lowercased search query
+        """
+        # Snapshot taken here, as the thread must not touch the widget's caches
+        all_groups = self._get_groups()
+        groups, all_statuses, lookup = await asyncio.to_thread(
+            self._collect_filtered, query_lower, all_groups
+        )
+        project_types, git_statuses, entries = lookup
+        self._status_cache.update(entries)
+
+        tree = self.query_one("#project-tree", Tree)
+        tree.clear()
+        self._project_nodes.clear()
+        # Filtered layout never matches a full refresh, which rebuilds from scratch
+        self._tree_structure = None
 
         # Build filtered tree
-        for group_name in sorted(groups.keys()):
+        for group_name, group_projects in groups.items():
             group_key = group_name.lower()
             group_icon = GROUP_ICONS.get(group_key, GROUP_ICONS["default"])
             group_label = f"[dim]{group_icon} {group_name.lower()}[/dim]"
 
             group_node = tree.root.add(group_label, expand=True)
-            group_node.data = {"type": "group", "name": group_name}
+            group_node.data = GroupData(group_name)
 
-            for project in sorted(groups[group_name], key=lambda p: p.name):
+            for project in group_projects:
                 status = all_statuses.get(project.name, SessionStatus.IDLE)
                 indicator = self._get_status_indicator(status)
 
-                project_type = detect_project_type(project.path)
-                type_icon = PROJECT_TYPE_ICONS.get(
-                    project_type.value, PROJECT_TYPE_ICONS["generic"]
+                self._add_project_node(
+                    group_node,
+                    project,
+                    indicator,
+                    project_types[project.name],
+                    git_statuses.get(project.name),
                 )
 
-                git_status = get_git_status(project.path)
-                git_indicator = format_git_indicator_rich(git_status)
-
-                # Shortcut prefix if assigned
-                shortcut_prefix = f"[cyan][{project.shortcut}][/cyan] " if project.shortcut else ""
-
-                if git_indicator:
-                    label = f"{indicator} {shortcut_prefix}{type_icon} {project.name} [dim]{git_indicator}[/dim]"
-                else:
-                    label = f"{indicator} {shortcut_prefix}{type_icon} {project.name}"
-
-                project_node = group_node.add_leaf(label)
-                project_node.data = {"type": "project", "project": project}
-
         tree.root.expand()
 
-    def _fuzzy_match(self, query: str, target: str) -> bool:
-        """Check if query fuzzy matches target.
+    def _collect_filtered(
+        self, query_lower: str, all_groups: dict[str, list[Project]]
+    ) -> _FilterResult:
+        """Find the projects matching a query and look up their statuses.
+
+        Runs in a thread, so it only reads its arguments and returns the
+        lookups for the event loop to merge.
 
         Args:
-            query: Search query
-            target: String to match against
+            query_lower: Lowercased search query
+            all_groups: Registered projects by group, as from _get_groups
 
         Returns:
-            True if all query characters appear in order in target
+            Tuple of (matching projects by group, session statuses,
+            lookups for the matches as from _lookup_projects)
         """
-        if not query:
-            return True
+        # Get all session statuses in one batch call
+        all_statuses = get_all_session_statuses()
+
+        # Filter registered projects, keeping the sorted grouping
+        match = _fuzzy_pattern(query_lower).match
+        groups = {
+            group_name: matched
+            for group_name, group_projects in all_groups.items()
+            if (matched := [p for p in group_projects if match(p.name.lower())])
+        }
 
-        query_idx = 0
-        for char in target:
-            if query_idx < len(query) and char == query[query_idx]:
-                query_idx += 1
-        return query_idx == len(query)
+        # Filtered groups are all expanded, so every match needs git status
+        matches = [p for group in groups.values() for p in group]
+        return groups, all_statuses, self._lookup_projects(matches, matches)
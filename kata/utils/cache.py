@@ -0,0 +1,136 @@
+"""Persistent cache of per-project git status and type detection."""
+
+import json
+import os
+import time
+from dataclasses import asdict, dataclass
+
+from kata.core.config import KATA_CONFIG_DIR
+from kata.core.models import ProjectType
+from kata.utils.detection import detect_project_type, is_mtime_racy
+from kata.utils.git import GitStatus, get_git_status
+
+# File to persist project statuses between launches
+STATUS_CACHE_FILE = KATA_CONFIG_DIR / "status_cache.json"
+
+
+@dataclass
+class StatusEntry:
+    """Git status and project type of a project, with the mtimes they were read at.
+
+    Editing a tracked file changes neither mtime, so even a fresh entry is only
+    good for display until the next refresh re-reads the project.
+    """
+
+    index_mtime: int
+    dir_mtime: int
+    git_status: GitStatus
+    project_type: ProjectType
+    # Wall-clock time in ns when the status was read
+    read_at: int
+
+    def is_fresh(self, path: str) -> bool:
+        """Check if the project's .git/index and directory are unchanged since this was read.
+
+        Args:
+            path: Project directory
+
+        Returns:
+            True if both mtimes still match and neither was too recent to trust
+            when the entry was read
+        """
+        if (self.index_mtime, self.dir_mtime) != project_mtimes(path):
+            return False
+        return not is_mtime_racy(max(self.index_mtime, self.dir_mtime), self.read_at)
+
+
+def _mtime_ns(path: str) -> int:
+    """Return a path's modification time in ns, or -1 if it can't be stat'ed."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return -1
+
+
+def project_mtimes(path: str) -> tuple[int, int]:
+    """Get the mtimes that invalidate a project's cached status.
+
+    Args:
+        path: Project directory
+
+    Returns:
+        Tuple of (.git/index mtime, directory mtime) in ns, -1 where missing
+    """
+    return _mtime_ns(os.path.join(path, ".git", "index")), _mtime_ns(path)
+
+
+def lookup_status(path: str) -> StatusEntry:
+    """Read a project's git status and type.
+
+    Args:
+        path: Project directory
+
+    Returns:
+        StatusEntry stamped with the mtimes and time taken before reading
+    """
+    read_at = time.time_ns()
+    index_mtime, dir_mtime = project_mtimes(path)
+    return StatusEntry(
+        index_mtime=index_mtime,
+        dir_mtime=dir_mtime,
+        git_status=get_git_status(path),
+        project_type=detect_project_type(path),
+        read_at=read_at,
+    )
+
+
+def load_status_cache() -> dict[str, StatusEntry]:
+    """Load cached project statuses from disk.
+
+    Returns:
+        Mapping of project path to StatusEntry (empty if missing or unreadable)
+    """
+    try:
+        data = json.loads(STATUS_CACHE_FILE.read_text(encoding="utf-8"))
+        projects = data["projects"]
+    except (OSError, json.JSONDecodeError, KeyError, TypeError):
+        return {}
+
+    entries: dict[str, StatusEntry] = {}
+    for path, entry in projects.items():
+        try:
+            entries[path] = StatusEntry(
+                index_mtime=int(entry["index_mtime"]),
+                dir_mtime=int(entry["dir_mtime"]),
+                git_status=GitStatus(**entry["git"]),
+                project_type=ProjectType(entry["type"]),
+                read_at=int(entry["read_at"]),
+            )
+        except (KeyError, TypeError, ValueError):
+            continue
+    return entries
+
+
+def save_status_cache(entries: dict[str, StatusEntry]) -> None:
+    """Save project statuses to disk.
+
+    Args:
+        entries: Mapping of project path to StatusEntry
+    """
+    data = {
+        "projects": {
+            path: {
+                "index_mtime": entry.index_mtime,
+                "dir_mtime": entry.dir_mtime,
+                "git": asdict(entry.git_status),
+                "type": entry.project_type.value,
+                "read_at": entry.read_at,
+            }
+            for path, entry in entries.items()
+        }
+    }
+    try:
+        STATUS_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        STATUS_CACHE_FILE.write_text(json.dumps(data), encoding="utf-8")
+    except OSError:
+        pass
@@ -1,5 +1,8 @@
 """Project type detection utilities."""
 
+import os
+import stat
+import time
 from pathlib import Path
 
 from kata.core.models import ProjectType
@@ -11,6 +14,35 @@ PROJECT_MARKERS: dict[ProjectType, list[str]] = {
     ProjectType.GO: ["go.mod"],
 }
 
+# Markers as sets, in the same priority order, for membership tests
+_MARKER_SETS: tuple[tuple[ProjectType, frozenset[str]], ...] = tuple(
+    (project_type, frozenset(markers)) for project_type, markers in PROJECT_MARKERS.items()
+)
+
+# Resolved directory -> (directory mtime, detected type). Adding or removing
+# a marker file changes the directory's mtime, which invalidates the entry.
+_project_type_cache: dict[str, tuple[int, ProjectType]] = {}
+
+# How long after a modification an mtime can't yet be trusted: a change within
+# the same timestamp tick (coarse on many filesystems) leaves it unchanged
+MTIME_RACY_WINDOW_NS = 2_000_000_000
+
+
+def is_mtime_racy(mtime_ns: int, read_ns: int) -> bool:
+    """Check if something read at read_ns could have changed without changing mtime_ns.
+
+    As with git's racy index entries, a read within MTIME_RACY_WINDOW_NS of
+    the modification time may have missed a later change in the same tick.
+
+    Args:
+        mtime_ns: Modification time in ns
+        read_ns: Wall-clock time in ns when the contents were read
+
+    Returns:
+        True if a result read at read_ns shouldn't be reused on mtime alone
+    """
+    return read_ns - mtime_ns < MTIME_RACY_WINDOW_NS
+
 
 def detect_project_type(path: str | Path) -> ProjectType:
     """Detect the project type based on marker files.
@@ -26,16 +58,42 @@ def detect_project_type(path: str | Path) -> ProjectType:
     """
     path_obj = Path(path).expanduser().resolve()
 
-    if not path_obj.is_dir():
+    try:
+        dir_stat = os.stat(path_obj)
+    except OSError:
+        return ProjectType.GENERIC
+    if not stat.S_ISDIR(dir_stat.st_mode):
         return ProjectType.GENERIC
 
+    key = str(path_obj)
+    read_ns = time.time_ns()
+    cached = _project_type_cache.get(key)
+    if cached is not None and cached[0] == dir_stat.st_mtime_ns:
+        return cached[1]
+
+    # List the directory once rather than probing each marker separately
+    try:
+        with os.scandir(path_obj) as it:
+            names = {entry.name for entry in it}
+    except OSError:
+        names = set()
+
+    detected = ProjectType.GENERIC
     # Check each project type's markers in order
-    for project_type, markers in PROJECT_MARKERS.items():
-        for marker in markers:
-            if (path_obj / marker).exists():
-                return project_type
+    for project_type, markers in _MARKER_SETS:
+        if not markers.isdisjoint(names):
+            detected = project_type
+            break
+
+    # Recently modified directories are re-read until their mtime settles
+    if not is_mtime_racy(dir_stat.st_mtime_ns, read_ns):
+        _project_type_cache[key] = (dir_stat.st_mtime_ns, detected)
+    return detected
+
 
-    return ProjectType.GENERIC
+def clear_project_type_cache() -> None:
+    """Forget all cached project type detections."""
+    _project_type_cache.clear()
 
 
 def get_project_markers(project_type: ProjectType) -> list[str]:
@@ -1,7 +1,16 @@
 """fzf utilities for interactive project selection."""
 
+import functools
 import shutil
 import subprocess
+import threading
+from typing import IO
+
+
+@functools.lru_cache(maxsize=1)
+def _fzf_path() -> str | None:
+    """Locate the fzf executable on PATH (looked up once per process)."""
+    return shutil.which("fzf")
 
 
 def is_fzf_available() -> bool:
@@ -10,7 +19,7 @@ def is_fzf_available() -> bool:
     Returns:
         True if fzf is installed, False otherwise
     """
-    return shutil.which("fzf") is not None
+    return _fzf_path() is not None
 
 
 def run_fzf_picker(
@@ -40,8 +49,8 @@ def run_fzf_picker(
             "  Ubuntu: sudo apt install fzf"
         )
 
-    # Build fzf command
-    cmd = ["fzf"]
+    # Build fzf command, using the already-resolved executable path
+    cmd = [_fzf_path() or "fzf"]
 
     if ansi:
         cmd.append("--ansi")
@@ -53,23 +62,56 @@ def run_fzf_picker(
         cmd.extend(["--preview", preview_cmd])
         cmd.extend(["--preview-window", "right:50%:wrap"])
 
-    # Join items with newlines for stdin
-    input_data = "\n".join(items)
-
     try:
-        result = subprocess.run(
+        proc = subprocess.Popen(
             cmd,
-            input=input_data,
-            capture_output=True,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
             text=True,
         )
-
-        # fzf returns 0 on selection, 1 on no match, 130 on Ctrl-C/Esc
-        if result.returncode == 0:
-            return result.stdout.strip()
-        return None
-
     except FileNotFoundError:
         raise RuntimeError("fzf not found in PATH")
-    except KeyboardInterrupt:
-        return None
+
+    # Both pipes were requested above
+    assert proc.stdin is not None and proc.stdout is not None
+
+    with proc:
+        # Stream items from a thread so fzf can start matching before all are
+        # written, without joining them into one big string first
+        writer = threading.Thread(target=_write_items, args=(proc.stdin, items), daemon=True)
+        writer.start()
+
+        try:
+            output = proc.stdout.read()
+            returncode = proc.wait()
+        except KeyboardInterrupt:
+            proc.kill()
+            return None
+        finally:
+            writer.join()
+
+    # fzf returns 0 on selection, 1 on no match, 130 on Ctrl-C/Esc
+    if returncode == 0:
+        return output.strip()
+    return None
+
+
+def _write_items(stdin: IO[str], items: list[str]) -> None:
+    """Write items to fzf's stdin one per line, then close it.
+
+    Args:
+        stdin: fzf's stdin pipe
+        items: Items to write
+    """
+    try:
+        for item in items:
+            stdin.write(item)
+            stdin.write("\n")
+    except BrokenPipeError:
+        # fzf exited (selection made or cancelled) before reading everything
+        pass
+    finally:
+        try:
+            stdin.close()
+        except BrokenPipeError:
+            pass
@@ -1,9 +1,19 @@
 """Git utilities for repository status detection."""
 
+import os
 import subprocess
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, replace
 from pathlib import Path
 
+# Seconds a cached status is reused while .git/index is unchanged
+GIT_STATUS_TTL = 2.0
+
+# Environment for git calls. Along with --no-optional-locks on each command,
+# this stops read-only commands like status from taking .git/index.lock to
+# refresh the index, so they never contend with the user's own git commands.
+_GIT_ENV = {**os.environ, "GIT_OPTIONAL_LOCKS": "0"}
+
 
 @dataclass
 class GitStatus:
@@ -24,20 +34,36 @@ class GitStatus:
         return self.has_staged or self.has_unstaged or self.has_untracked
 
 
-def is_git_repository(path: Path | str) -> bool:
-    """Check if a path is inside a git repository.
+# Porcelain v2 prefixes of changed (1), renamed/copied (2) and unmerged (u) entries
+_CHANGED_ENTRY_KINDS = frozenset({b"1 ", b"2 ", b"u "})
+
+# path -> (.git/index mtime, monotonic time cached, status)
+_git_status_cache: dict[str, tuple[int, float, GitStatus]] = {}
+
+
+def is_git_repository(path: Path | str, *, strict: bool = False) -> bool:
+    """Check if a path is a git repository.
+
+    By default this only checks for a ``.git`` entry (a directory, or a file
+    for worktrees and submodules) at the path, which avoids spawning git.
 
     Args:
         path: Path to check
+        strict: Also ask git, so that subdirectories inside a work tree count
 
     Returns:
         True if path is a git repository
     """
-    path = Path(path).resolve()
+    if os.path.exists(os.path.join(path, ".git")):
+        return True
+    if not strict:
+        return False
+
     try:
         result = subprocess.run(
-            ["git", "rev-parse", "--is-inside-work-tree"],
+            ["git", "--no-optional-locks", "rev-parse", "--is-inside-work-tree"],
             cwd=path,
+            env=_GIT_ENV,
             capture_output=True,
             text=True,
             timeout=5,
@@ -56,12 +82,12 @@ def get_branch_name(path: Path | str) -> str | None:
     Returns:
         Branch name or None if not a git repo or detached HEAD
     """
-    path = Path(path).resolve()
     try:
         # First try symbolic-ref for normal branch
         result = subprocess.run(
-            ["git", "symbolic-ref", "--short", "HEAD"],
+            ["git", "--no-optional-locks", "symbolic-ref", "--short", "HEAD"],
             cwd=path,
+            env=_GIT_ENV,
             capture_output=True,
             text=True,
             timeout=5,
@@ -71,8 +97,9 @@ def get_branch_name(path: Path | str) -> str | None:
 
         # Fall back to describe for detached HEAD
         result = subprocess.run(
-            ["git", "describe", "--tags", "--exact-match", "HEAD"],
+            ["git", "--no-optional-locks", "describe", "--tags", "--exact-match", "HEAD"],
             cwd=path,
+            env=_GIT_ENV,
             capture_output=True,
             text=True,
             timeout=5,
@@ -82,8 +109,9 @@ def get_branch_name(path: Path | str) -> str | None:
 
         # Last resort: short SHA
         result = subprocess.run(
-            ["git", "rev-parse", "--short", "HEAD"],
+            ["git", "--no-optional-locks", "rev-parse", "--short", "HEAD"],
             cwd=path,
+            env=_GIT_ENV,
             capture_output=True,
             text=True,
             timeout=5,
@@ -105,12 +133,12 @@ def is_dirty(path: Path | str) -> bool:
     Returns:
         True if there are uncommitted changes (staged, unstaged, or untracked)
     """
-    path = Path(path).resolve()
     try:
         # Check for any changes (staged, unstaged, or untracked)
         result = subprocess.run(
-            ["git", "status", "--porcelain"],
+            ["git", "--no-optional-locks", "status", "--porcelain"],
             cwd=path,
+            env=_GIT_ENV,
             capture_output=True,
             text=True,
             timeout=5,
@@ -123,70 +151,148 @@ def is_dirty(path: Path | str) -> bool:
 def get_git_status(path: Path | str) -> GitStatus:
     """Get comprehensive git status for a repository.
 
+    Results are cached per path for GIT_STATUS_TTL seconds, and dropped
+    early if .git/index changes (commits, staging, checkouts).
+
     Args:
         path: Path to the git repository
 
     Returns:
         GitStatus with all repository information
     """
-    path = Path(path).resolve()
+    key = str(path)
+    try:
+        index_mtime = os.stat(os.path.join(key, ".git", "index")).st_mtime_ns
+    except OSError:
+        index_mtime = -1
 
-    if not is_git_repository(path):
-        return GitStatus(is_git_repo=False)
+    now = time.monotonic()
+    cached = _git_status_cache.get(key)
+    if cached is not None and cached[0] == index_mtime and now - cached[1] < GIT_STATUS_TTL:
+        return replace(cached[2])
 
-    status = GitStatus(is_git_repo=True)
-    status.branch = get_branch_name(path)
+    status = _read_git_status(path)
+    _git_status_cache[key] = (index_mtime, now, status)
+    return replace(status)
+
+
+def clear_git_status_cache() -> None:
+    """Forget all cached git statuses."""
+    _git_status_cache.clear()
+
+
+def _read_git_status(path: Path | str) -> GitStatus:
+    """Read git status for a repository with a single git invocation.
+
+    ``git status --porcelain=v2 --branch`` reports whether this is a work
+    tree, the branch, ahead/behind counts and per-file states in one go.
 
+    Args:
+        path: Path to the git repository
+
+    Returns:
+        GitStatus with all repository information
+    """
     try:
-        # Get detailed status
         result = subprocess.run(
-            ["git", "status", "--porcelain"],
+            [
+                "git",
+                "--no-optional-locks",
+                "status",
+                "--porcelain=v2",
+                "--branch",
+                "--untracked-files=normal",
+            ],
             cwd=path,
+            env=_GIT_ENV,
             capture_output=True,
-            text=True,
             timeout=5,
         )
-        if result.returncode == 0:
-            for line in result.stdout.strip().split("\n"):
-                if not line:
-                    continue
-                # Status format: XY filename
-                # X = index status, Y = work tree status
-                x_status = line[0] if len(line) > 0 else " "
-                y_status = line[1] if len(line) > 1 else " "
+    except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
+        return GitStatus(is_git_repo=False)
+
+    if result.returncode != 0:
+        return GitStatus(is_git_repo=False)
+
+    status = GitStatus(is_git_repo=True)
+    detached = False
+    oid = b""
+
+    # Output is scanned as raw bytes; only the branch name is ever decoded
+    for line in result.stdout.splitlines():
+        if line.startswith(b"# "):
+            # Header: "# branch.oid <sha>", "# branch.head <name>",
+            # "# branch.ab +<ahead> -<behind>"
+            key, _, value = line[2:].partition(b" ")
+            if key == b"branch.oid":
+                oid = value
+            elif key == b"branch.head":
+                if value == b"(detached)":
+                    detached = True
+                else:
+                    status.branch = value.decode("utf-8", errors="replace")
+            elif key == b"branch.ab":
+                ahead, _, behind = value.partition(b" ")
+                try:
+                    status.ahead = int(ahead.lstrip(b"+"))
+                    status.behind = int(behind.lstrip(b"-"))
+                except ValueError:
+                    pass
+            continue
+
+        if line.startswith(b"? "):
+            status.has_untracked = True
+        elif line[:2] in _CHANGED_ENTRY_KINDS:
+            # Changed/renamed/unmerged entry: "<kind> XY ..." where "." means unmodified
+            if line[2:3] != b".":
+                status.has_staged = True
+            if line[3:4] != b".":
+                status.has_unstaged = True
+
+        # Headers come first, so once every flag is set the rest can't matter
+        if status.has_staged and status.has_unstaged and status.has_untracked:
+            break
+
+    status.is_dirty = status.has_staged or status.has_unstaged or status.has_untracked
+
+    # Detached HEAD: resolve a tag or short SHA for display
+    if detached:
+        status.branch = _detached_head_name(path, oid.decode("ascii", errors="replace"))
+
+    return status
 
-                # Check for staged changes (index)
-                if x_status not in (" ", "?"):
-                    status.has_staged = True
 
-                # Check for unstaged changes (work tree)
-                if y_status not in (" ", "?"):
-                    status.has_unstaged = True
+def _detached_head_name(path: Path | str, oid: str) -> str | None:
+    """Get a display name for a detached HEAD, as get_branch_name would.
 
-                # Check for untracked files
-                if x_status == "?" and y_status == "?":
-                    status.has_untracked = True
+    The commit is already known from ``git status``, so only the tag lookup
+    needs another git call.
 
-        status.is_dirty = status.has_staged or status.has_unstaged or status.has_untracked
+    Args:
+        path: Path to the git repository
+        oid: Full SHA of HEAD
 
-        # Get ahead/behind count
+    Returns:
+        "tag:<name>" if HEAD is exactly at a tag, else "(<short sha>)", or
+        None if HEAD has no commit
+    """
+    try:
         result = subprocess.run(
-            ["git", "rev-list", "--left-right", "--count", "@{upstream}...HEAD"],
+            ["git", "--no-optional-locks", "describe", "--tags", "--exact-match", "HEAD"],
             cwd=path,
+            env=_GIT_ENV,
             capture_output=True,
             text=True,
             timeout=5,
         )
         if result.returncode == 0:
-            parts = result.stdout.strip().split()
-            if len(parts) == 2:
-                status.behind = int(parts[0])
-                status.ahead = int(parts[1])
-
-    except (subprocess.TimeoutExpired, FileNotFoundError, OSError, ValueError):
-        pass
+            return f"tag:{result.stdout.strip()}"
+    except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
+        return None
 
-    return status
+    if not oid or oid == "(initial)":
+        return None
+    return f"({oid[:7]})"
 
 
 def format_git_indicator(status: GitStatus) -> str:
@@ -1,5 +1,7 @@
 """Path validation utilities for Kata."""
 
+import functools
+import os
 from pathlib import Path
 
 
@@ -9,6 +11,33 @@ class PathValidationError(Exception):
     pass
 
 
+# tmux doesn't allow periods or colons in session names
+_TMUX_TRANS = str.maketrans({".": "_", ":": "_"})
+
+
+def _resolve(path: str | Path) -> Path:
+    """Expand ~ and resolve a path to its absolute, symlink-free form.
+
+    Absolute paths are memoized; relative ones depend on the working
+    directory and are always resolved afresh.
+    """
+    expanded = os.path.expanduser(os.fspath(path))
+    if not os.path.isabs(expanded):
+        return Path(expanded).resolve()
+    return _resolve_absolute(expanded)
+
+
+@functools.lru_cache(maxsize=4096)
+def _resolve_absolute(path: str) -> Path:
+    """Resolve an absolute path (cached by its string form)."""
+    return Path(path).resolve()
+
+
+def clear_resolve_cache() -> None:
+    """Forget all memoized path resolutions, e.g. after symlinks may have changed."""
+    _resolve_absolute.cache_clear()
+
+
 def validate_project_path(path: str | Path) -> Path:
     """Validate that a path exists and is a directory.
 
@@ -21,7 +50,7 @@ def validate_project_path(path: str | Path) -> Path:
     Raises:
         PathValidationError: If path doesn't exist or isn't a directory
     """
-    path_obj = Path(path).expanduser().resolve()
+    path_obj = _resolve(path)
 
     if not path_obj.exists():
         raise PathValidationError(f"Path does not exist: {path_obj}")
@@ -41,19 +70,27 @@ def normalize_path(path: str | Path) -> str:
     Returns:
         Absolute path string
     """
-    return str(Path(path).expanduser().resolve())
+    return str(_resolve(path))
 
 
-def get_project_name_from_path(path: str | Path) -> str:
+def get_project_name_from_path(path: str | Path, *, canonical: bool = False) -> str:
     """Extract project name from a path (directory name).
 
+    By default the name is taken from the path string alone, without touching
+    the filesystem. Paths ending in "." or ".." fall back to resolving.
+
     Args:
         path: Path to extract name from
+        canonical: Resolve symlinks first, naming the target directory
 
     Returns:
         Directory name as project name
     """
-    return Path(path).expanduser().resolve().name
+    if not canonical:
+        name = os.path.basename(os.path.expanduser(os.fspath(path)).rstrip(os.sep))
+        if name not in ("", ".", ".."):
+            return name
+    return _resolve(path).name
 
 
 def sanitize_session_name(name: str) -> str:
@@ -68,5 +105,4 @@ def sanitize_session_name(name: str) -> str:
     Returns:
         A valid tmux session name
     """
-    # tmux doesn't allow periods or colons in session names
-    return name.replace(".", "_").replace(":", "_")
+    return name.translate(_TMUX_TRANS)
@@ -0,0 +1,29 @@
+"""Resolution of the fastest available safe YAML loader and dumper."""
+
+import functools
+
+
+@functools.lru_cache(maxsize=1)
+def safe_loader() -> type:
+    """Return the libyaml-backed safe loader if available, else the pure-Python one."""
+    try:
+        from yaml import CSafeLoader
+
+        return CSafeLoader
+    except ImportError:
+        from yaml import SafeLoader
+
+        return SafeLoader
+
+
+@functools.lru_cache(maxsize=1)
+def safe_dumper() -> type:
+    """Return the libyaml-backed safe dumper if available, else the pure-Python one."""
+    try:
+        from yaml import CSafeDumper
+
+        return CSafeDumper
+    except ImportError:
+        from yaml import SafeDumper
+
+        return SafeDumper
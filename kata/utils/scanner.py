@@ -1,39 +1,52 @@
 """Directory scanner for discovering projects."""
 
+import heapq
+import os
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 from kata.utils.detection import PROJECT_MARKERS
 
 # Directories to skip when scanning
-SKIP_DIRECTORIES = {
-    ".git",
-    ".hg",
-    ".svn",
-    "node_modules",
-    "__pycache__",
-    ".venv",
-    "venv",
-    ".env",
-    "env",
-    ".tox",
-    ".nox",
-    ".pytest_cache",
-    ".mypy_cache",
-    ".ruff_cache",
-    "dist",
-    "build",
-    ".next",
-    ".nuxt",
-    "coverage",
-    ".coverage",
-    "vendor",
-    "target",  # Rust
-    "pkg",  # Go
-    "bin",
-}
-
-
-def is_project_directory(path: Path) -> bool:
+SKIP_DIRECTORIES: frozenset[str] = frozenset(
+    {
+        ".git",
+        ".hg",
+        ".svn",
+        "node_modules",
+        "__pycache__",
+        ".venv",
+        "venv",
+        ".env",
+        "env",
+        ".tox",
+        ".nox",
+        ".pytest_cache",
+        ".mypy_cache",
+        ".ruff_cache",
+        "dist",
+        "build",
+        ".next",
+        ".nuxt",
+        "coverage",
+        ".coverage",
+        "vendor",
+        "target",  # Rust
+        "pkg",  # Go
+        "bin",
+    }
+)
+
+# Marker files of every project type, flattened for a single membership pass
+ALL_MARKERS = frozenset(marker for markers in PROJECT_MARKERS.values() for marker in markers)
+
+# First characters of every marker name and of .git, to rule out most
+# entries before hashing the whole name
+_MARKER_FIRST_CHARS = frozenset(marker[0] for marker in ALL_MARKERS) | {"."}
+
+
+def is_project_directory(path: Path | str) -> bool:
     """Check if a directory appears to be a project root.
 
     A project is identified by presence of:
@@ -46,80 +59,169 @@ def is_project_directory(path: Path) -> bool:
     Returns:
         True if directory appears to be a project root
     """
-    if not path.is_dir():
-        return False
+    return _has_project_marker(os.fspath(path))
 
-    # Check for .git directory
-    if (path / ".git").is_dir():
-        return True
 
-    # Check for any project markers
-    for markers in PROJECT_MARKERS.values():
-        for marker in markers:
-            if (path / marker).exists():
-                return True
+def _has_project_marker(path: str) -> bool:
+    """Check a directory for project root markers.
 
+    The directory is listed once and its entry names checked, rather than
+    probing for .git and each marker with a separate stat. Paths that can't
+    be listed (missing, not a directory, unreadable) have no markers.
+    """
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                name = entry.name
+                if name[0] not in _MARKER_FIRST_CHARS:
+                    continue
+                # A .git directory, or any project marker
+                if name in ALL_MARKERS or (name == ".git" and entry.is_dir()):
+                    return True
+    except OSError:
+        pass
     return False
 
 
-def scan_directory(
-    root: Path,
-    max_depth: int = 3,
-    include_hidden: bool = False,
-) -> list[Path]:
-    """Recursively scan for project directories.
+def _read_directory(path: str, include_hidden: bool) -> tuple[bool, list[str]]:
+    """List a directory once, both to check it for markers and to find its subdirectories.
 
     Args:
-        root: Root directory to start scanning from
-        max_depth: Maximum depth to recurse (default: 3)
-        include_hidden: Whether to scan hidden directories (default: False)
+        path: Directory to list
+        include_hidden: Whether to keep hidden subdirectories
 
     Returns:
-        List of paths that appear to be project directories
+        Tuple of (whether it's a project root, names of the subdirectories
+        worth scanning); the names are empty for project roots and for paths
+        that can't be listed
+    """
+    subdirs: list[str] = []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                name = entry.name
+                if name[0] in _MARKER_FIRST_CHARS and (
+                    name in ALL_MARKERS or (name == ".git" and entry.is_dir())
+                ):
+                    return True, []
+
+                # Skip hidden directories unless explicitly included
+                if not include_hidden and name[0] == ".":
+                    continue
+
+                # Skip known non-project directories
+                if name in SKIP_DIRECTORIES:
+                    continue
+
+                if entry.is_dir():
+                    subdirs.append(name)
+    except OSError:
+        pass
+    return False, subdirs
+
+
+def _walk_subtree(top: str, depth: int, max_depth: int, include_hidden: bool) -> list[Path]:
+    """Find project roots in a directory tree.
+
+    Each directory is listed exactly once: the same listing tells whether it
+    is a project root and, if not, which subdirectories to scan next.
+
+    Args:
+        top: Directory to start from
+        depth: Depth of top below the scan root
+        max_depth: Maximum depth to recurse
+        include_hidden: Whether to scan hidden directories
+
+    Returns:
+        Project paths found, unsorted
     """
     projects: list[Path] = []
-    root = root.resolve()
+    pending = [(top, depth)]
 
-    def _scan(current: Path, depth: int) -> None:
-        """Recursively scan directory."""
-        if depth > max_depth:
-            return
+    while pending:
+        path, depth = pending.pop()
+        is_project, subdirs = _read_directory(path, include_hidden)
+        if is_project:
+            projects.append(Path(path))
+            # Don't recurse into project subdirectories
+            # (nested projects are rare and usually intentional)
+            continue
 
-        try:
-            entries = list(current.iterdir())
-        except PermissionError:
-            return
+        if depth < max_depth:
+            pending.extend((os.path.join(path, name), depth + 1) for name in subdirs)
 
-        for entry in entries:
-            if not entry.is_dir():
-                continue
+    return projects
 
-            name = entry.name
 
-            # Skip hidden directories unless explicitly included
-            if not include_hidden and name.startswith("."):
-                continue
+def iter_projects(
+    root: Path,
+    max_depth: int = 3,
+    include_hidden: bool = False,
+) -> Iterator[Path]:
+    """Yield project directories under root as they are found.
 
-            # Skip known non-project directories
-            if name in SKIP_DIRECTORIES:
-                continue
+    The root's subdirectories are walked concurrently, since the scan is
+    dominated by directory reads that release the GIL. Paths come in
+    discovery order; stopping early (e.g. with itertools.islice) cancels
+    subtree walks that haven't started yet.
 
-            # Check if this is a project
-            if is_project_directory(entry):
-                projects.append(entry)
-                # Don't recurse into project subdirectories
-                # (nested projects are rare and usually intentional)
-                continue
+    Args:
+        root: Root directory to start scanning from
+        max_depth: Maximum depth to recurse (default: 3)
+        include_hidden: Whether to scan hidden directories (default: False)
 
-            # Recurse into subdirectory
-            _scan(entry, depth + 1)
+    Yields:
+        Paths that appear to be project directories
+    """
+    # Made absolute without resolving symlinks; callers such as the scan
+    # command pass an already resolved root
+    root = Path(os.path.abspath(root))
+    root_str = str(root)
 
     # Check if root itself is a project
-    if is_project_directory(root):
-        projects.append(root)
-    else:
-        _scan(root, 1)
+    is_project, subtrees = _read_directory(root_str, include_hidden)
+    if is_project:
+        yield root
+        return
+    if max_depth < 1 or not subtrees:
+        return
+
+    workers = min(32, (os.cpu_count() or 1) * 4, len(subtrees))
+    executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        futures = [
+            executor.submit(
+                _walk_subtree, os.path.join(root_str, name), 1, max_depth, include_hidden
+            )
+            for name in subtrees
+        ]
+        for future in as_completed(futures):
+            yield from future.result()
+    finally:
+        # Don't block on walks whose results are no longer wanted
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def scan_directory(
+    root: Path,
+    max_depth: int = 3,
+    include_hidden: bool = False,
+    limit: int | None = None,
+) -> list[Path]:
+    """Recursively scan for project directories.
+
+    Args:
+        root: Root directory to start scanning from
+        max_depth: Maximum depth to recurse (default: 3)
+        include_hidden: Whether to scan hidden directories (default: False)
+        limit: Only return the first this many paths in sorted order (default: all)
 
+    Returns:
+        Sorted list of paths that appear to be project directories
+    """
+    projects = iter_projects(root, max_depth, include_hidden)
+    if limit is not None:
+        return heapq.nsmallest(limit, projects)
     return sorted(projects)
 
 
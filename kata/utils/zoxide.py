@@ -1,10 +1,17 @@
 """Zoxide integration utilities for directory frequency tracking."""
 
+import functools
+import os
+import re
 import shutil
 import subprocess
 from dataclasses import dataclass
 from pathlib import Path
 
+# One "score path" line of `zoxide query -l -s` output. Scores are
+# right-aligned, so lines may start with padding.
+_ENTRY_LINE = re.compile(rb"^[ \t]*([0-9]+(?:\.[0-9]+)?)[ \t]+(.+?)[ \t\r]*$", re.MULTILINE)
+
 
 @dataclass
 class ZoxideEntry:
@@ -17,7 +24,13 @@ class ZoxideEntry:
     @property
     def exists(self) -> bool:
         """Check if the directory still exists."""
-        return Path(self.path).is_dir()
+        return os.path.isdir(self.path)
+
+
+@functools.lru_cache(maxsize=1)
+def _zoxide_path() -> str | None:
+    """Locate the zoxide executable on PATH (looked up once per process)."""
+    return shutil.which("zoxide")
 
 
 def is_zoxide_available() -> bool:
@@ -26,7 +39,7 @@ def is_zoxide_available() -> bool:
     Returns:
         True if zoxide is installed, False otherwise
     """
-    return shutil.which("zoxide") is not None
+    return _zoxide_path() is not None
 
 
 def query_zoxide(
@@ -42,58 +55,45 @@ def query_zoxide(
     Returns:
         List of ZoxideEntry objects sorted by score (highest first)
     """
-    if not is_zoxide_available():
+    if limit <= 0 or not is_zoxide_available():
         return []
 
-    exclude_paths = exclude_paths or set()
-
     try:
         # Query zoxide for all entries with scores
         # zoxide query -l -s outputs: "score path" per line
+        # stderr is never used, so only stdout is piped and read
         result = subprocess.run(
             ["zoxide", "query", "-l", "-s"],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             timeout=5,
         )
 
-        if result.returncode != 0:
+        # Nothing to parse: skip building the exclusion set as well
+        if result.returncode != 0 or not result.stdout:
             return []
 
-        entries: list[ZoxideEntry] = []
-        for line in result.stdout.strip().split("\n"):
-            if not line.strip():
-                continue
-
-            # Parse "score path" format (score may have decimals)
-            parts = line.split(maxsplit=1)
-            if len(parts) < 2:
-                continue
-
-            try:
-                score = float(parts[0])
-            except ValueError:
-                continue
-
-            path = parts[1].strip()
-
-            # Skip excluded paths (registered projects)
-            if path in exclude_paths:
-                continue
+        # Excluded paths (e.g. registered projects) plus the home directory
+        # itself, so each line needs a single set lookup. They are normalized
+        # once here; zoxide already stores normalized absolute paths.
+        excluded = {str(Path.home())}
+        if exclude_paths:
+            excluded.update(map(os.path.normpath, exclude_paths))
 
-            # Skip home directory itself
-            home = str(Path.home())
-            if path == home:
+        entries: list[ZoxideEntry] = []
+        # Lines are matched lazily in the raw bytes, skipping malformed ones;
+        # only the path of each line is decoded
+        for match in _ENTRY_LINE.finditer(result.stdout):
+            score = float(match[1])
+            path = os.fsdecode(match[2])
+
+            # Skip excluded paths and the home directory
+            if path in excluded:
                 continue
 
-            # Get the directory name
-            name = Path(path).name
-
-            entry = ZoxideEntry(path=path, score=score, name=name)
-
             # Only include directories that still exist
-            if entry.exists:
-                entries.append(entry)
+            if os.path.isdir(path):
+                entries.append(ZoxideEntry(path=path, score=score, name=os.path.basename(path)))
 
                 # Stop if we have enough entries
                 if len(entries) >= limit:
@@ -0,0 +1,35 @@
+"""Shared fixtures for kata tests."""
+
+import os
+from collections.abc import Callable, Iterable
+
+import pytest
+
+from tests.helpers import add_marker
+
+
+@pytest.fixture
+def make_projects(tmp_path) -> Callable[[Iterable[tuple[str, str | None]]], list[str]]:
+    """Create project directories under tmp_path.
+
+    The returned helper takes ``(name, marker)`` specs: each creates the
+    directory ``name`` holding ``marker`` (``.git`` as a directory, anything
+    else as an empty file), or an empty directory if marker is None. Paths
+    are built as plain strings to keep setup cheap.
+
+    Returns:
+        Helper returning the created directory paths, in spec order
+    """
+    root = str(tmp_path)
+
+    def make(specs: Iterable[tuple[str, str | None]]) -> list[str]:
+        paths = []
+        for name, marker in specs:
+            path = f"{root}/{name}"
+            os.mkdir(path)
+            if marker is not None:
+                add_marker(path, marker)
+            paths.append(path)
+        return paths
+
+    return make
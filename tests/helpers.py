@@ -0,0 +1,30 @@
+"""Filesystem helpers shared by kata tests."""
+
+import os
+
+# Markers created as directories rather than empty files
+DIRECTORY_MARKERS = frozenset({".git"})
+
+
+def touch(path: os.PathLike[str] | str) -> None:
+    """Create an empty file, truncating it if it exists.
+
+    Unlike Path.touch, this is a bare open and close, with no utime or
+    existence check.
+    """
+    os.close(os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644))
+
+
+def add_marker(directory: os.PathLike[str] | str, marker: str) -> None:
+    """Create a project marker in a directory.
+
+    Args:
+        directory: Existing directory to mark
+        marker: Marker name, created as a directory if in DIRECTORY_MARKERS,
+            else as an empty file
+    """
+    path = os.path.join(directory, marker)
+    if marker in DIRECTORY_MARKERS:
+        os.mkdir(path)
+    else:
+        touch(path)
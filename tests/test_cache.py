@@ -0,0 +1,100 @@
+"""Tests for the persistent project status cache."""
+
+import os
+import time
+from unittest.mock import patch
+
+import pytest
+
+from kata.core.models import ProjectType
+from kata.utils.cache import (
+    StatusEntry,
+    load_status_cache,
+    lookup_status,
+    project_mtimes,
+    save_status_cache,
+)
+from kata.utils.git import GitStatus
+
+
+@pytest.fixture
+def cache_file(tmp_path):
+    """Point the status cache at a temporary file."""
+    path = tmp_path / "status_cache.json"
+    with patch("kata.utils.cache.STATUS_CACHE_FILE", path):
+        yield path
+
+
+class TestStatusCache:
+    """Tests for loading and saving the status cache."""
+
+    def test_round_trip(self, cache_file):
+        """Test that saved entries load back unchanged."""
+        entry = StatusEntry(
+            index_mtime=1,
+            dir_mtime=2,
+            git_status=GitStatus(is_git_repo=True, branch="main", is_dirty=True, ahead=3),
+            project_type=ProjectType.PYTHON,
+            read_at=3,
+        )
+        save_status_cache({"/tmp/project": entry})
+        assert load_status_cache() == {"/tmp/project": entry}
+
+    def test_missing_file(self, cache_file):
+        """Test that a missing cache file loads as empty."""
+        assert load_status_cache() == {}
+
+    def test_corrupt_file(self, cache_file):
+        """Test that an unreadable cache file loads as empty."""
+        cache_file.write_text("not json", encoding="utf-8")
+        assert load_status_cache() == {}
+
+    def test_invalid_entry_skipped(self, cache_file):
+        """Test that malformed entries are dropped and valid ones kept."""
+        save_status_cache({"/tmp/good": StatusEntry(1, 2, GitStatus(), ProjectType.GO, 3)})
+        data = cache_file.read_text(encoding="utf-8")
+        cache_file.write_text(
+            data.replace('"projects": {', '"projects": {"/tmp/bad": {"type": "cobol"}, '),
+            encoding="utf-8",
+        )
+        assert list(load_status_cache()) == ["/tmp/good"]
+
+    def test_entry_without_read_time_skipped(self, cache_file):
+        """Test that entries saved without a read time are dropped."""
+        save_status_cache({"/tmp/old": StatusEntry(1, 2, GitStatus(), ProjectType.GO, 3)})
+        data = cache_file.read_text(encoding="utf-8")
+        cache_file.write_text(data.replace(', "read_at": 3', ""), encoding="utf-8")
+        assert load_status_cache() == {}
+
+
+class TestLookupStatus:
+    """Tests for lookup_status and freshness checks."""
+
+    def test_lookup_non_git_directory(self, tmp_path):
+        """Test looking up a plain directory."""
+        (tmp_path / "go.mod").touch()
+        old_ns = time.time_ns() - 60 * 10**9
+        os.utime(tmp_path, ns=(old_ns, old_ns))
+        entry = lookup_status(str(tmp_path))
+        assert entry.project_type == ProjectType.GO
+        assert entry.git_status.is_git_repo is False
+        assert entry.index_mtime == -1
+        assert entry.is_fresh(str(tmp_path))
+
+    def test_stale_after_directory_change(self, tmp_path):
+        """Test that adding a file makes an entry stale."""
+        old_ns = time.time_ns() - 60 * 10**9
+        os.utime(tmp_path, ns=(old_ns, old_ns))
+        entry = lookup_status(str(tmp_path))
+        (tmp_path / "package.json").touch()
+        os.utime(tmp_path, ns=(old_ns + 10**9, old_ns + 10**9))
+        assert project_mtimes(str(tmp_path)) != (entry.index_mtime, entry.dir_mtime)
+        assert not entry.is_fresh(str(tmp_path))
+
+    def test_not_fresh_when_read_in_same_tick(self, tmp_path):
+        """Test an entry read right after a modification isn't trusted."""
+        mtime_ns = time.time_ns()
+        os.utime(tmp_path, ns=(mtime_ns, mtime_ns))
+        entry = lookup_status(str(tmp_path))
+        assert project_mtimes(str(tmp_path)) == (entry.index_mtime, entry.dir_mtime)
+        assert not entry.is_fresh(str(tmp_path))
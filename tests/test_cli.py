@@ -1,8 +1,6 @@
 """Tests for CLI commands."""
 
 import json
-import tempfile
-from pathlib import Path
 from unittest.mock import patch
 
 import pytest
@@ -15,13 +13,11 @@ runner = CliRunner()
 
 
 @pytest.fixture
-def temp_registry_file():
+def temp_registry_file(tmp_path_factory):
     """Create a temporary registry file."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        json.dump({"version": "1.0", "projects": []}, f)
-        temp_path = Path(f.name)
-    yield temp_path
-    temp_path.unlink(missing_ok=True)
+    temp_path = tmp_path_factory.mktemp("registry") / "projects.json"
+    temp_path.write_text(json.dumps({"version": "1.0", "projects": []}), encoding="utf-8")
+    return temp_path
 
 
 @pytest.fixture
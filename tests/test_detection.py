@@ -1,5 +1,8 @@
 """Tests for project type detection."""
 
+import os
+import time
+
 from kata.core.models import ProjectType
 from kata.utils.detection import (
     PROJECT_MARKERS,
@@ -63,6 +66,25 @@ class TestDetectProjectType:
         nonexistent = tmp_path / "nonexistent"
         assert detect_project_type(nonexistent) == ProjectType.GENERIC
 
+    def test_detect_after_marker_added(self, tmp_path):
+        """Test that a cached result is dropped when a marker file appears."""
+        # Old enough to be cached, then bumped as adding the marker would
+        old_ns = time.time_ns() - 60 * 10**9
+        os.utime(tmp_path, ns=(old_ns, old_ns))
+        assert detect_project_type(tmp_path) == ProjectType.GENERIC
+        (tmp_path / "go.mod").touch()
+        os.utime(tmp_path, ns=(old_ns + 10**9, old_ns + 10**9))
+        assert detect_project_type(tmp_path) == ProjectType.GO
+
+    def test_detect_marker_added_in_same_tick(self, tmp_path):
+        """Test a marker added without changing a recent mtime is still detected."""
+        mtime_ns = time.time_ns()
+        os.utime(tmp_path, ns=(mtime_ns, mtime_ns))
+        assert detect_project_type(tmp_path) == ProjectType.GENERIC
+        (tmp_path / "go.mod").touch()
+        os.utime(tmp_path, ns=(mtime_ns, mtime_ns))
+        assert detect_project_type(tmp_path) == ProjectType.GO
+
 
 class TestGetProjectMarkers:
     """Tests for get_project_markers function."""
@@ -4,7 +4,15 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from kata.utils.fzf import is_fzf_available, run_fzf_picker
+from kata.utils.fzf import _fzf_path, is_fzf_available, run_fzf_picker
+
+
+@pytest.fixture(autouse=True)
+def clear_fzf_path_cache():
+    """Reset the cached fzf lookup so each test sees its own PATH mock."""
+    _fzf_path.cache_clear()
+    yield
+    _fzf_path.cache_clear()
 
 
 class TestIsFzfAvailable:
@@ -20,6 +28,21 @@ class TestIsFzfAvailable:
         with patch("shutil.which", return_value=None):
             assert is_fzf_available() is False
 
+    def test_lookup_is_cached(self):
+        """Test PATH is only searched once."""
+        with patch("shutil.which", return_value="/usr/local/bin/fzf") as mock_which:
+            assert is_fzf_available() is True
+            assert is_fzf_available() is True
+            mock_which.assert_called_once_with("fzf")
+
+
+def _mock_fzf_process(returncode: int, stdout: str = "") -> MagicMock:
+    """Build a mock fzf process that exits with returncode after printing stdout."""
+    proc = MagicMock()
+    proc.stdout.read.return_value = stdout
+    proc.wait.return_value = returncode
+    return proc
+
 
 class TestRunFzfPicker:
     """Tests for run_fzf_picker function."""
@@ -32,99 +55,101 @@ class TestRunFzfPicker:
 
     def test_returns_selected_item(self):
         """Test returns the selected item from fzf."""
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "selected-item\n"
+        proc = _mock_fzf_process(0, "selected-item\n")
 
         with patch("kata.utils.fzf.is_fzf_available", return_value=True):
-            with patch("subprocess.run", return_value=mock_result) as mock_run:
+            with patch("subprocess.Popen", return_value=proc) as mock_popen:
                 result = run_fzf_picker(["item1", "item2", "selected-item"])
 
                 assert result == "selected-item"
-                mock_run.assert_called_once()
+                mock_popen.assert_called_once()
                 # Verify fzf was called with --ansi flag
-                call_args = mock_run.call_args
+                call_args = mock_popen.call_args
                 assert "--ansi" in call_args[0][0]
 
     def test_returns_none_on_cancel(self):
         """Test returns None when user cancels (Ctrl-C/Esc)."""
-        mock_result = MagicMock()
-        mock_result.returncode = 130  # Ctrl-C exit code
+        proc = _mock_fzf_process(130)  # Ctrl-C exit code
 
         with patch("kata.utils.fzf.is_fzf_available", return_value=True):
-            with patch("subprocess.run", return_value=mock_result):
+            with patch("subprocess.Popen", return_value=proc):
                 result = run_fzf_picker(["item1", "item2"])
                 assert result is None
 
     def test_returns_none_on_no_match(self):
         """Test returns None when no match found."""
-        mock_result = MagicMock()
-        mock_result.returncode = 1  # No match exit code
+        proc = _mock_fzf_process(1)  # No match exit code
 
         with patch("kata.utils.fzf.is_fzf_available", return_value=True):
-            with patch("subprocess.run", return_value=mock_result):
+            with patch("subprocess.Popen", return_value=proc):
                 result = run_fzf_picker(["item1", "item2"])
                 assert result is None
 
     def test_includes_header_when_provided(self):
         """Test includes --header flag when header is provided."""
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "item1\n"
+        proc = _mock_fzf_process(0, "item1\n")
 
         with patch("kata.utils.fzf.is_fzf_available", return_value=True):
-            with patch("subprocess.run", return_value=mock_result) as mock_run:
+            with patch("subprocess.Popen", return_value=proc) as mock_popen:
                 run_fzf_picker(["item1"], header="Test Header")
 
-                call_args = mock_run.call_args[0][0]
+                call_args = mock_popen.call_args[0][0]
                 assert "--header" in call_args
                 header_idx = call_args.index("--header")
                 assert call_args[header_idx + 1] == "Test Header"
 
     def test_includes_preview_when_provided(self):
         """Test includes --preview flag when preview_cmd is provided."""
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "item1\n"
+        proc = _mock_fzf_process(0, "item1\n")
 
         with patch("kata.utils.fzf.is_fzf_available", return_value=True):
-            with patch("subprocess.run", return_value=mock_result) as mock_run:
+            with patch("subprocess.Popen", return_value=proc) as mock_popen:
                 run_fzf_picker(["item1"], preview_cmd="echo {}")
 
-                call_args = mock_run.call_args[0][0]
+                call_args = mock_popen.call_args[0][0]
                 assert "--preview" in call_args
                 preview_idx = call_args.index("--preview")
                 assert call_args[preview_idx + 1] == "echo {}"
 
     def test_disables_ansi_when_requested(self):
         """Test does not include --ansi when ansi=False."""
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "item1\n"
+        proc = _mock_fzf_process(0, "item1\n")
 
         with patch("kata.utils.fzf.is_fzf_available", return_value=True):
-            with patch("subprocess.run", return_value=mock_result) as mock_run:
+            with patch("subprocess.Popen", return_value=proc) as mock_popen:
                 run_fzf_picker(["item1"], ansi=False)
 
-                call_args = mock_run.call_args[0][0]
+                call_args = mock_popen.call_args[0][0]
                 assert "--ansi" not in call_args
 
     def test_passes_items_via_stdin(self):
-        """Test items are passed to fzf via stdin."""
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "item2\n"
+        """Test items are streamed to fzf via stdin, one per line."""
+        proc = _mock_fzf_process(0, "item2\n")
 
         with patch("kata.utils.fzf.is_fzf_available", return_value=True):
-            with patch("subprocess.run", return_value=mock_result) as mock_run:
+            with patch("subprocess.Popen", return_value=proc):
                 run_fzf_picker(["item1", "item2", "item3"])
 
-                call_kwargs = mock_run.call_args[1]
-                assert call_kwargs["input"] == "item1\nitem2\nitem3"
+                written = "".join(c.args[0] for c in proc.stdin.write.call_args_list)
+                assert written == "item1\nitem2\nitem3\n"
+                proc.stdin.close.assert_called()
 
     def test_handles_keyboard_interrupt(self):
         """Test handles KeyboardInterrupt gracefully."""
+        proc = _mock_fzf_process(0)
+        proc.wait.side_effect = [KeyboardInterrupt, 130]
+
         with patch("kata.utils.fzf.is_fzf_available", return_value=True):
-            with patch("subprocess.run", side_effect=KeyboardInterrupt):
+            with patch("subprocess.Popen", return_value=proc):
                 result = run_fzf_picker(["item1", "item2"])
                 assert result is None
+                proc.kill.assert_called_once()
+
+    def test_stops_writing_when_fzf_exits_early(self):
+        """Test a closed pipe from fzf exiting early is not an error."""
+        proc = _mock_fzf_process(0, "item1\n")
+        proc.stdin.write.side_effect = BrokenPipeError
+
+        with patch("kata.utils.fzf.is_fzf_available", return_value=True):
+            with patch("subprocess.Popen", return_value=proc):
+                assert run_fzf_picker(["item1", "item2"]) == "item1"
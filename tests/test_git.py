@@ -0,0 +1,158 @@
+"""Tests for git status parsing."""
+
+import subprocess
+
+import pytest
+
+from kata.utils.git import GitStatus, clear_git_status_cache, get_git_status
+
+# Full SHA reported by "# branch.oid" in the canned outputs
+_OID = b"0123456789abcdef0123456789abcdef01234567"
+
+# Index and work tree object names of a changed entry
+_OIDS = _OID + b" " + _OID
+
+
+@pytest.fixture(autouse=True)
+def clear_status_cache():
+    """Forget cached statuses so each test parses its own canned output."""
+    clear_git_status_cache()
+    yield
+    clear_git_status_cache()
+
+
+@pytest.fixture
+def stub_git(monkeypatch):
+    """Stub the results of git status and git describe.
+
+    Returns:
+        Function taking the porcelain v2 status bytes and return code, and the
+        tag describe reports (None if HEAD isn't at a tag); returns the list
+        of git subcommands run
+    """
+
+    def stub(status: bytes, returncode: int = 0, tag: str | None = None) -> list[str]:
+        commands: list[str] = []
+
+        def fake_run(args, **kwargs) -> subprocess.CompletedProcess:
+            command = args[2]
+            commands.append(command)
+            if command == "describe":
+                if tag is None:
+                    return subprocess.CompletedProcess(args, 128, stdout="")
+                return subprocess.CompletedProcess(args, 0, stdout=f"{tag}\n")
+            return subprocess.CompletedProcess(args, returncode, stdout=status)
+
+        monkeypatch.setattr(subprocess, "run", fake_run)
+        return commands
+
+    return stub
+
+
+class TestGetGitStatus:
+    """Tests for get_git_status parsing of git status --porcelain=v2 --branch."""
+
+    def test_clean_branch_with_ahead_behind(self, stub_git, tmp_path):
+        """Test branch name and ahead/behind counts come from the headers."""
+        stub_git(
+            b"# branch.oid " + _OID + b"\n"
+            b"# branch.head main\n"
+            b"# branch.upstream origin/main\n"
+            b"# branch.ab +2 -1\n"
+        )
+
+        status = get_git_status(tmp_path)
+
+        assert status == GitStatus(is_git_repo=True, branch="main", ahead=2, behind=1)
+
+    def test_detached_head_at_tag(self, stub_git, tmp_path):
+        """Test a detached HEAD at a tag is shown as the tag."""
+        commands = stub_git(b"# branch.oid " + _OID + b"\n# branch.head (detached)\n", tag="v1.0")
+
+        status = get_git_status(tmp_path)
+
+        assert status.branch == "tag:v1.0"
+        assert commands == ["status", "describe"]
+
+    def test_detached_head_without_tag(self, stub_git, tmp_path):
+        """Test a detached HEAD not at a tag is shown as the short SHA."""
+        stub_git(b"# branch.oid " + _OID + b"\n# branch.head (detached)\n")
+
+        assert get_git_status(tmp_path).branch == "(0123456)"
+
+    def test_initial_commit(self, stub_git, tmp_path):
+        """Test a branch with no commits yet keeps its name and runs no other git."""
+        commands = stub_git(b"# branch.oid (initial)\n# branch.head main\n")
+
+        status = get_git_status(tmp_path)
+
+        assert status == GitStatus(is_git_repo=True, branch="main")
+        assert commands == ["status"]
+
+    def test_detached_initial_has_no_branch(self, stub_git, tmp_path):
+        """Test a detached HEAD without a commit has no display name."""
+        stub_git(b"# branch.oid (initial)\n# branch.head (detached)\n")
+
+        assert get_git_status(tmp_path).branch is None
+
+    def test_untracked_only(self, stub_git, tmp_path):
+        """Test untracked files alone mark the repo dirty but not staged or unstaged."""
+        stub_git(b"# branch.oid " + _OID + b"\n# branch.head main\n? notes.txt\n")
+
+        status = get_git_status(tmp_path)
+
+        assert status.has_untracked is True
+        assert status.has_staged is False
+        assert status.has_unstaged is False
+        assert status.is_dirty is True
+
+    def test_staged_rename(self, stub_git, tmp_path):
+        """Test a staged rename (kind 2) counts as staged only."""
+        stub_git(
+            b"# branch.oid " + _OID + b"\n"
+            b"# branch.head main\n"
+            b"2 R. N... 100644 100644 100644 " + _OIDS + b" R100 new.py\told.py\n"
+        )
+
+        status = get_git_status(tmp_path)
+
+        assert status.has_staged is True
+        assert status.has_unstaged is False
+        assert status.has_untracked is False
+        assert status.is_dirty is True
+
+    def test_all_change_kinds(self, stub_git, tmp_path):
+        """Test staged, unstaged and untracked entries are all detected."""
+        stub_git(
+            b"# branch.oid " + _OID + b"\n"
+            b"# branch.head main\n"
+            b"1 M. N... 100644 100644 100644 " + _OIDS + b" staged.py\n"
+            b"1 .M N... 100644 100644 100644 " + _OIDS + b" edited.py\n"
+            b"? new.py\n"
+        )
+
+        status = get_git_status(tmp_path)
+
+        assert status.has_staged is True
+        assert status.has_unstaged is True
+        assert status.has_untracked is True
+
+    def test_unmerged_entry(self, stub_git, tmp_path):
+        """Test an unmerged entry (kind u) counts as staged and unstaged."""
+        stub_git(
+            b"# branch.oid " + _OID + b"\n"
+            b"# branch.head main\n"
+            b"u UU N... 100644 100644 100644 100644 " + _OIDS + b" " + _OID + b" merge.py\n"
+        )
+
+        status = get_git_status(tmp_path)
+
+        assert status.has_staged is True
+        assert status.has_unstaged is True
+        assert status.has_untracked is False
+
+    def test_not_a_repository(self, stub_git, tmp_path):
+        """Test a non-zero exit from git status means not a git repo."""
+        stub_git(b"", returncode=128)
+
+        assert get_git_status(tmp_path) == GitStatus(is_git_repo=False)
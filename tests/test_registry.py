@@ -1,9 +1,6 @@
 """Tests for registry service."""
 
 import json
-import tempfile
-from pathlib import Path
-from unittest.mock import patch
 
 import pytest
 
@@ -15,27 +12,37 @@ from kata.services.registry import (
 )
 
 
+@pytest.fixture(scope="session")
+def registry_path(tmp_path_factory):
+    """Allocate one registry file path for the whole test session."""
+    return tmp_path_factory.mktemp("registry") / "projects.json"
+
+
+@pytest.fixture(scope="class")
+def registry_patch(registry_path):
+    """Point the registry at the test registry file, once per test class."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("kata.services.registry.REGISTRY_FILE", registry_path)
+        mp.setattr("kata.services.registry.ensure_config_dirs", lambda: None)
+        yield registry_path
+
+
 @pytest.fixture
-def temp_registry_file():
-    """Create a temporary registry file."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        json.dump({"version": "1.0", "projects": []}, f)
-        temp_path = Path(f.name)
-    yield temp_path
-    temp_path.unlink(missing_ok=True)
+def temp_config_dir(registry_patch):
+    """Reset the registry file to an empty registry."""
+    registry_patch.write_bytes(b'{"version": "1.0", "projects": []}')
+    return registry_patch
 
 
 @pytest.fixture
-def temp_config_dir(temp_registry_file):
-    """Create patches for config directory."""
-    with patch("kata.services.registry.REGISTRY_FILE", temp_registry_file):
-        with patch("kata.services.registry.ensure_config_dirs"):
-            yield temp_registry_file
+def registry():
+    """Create a fresh in-memory registry instance."""
+    return Registry(persistent=False)
 
 
 @pytest.fixture
-def registry(temp_config_dir):
-    """Create a fresh registry instance."""
+def file_registry(temp_config_dir):
+    """Create a fresh registry instance backed by the registry file."""
     return Registry()
 
 
@@ -173,14 +180,13 @@ class TestRegistry:
         with pytest.raises(ProjectNotFoundError):
             registry.update(project)
 
-    def test_list_all(self, registry, tmp_path):
+    def test_list_all(self, registry, make_projects):
         """Test listing all projects."""
-        for i in range(3):
-            path = tmp_path / f"dir{i}"
-            path.mkdir()
+        paths = make_projects([("dir0", None), ("dir1", None), ("dir2", None)])
+        for i, path in enumerate(paths):
             project = Project(
                 name=f"project{i}",
-                path=str(path),
+                path=path,
                 group="Test",
                 config=f"project{i}.yaml",
             )
@@ -189,14 +195,13 @@ class TestRegistry:
         projects = registry.list_all()
         assert len(projects) == 3
 
-    def test_list_by_group(self, registry, tmp_path):
+    def test_list_by_group(self, registry, make_projects):
         """Test listing projects by group."""
-        for i in range(3):
-            path = tmp_path / f"dir{i}"
-            path.mkdir()
+        paths = make_projects([("dir0", None), ("dir1", None), ("dir2", None)])
+        for i, path in enumerate(paths):
             project = Project(
                 name=f"project{i}",
-                path=str(path),
+                path=path,
                 group="Group1" if i < 2 else "Group2",
                 config=f"project{i}.yaml",
             )
@@ -208,14 +213,13 @@ class TestRegistry:
         assert len(group1_projects) == 2
         assert len(group2_projects) == 1
 
-    def test_get_groups(self, registry, tmp_path):
+    def test_get_groups(self, registry, make_projects):
         """Test getting all group names."""
-        for i, group in enumerate(["Alpha", "Beta", "Alpha"]):
-            path = tmp_path / f"dir{i}"
-            path.mkdir()
+        paths = make_projects([("dir0", None), ("dir1", None), ("dir2", None)])
+        for i, (path, group) in enumerate(zip(paths, ["Alpha", "Beta", "Alpha"], strict=True)):
             project = Project(
                 name=f"project{i}",
-                path=str(path),
+                path=path,
                 group=group,
                 config=f"project{i}.yaml",
             )
@@ -224,6 +228,26 @@ class TestRegistry:
         groups = registry.get_groups()
         assert groups == ["Alpha", "Beta"]
 
+    def test_version_changes_on_modification(self, registry, tmp_path):
+        """Test that the version counter changes when the registry changes."""
+        initial = registry.version
+        project = Project(
+            name="test-project",
+            path=str(tmp_path),
+            group="Test",
+            config="test-project.yaml",
+        )
+
+        registry.add(project)
+        after_add = registry.version
+        assert after_add != initial
+
+        registry.get("test-project")
+        assert registry.version == after_add
+
+        registry.reload()
+        assert registry.version != after_add
+
     def test_find_by_path(self, registry, tmp_path):
         """Test finding a project by path."""
         project = Project(
@@ -245,18 +269,33 @@ class TestRegistry:
         assert found is None
 
     def test_persistence(self, temp_config_dir, tmp_path):
-        """Test that registry persists data across instances."""
-        # Create first registry and add project
-        registry1 = Registry()
-        project = Project(
-            name="test-project",
-            path=str(tmp_path),
-            group="Test",
-            config="test-project.yaml",
+        """Test that registry loads projects saved in the registry file."""
+        project = {
+            "name": "test-project",
+            "path": str(tmp_path),
+            "group": "Test",
+            "config": "test-project.yaml",
+            "created_at": "2024-01-01T00:00:00",
+        }
+        temp_config_dir.write_text(
+            json.dumps({"version": "1.0", "projects": [project]}), encoding="utf-8"
+        )
+
+        registry = Registry()
+        assert "test-project" in registry
+        assert len(registry) == 1
+
+    def test_in_memory_registry_skips_file(self, file_registry, temp_config_dir, tmp_path):
+        """Test that a non-persistent registry neither loads nor saves the file."""
+        file_registry.add(
+            Project(name="saved", path=str(tmp_path), group="Test", config="saved.yaml")
+        )
+        saved = temp_config_dir.read_text(encoding="utf-8")
+
+        registry = Registry(persistent=False)
+        assert len(registry) == 0
+        registry.add(
+            Project(name="memory", path=str(tmp_path / "other"), group="Test", config="m.yaml")
         )
-        registry1.add(project)
 
-        # Create second registry and verify project exists
-        registry2 = Registry()
-        assert "test-project" in registry2
-        assert len(registry2) == 1
+        assert temp_config_dir.read_text(encoding="utf-8") == saved
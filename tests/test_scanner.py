@@ -1,54 +1,57 @@
 """Tests for directory scanner."""
 
+import os
+
+import pytest
+
 from kata.utils.scanner import (
     SKIP_DIRECTORIES,
     get_project_info,
     is_project_directory,
+    iter_projects,
     scan_directory,
 )
+from tests.helpers import add_marker, touch
 
+# One marker of each kind
+_MARKERS = [".git", "pyproject.toml", "package.json", "go.mod", "setup.py", "requirements.txt"]
 
-class TestIsProjectDirectory:
-    """Tests for is_project_directory function."""
 
-    def test_git_directory(self, tmp_path):
-        """Test detection of .git directory."""
-        (tmp_path / ".git").mkdir()
-        assert is_project_directory(tmp_path) is True
-
-    def test_pyproject_toml(self, tmp_path):
-        """Test detection of pyproject.toml."""
-        (tmp_path / "pyproject.toml").touch()
-        assert is_project_directory(tmp_path) is True
+@pytest.fixture(scope="module")
+def marker_dirs(tmp_path_factory):
+    """Create one directory per project marker, named after the marker it holds."""
+    root = tmp_path_factory.mktemp("markers")
+    for marker in _MARKERS:
+        (root / marker).mkdir()
+        add_marker(root / marker, marker)
+    return root
 
-    def test_package_json(self, tmp_path):
-        """Test detection of package.json."""
-        (tmp_path / "package.json").touch()
-        assert is_project_directory(tmp_path) is True
 
-    def test_go_mod(self, tmp_path):
-        """Test detection of go.mod."""
-        (tmp_path / "go.mod").touch()
-        assert is_project_directory(tmp_path) is True
-
-    def test_setup_py(self, tmp_path):
-        """Test detection of setup.py."""
-        (tmp_path / "setup.py").touch()
-        assert is_project_directory(tmp_path) is True
+class TestIsProjectDirectory:
+    """Tests for is_project_directory function."""
 
-    def test_requirements_txt(self, tmp_path):
-        """Test detection of requirements.txt."""
-        (tmp_path / "requirements.txt").touch()
-        assert is_project_directory(tmp_path) is True
+    @pytest.mark.parametrize("marker", _MARKERS)
+    def test_project_marker(self, marker_dirs, marker):
+        """Test detection of each project marker."""
+        assert is_project_directory(marker_dirs / marker) is True
 
     def test_empty_directory(self, tmp_path):
         """Test empty directory is not a project."""
         assert is_project_directory(tmp_path) is False
 
+    def test_marker_added_after_check(self, tmp_path):
+        """Test a marker is seen even if the directory mtime didn't change."""
+        mtime_ns = os.stat(tmp_path).st_mtime_ns
+        assert is_project_directory(tmp_path) is False
+        touch(tmp_path / "go.mod")
+        # Same timestamp tick, as on filesystems with coarse mtimes
+        os.utime(tmp_path, ns=(mtime_ns, mtime_ns))
+        assert is_project_directory(tmp_path) is True
+
     def test_file_path(self, tmp_path):
         """Test file path is not a project."""
         file_path = tmp_path / "file.txt"
-        file_path.touch()
+        touch(file_path)
         assert is_project_directory(file_path) is False
 
 
@@ -68,14 +71,11 @@ class TestScanDirectory:
 
         projects = scan_directory(tmp_path)
         assert len(projects) == 1
-        assert projects[0] == project_dir
+        assert str(projects[0]) == str(project_dir)
 
-    def test_scan_multiple_projects(self, tmp_path):
+    def test_scan_multiple_projects(self, tmp_path, make_projects):
         """Test scanning directory with multiple projects."""
-        for name in ["project1", "project2", "project3"]:
-            project_dir = tmp_path / name
-            project_dir.mkdir()
-            (project_dir / ".git").mkdir()
+        make_projects([("project1", ".git"), ("project2", ".git"), ("project3", ".git")])
 
         projects = scan_directory(tmp_path)
         assert len(projects) == 3
@@ -94,16 +94,12 @@ class TestScanDirectory:
 
         projects = scan_directory(tmp_path)
         assert len(projects) == 1
-        assert projects[0] == top_project
+        assert str(projects[0]) == str(top_project)
 
     def test_scan_respects_depth(self, tmp_path):
         """Test scanning respects max depth."""
-        # Create project at depth 3
-        level1 = tmp_path / "level1"
-        level2 = level1 / "level2"
-        level3 = level2 / "level3"
-        level3.mkdir(parents=True)
-        (level3 / ".git").mkdir()
+        # Create project at depth 3, .git included, in one call
+        os.makedirs(f"{tmp_path}/level1/level2/level3/.git")
 
         # With depth 2, shouldn't find it
         projects = scan_directory(tmp_path, max_depth=2)
@@ -135,7 +131,7 @@ class TestScanDirectory:
         """Test scanning skips node_modules."""
         project = tmp_path / "project"
         project.mkdir()
-        (project / "package.json").touch()
+        touch(project / "package.json")
 
         node_modules = project / "node_modules"
         node_modules.mkdir()
@@ -143,44 +139,73 @@ class TestScanDirectory:
         # Even with .git in node_modules, shouldn't be found
         nested = node_modules / "some-package"
         nested.mkdir()
-        (nested / "package.json").touch()
+        touch(nested / "package.json")
 
         projects = scan_directory(tmp_path)
         assert len(projects) == 1
-        assert projects[0] == project
+        assert str(projects[0]) == str(project)
 
     def test_scan_skips_venv(self, tmp_path):
         """Test scanning skips .venv directory."""
         project = tmp_path / "project"
         project.mkdir()
-        (project / "pyproject.toml").touch()
+        touch(project / "pyproject.toml")
 
         venv = project / ".venv"
         venv.mkdir()
-        (venv / "pyproject.toml").touch()
+        touch(venv / "pyproject.toml")
 
         projects = scan_directory(tmp_path)
         assert len(projects) == 1
-        assert projects[0] == project
+        assert str(projects[0]) == str(project)
 
-    def test_scan_returns_sorted_paths(self, tmp_path):
+    def test_scan_returns_sorted_paths(self, tmp_path, make_projects):
         """Test scanning returns sorted paths."""
-        for name in ["z-project", "a-project", "m-project"]:
-            project_dir = tmp_path / name
-            project_dir.mkdir()
-            (project_dir / ".git").mkdir()
+        make_projects([("z-project", ".git"), ("a-project", ".git"), ("m-project", ".git")])
 
         projects = scan_directory(tmp_path)
         names = [p.name for p in projects]
         assert names == ["a-project", "m-project", "z-project"]
 
+    def test_scan_limit_returns_first_sorted_paths(self, tmp_path, make_projects):
+        """Test limit keeps only the first paths in sorted order."""
+        make_projects([("z-project", ".git"), ("a-project", ".git"), ("m-project", ".git")])
+
+        projects = scan_directory(tmp_path, limit=2)
+        assert [p.name for p in projects] == ["a-project", "m-project"]
+
     def test_scan_root_is_project(self, tmp_path):
         """Test scanning when root itself is a project."""
         (tmp_path / ".git").mkdir()
 
         projects = scan_directory(tmp_path)
         assert len(projects) == 1
-        assert projects[0] == tmp_path
+        assert str(projects[0]) == str(tmp_path)
+
+
+class TestIterProjects:
+    """Tests for iter_projects function."""
+
+    def test_yields_same_projects_as_scan(self, tmp_path):
+        """Test iterating finds the same projects as a full scan."""
+        for name in ["project1", "group/project2", "group/sub/project3"]:
+            project_dir = tmp_path / name
+            project_dir.mkdir(parents=True)
+            (project_dir / ".git").mkdir()
+
+        assert sorted(iter_projects(tmp_path)) == scan_directory(tmp_path)
+
+    def test_stops_early(self, tmp_path):
+        """Test iteration can stop after the first project."""
+        for i in range(5):
+            project_dir = tmp_path / f"group{i}" / "project"
+            project_dir.mkdir(parents=True)
+            (project_dir / ".git").mkdir()
+
+        projects = iter_projects(tmp_path)
+        first = next(projects)
+        projects.close()
+        assert first.name == "project"
 
 
 class TestGetProjectInfo:
@@ -188,7 +213,7 @@ class TestGetProjectInfo:
 
     def test_get_info_python_project(self, tmp_path):
         """Test getting info for Python project."""
-        (tmp_path / "pyproject.toml").touch()
+        touch(tmp_path / "pyproject.toml")
         (tmp_path / ".git").mkdir()
 
         info = get_project_info(tmp_path)
@@ -200,7 +225,7 @@ class TestGetProjectInfo:
 
     def test_get_info_node_project(self, tmp_path):
         """Test getting info for Node project."""
-        (tmp_path / "package.json").touch()
+        touch(tmp_path / "package.json")
 
         info = get_project_info(tmp_path)
 
@@ -1,6 +1,7 @@
 """Tests for sessions service."""
 
-import os
+import subprocess
+from dataclasses import dataclass, field
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -21,25 +22,108 @@ from kata.services.sessions import (
 )
 
 
+@dataclass(slots=True)
+class _FakeSession:
+    """Stand-in for a libtmux session."""
+
+    name: str
+    session_attached: str = "0"
+
+
+class _FakeSessions(list):
+    """Stand-in for libtmux's session query list."""
+
+    def get(self, session_name: str) -> _FakeSession | None:
+        return next((s for s in self if s.name == session_name), None)
+
+
+@dataclass(slots=True)
+class _FakeServer:
+    """Stand-in for a libtmux server, recording has_session lookups."""
+
+    sessions: _FakeSessions = field(default_factory=_FakeSessions)
+    error: Exception | None = None
+    checked: list[str] = field(default_factory=list)
+
+    def has_session(self, name: str) -> bool:
+        self.checked.append(name)
+        if self.error is not None:
+            raise self.error
+        return any(s.name == name for s in self.sessions)
+
+
+class _TmuxEnv:
+    """Patches the tmux-facing helpers of the sessions service for a test."""
+
+    def __init__(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        self._monkeypatch = monkeypatch
+
+    def _set(self, name: str, value: object) -> None:
+        self._monkeypatch.setattr(f"kata.services.sessions.{name}", value)
+
+    def set_exists(self, *results: bool) -> None:
+        """Make session_exists return results in turn, or always the only one given."""
+        if len(results) == 1:
+            self._set("session_exists", lambda _name: results[0])
+        else:
+            answers = iter(results)
+            self._set("session_exists", lambda _name: next(answers))
+
+    def set_inside(self, inside: bool) -> None:
+        """Make is_inside_tmux return inside."""
+        self._set("is_inside_tmux", lambda: inside)
+
+    def set_client(self, client: str | None) -> None:
+        """Make _get_tmux_client return client."""
+        self._set("_get_tmux_client", lambda: client)
+
+    def skip_migration(self) -> None:
+        """Make migrate_project_config a no-op."""
+        self._set("migrate_project_config", lambda *args, **kwargs: None)
+
+    def mock_run(self) -> MagicMock:
+        """Replace subprocess.run with a mock of a successful command."""
+        mock_run = MagicMock(return_value=subprocess.CompletedProcess([], returncode=0))
+        self._monkeypatch.setattr(subprocess, "run", mock_run)
+        return mock_run
+
+    def mock_attach(self) -> MagicMock:
+        """Replace attach_session with a mock."""
+        mock_attach = MagicMock(return_value=None)
+        self._set("attach_session", mock_attach)
+        return mock_attach
+
+
+@pytest.fixture
+def tmux_env(monkeypatch: pytest.MonkeyPatch) -> _TmuxEnv:
+    """Patch session lookups, tmux detection and subprocess calls via monkeypatch."""
+    return _TmuxEnv(monkeypatch)
+
+
+@pytest.fixture
+def mock_run(tmux_env: _TmuxEnv) -> MagicMock:
+    """Mock subprocess.run and skip config migration."""
+    tmux_env.skip_migration()
+    return tmux_env.mock_run()
+
+
 class TestIsInsideTmux:
     """Tests for is_inside_tmux function."""
 
-    def test_inside_tmux(self):
+    def test_inside_tmux(self, monkeypatch):
         """Test detection when inside tmux."""
-        with patch.dict(os.environ, {"TMUX": "/tmp/tmux-1000/default,12345,0"}):
-            assert is_inside_tmux() is True
+        monkeypatch.setenv("TMUX", "/tmp/tmux-1000/default,12345,0")
+        assert is_inside_tmux() is True
 
-    def test_outside_tmux(self):
+    def test_outside_tmux(self, monkeypatch):
         """Test detection when outside tmux."""
-        env = os.environ.copy()
-        env.pop("TMUX", None)
-        with patch.dict(os.environ, env, clear=True):
-            assert is_inside_tmux() is False
+        monkeypatch.delenv("TMUX", raising=False)
+        assert is_inside_tmux() is False
 
-    def test_empty_tmux_var(self):
+    def test_empty_tmux_var(self, monkeypatch):
         """Test detection with empty TMUX variable."""
-        with patch.dict(os.environ, {"TMUX": ""}):
-            assert is_inside_tmux() is False
+        monkeypatch.setenv("TMUX", "")
+        assert is_inside_tmux() is False
 
 
 class TestSessionExists:
@@ -47,19 +131,17 @@ class TestSessionExists:
 
     def test_session_exists_true(self):
         """Test when session exists."""
-        mock_server = MagicMock()
-        mock_server.has_session.return_value = True
+        server = _FakeServer(_FakeSessions([_FakeSession("test-session")]))
 
-        with patch("kata.services.sessions._get_tmux_server", return_value=mock_server):
+        with patch("kata.services.sessions._get_tmux_server", return_value=server):
             assert session_exists("test-session") is True
-            mock_server.has_session.assert_called_once_with("test-session")
+            assert server.checked == ["test-session"]
 
     def test_session_exists_false(self):
         """Test when session doesn't exist."""
-        mock_server = MagicMock()
-        mock_server.has_session.return_value = False
+        server = _FakeServer()
 
-        with patch("kata.services.sessions._get_tmux_server", return_value=mock_server):
+        with patch("kata.services.sessions._get_tmux_server", return_value=server):
             assert session_exists("test-session") is False
 
     def test_session_exists_no_server(self):
@@ -69,10 +151,9 @@ class TestSessionExists:
 
     def test_session_exists_exception(self):
         """Test when exception occurs."""
-        mock_server = MagicMock()
-        mock_server.has_session.side_effect = Exception("tmux error")
+        server = _FakeServer(error=Exception("tmux error"))
 
-        with patch("kata.services.sessions._get_tmux_server", return_value=mock_server):
+        with patch("kata.services.sessions._get_tmux_server", return_value=server):
             assert session_exists("test-session") is False
 
 
@@ -81,34 +162,25 @@ class TestGetSessionStatus:
 
     def test_status_active(self):
         """Test status when session is active."""
-        mock_session = MagicMock()
-        mock_session.session_attached = "1"
-
-        mock_server = MagicMock()
-        mock_server.sessions.get.return_value = mock_session
+        server = _FakeServer(_FakeSessions([_FakeSession("test-session", session_attached="1")]))
 
-        with patch("kata.services.sessions._get_tmux_server", return_value=mock_server):
+        with patch("kata.services.sessions._get_tmux_server", return_value=server):
             status = get_session_status("test-session")
             assert status == SessionStatus.ACTIVE
 
     def test_status_detached(self):
         """Test status when session is detached."""
-        mock_session = MagicMock()
-        mock_session.session_attached = "0"
+        server = _FakeServer(_FakeSessions([_FakeSession("test-session", session_attached="0")]))
 
-        mock_server = MagicMock()
-        mock_server.sessions.get.return_value = mock_session
-
-        with patch("kata.services.sessions._get_tmux_server", return_value=mock_server):
+        with patch("kata.services.sessions._get_tmux_server", return_value=server):
             status = get_session_status("test-session")
             assert status == SessionStatus.DETACHED
 
     def test_status_idle(self):
         """Test status when session doesn't exist."""
-        mock_server = MagicMock()
-        mock_server.sessions.get.return_value = None
+        server = _FakeServer()
 
-        with patch("kata.services.sessions._get_tmux_server", return_value=mock_server):
+        with patch("kata.services.sessions._get_tmux_server", return_value=server):
             status = get_session_status("test-session")
             assert status == SessionStatus.IDLE
 
@@ -119,10 +191,11 @@ class TestGetSessionStatus:
             assert status == SessionStatus.IDLE
 
 
+@pytest.mark.usefixtures("mock_run")
 class TestLaunchSession:
     """Tests for launch_session function."""
 
-    def test_launch_success(self, tmp_path):
+    def test_launch_success(self, tmp_path, mock_run):
         """Test successful session launch."""
         # Config is now stored as .kata.yaml in the project directory
         config_file = tmp_path / ".kata.yaml"
@@ -135,11 +208,8 @@ class TestLaunchSession:
             config="test.yaml",
         )
 
-        with patch("kata.services.sessions.migrate_project_config"):
-            with patch("subprocess.run") as mock_run:
-                mock_run.return_value = MagicMock(returncode=0)
-                launch_session(project)
-                mock_run.assert_called_once()
+        launch_session(project)
+        mock_run.assert_called_once()
 
     def test_launch_config_not_found(self, tmp_path):
         """Test launch when config file missing."""
@@ -150,11 +220,10 @@ class TestLaunchSession:
             config="nonexistent.yaml",
         )
 
-        with patch("kata.services.sessions.migrate_project_config"):
-            with pytest.raises(ConfigNotFoundError):
-                launch_session(project)
+        with pytest.raises(ConfigNotFoundError):
+            launch_session(project)
 
-    def test_launch_tmuxp_error(self, tmp_path):
+    def test_launch_tmuxp_error(self, tmp_path, mock_run):
         """Test launch when tmuxp returns error."""
         # Config is now stored as .kata.yaml in the project directory
         config_file = tmp_path / ".kata.yaml"
@@ -167,81 +236,61 @@ class TestLaunchSession:
             config="test.yaml",
         )
 
-        with patch("kata.services.sessions.migrate_project_config"):
-            with patch("subprocess.run") as mock_run:
-                mock_run.return_value = MagicMock(returncode=1, stderr="error")
-                with pytest.raises(SessionError):
-                    launch_session(project)
+        mock_run.return_value = subprocess.CompletedProcess([], 1, stderr="error")
+        with pytest.raises(SessionError):
+            launch_session(project)
 
 
+@pytest.mark.usefixtures("mock_run")
 class TestAttachSession:
     """Tests for attach_session function."""
 
-    def test_attach_outside_tmux(self):
-        """Test attach when outside tmux."""
-        with patch("kata.services.sessions.session_exists", return_value=True):
-            with patch("kata.services.sessions.is_inside_tmux", return_value=False):
-                with patch("kata.services.sessions._get_tmux_client", return_value=None):
-                    with patch("subprocess.run") as mock_run:
-                        attach_session("test-session")
-                        mock_run.assert_called_once()
-                        args = mock_run.call_args[0][0]
-                        assert "attach-session" in args
-
-    def test_attach_inside_tmux(self):
-        """Test attach when inside tmux (should switch-client)."""
-        with patch("kata.services.sessions.session_exists", return_value=True):
-            with patch("kata.services.sessions.is_inside_tmux", return_value=True):
-                with patch("subprocess.run") as mock_run:
-                    mock_run.return_value.returncode = 0
-                    attach_session("test-session")
-                    mock_run.assert_called_once()
-                    args = mock_run.call_args[0][0]
-                    assert "switch-client" in args
-
-    def test_attach_inside_tmux_switch_client(self):
-        """Test attach inside tmux uses switch-client command."""
-        with patch("kata.services.sessions.session_exists", return_value=True):
-            with patch("kata.services.sessions.is_inside_tmux", return_value=True):
-                with patch("subprocess.run") as mock_run:
-                    mock_run.return_value.returncode = 0
-                    attach_session("test-session")
-                    mock_run.assert_called_once()
-                    args = mock_run.call_args[0][0]
-                    assert "switch-client" in args
-                    assert "-t" in args
-                    assert "test-session" in args
-
-    def test_attach_session_not_found(self):
+    @pytest.mark.parametrize(
+        ("inside", "command"),
+        [(False, "attach-session"), (True, "switch-client")],
+    )
+    def test_attach_command(self, tmux_env, mock_run, inside, command):
+        """Test attach uses switch-client inside tmux and attach-session outside."""
+        tmux_env.set_exists(True)
+        tmux_env.set_inside(inside)
+        tmux_env.set_client(None)
+        attach_session("test-session")
+        mock_run.assert_called_once()
+        args = mock_run.call_args[0][0]
+        assert command in args
+        assert "-t" in args
+        assert "test-session" in args
+
+    def test_attach_session_not_found(self, tmux_env):
         """Test attach when session doesn't exist."""
-        with patch("kata.services.sessions.session_exists", return_value=False):
-            with pytest.raises(SessionNotFoundError):
-                attach_session("test-session")
+        tmux_env.set_exists(False)
+        with pytest.raises(SessionNotFoundError):
+            attach_session("test-session")
 
 
+@pytest.mark.usefixtures("mock_run")
 class TestKillSession:
     """Tests for kill_session function."""
 
-    def test_kill_success(self):
+    def test_kill_success(self, tmux_env, mock_run):
         """Test successful session kill."""
-        with patch("kata.services.sessions.session_exists", return_value=True):
-            with patch("subprocess.run") as mock_run:
-                kill_session("test-session")
-                mock_run.assert_called_once()
-                args = mock_run.call_args[0][0]
-                assert "kill-session" in args
-
-    def test_kill_session_not_found(self):
+        tmux_env.set_exists(True)
+        kill_session("test-session")
+        mock_run.assert_called_once()
+        args = mock_run.call_args[0][0]
+        assert "kill-session" in args
+
+    def test_kill_session_not_found(self, tmux_env):
         """Test kill when session doesn't exist."""
-        with patch("kata.services.sessions.session_exists", return_value=False):
-            with pytest.raises(SessionNotFoundError):
-                kill_session("test-session")
+        tmux_env.set_exists(False)
+        with pytest.raises(SessionNotFoundError):
+            kill_session("test-session")
 
 
 class TestLaunchOrAttach:
     """Tests for launch_or_attach function."""
 
-    def test_launch_or_attach_existing(self, tmp_path):
+    def test_launch_or_attach_existing(self, tmp_path, tmux_env):
         """Test when session exists - should attach."""
         project = Project(
             name="test",
@@ -250,12 +299,12 @@ class TestLaunchOrAttach:
             config="test.yaml",
         )
 
-        with patch("kata.services.sessions.session_exists", return_value=True):
-            with patch("kata.services.sessions.attach_session") as mock_attach:
-                launch_or_attach(project)
-                mock_attach.assert_called_once_with("test")
+        tmux_env.set_exists(True)
+        mock_attach = tmux_env.mock_attach()
+        launch_or_attach(project)
+        mock_attach.assert_called_once_with("test")
 
-    def test_launch_or_attach_new(self, tmp_path):
+    def test_launch_or_attach_new(self, tmp_path, tmux_env):
         """Test when session doesn't exist - should launch then attach."""
         # Config is now stored as .kata.yaml in the project directory
         config_file = tmp_path / ".kata.yaml"
@@ -268,17 +317,12 @@ class TestLaunchOrAttach:
             config="test.yaml",
         )
 
-        with patch("kata.services.sessions.migrate_project_config"):
-            with patch("subprocess.run") as mock_run:
-                mock_run.return_value = MagicMock(returncode=0)
-                with patch("kata.services.sessions.attach_session") as mock_attach:
-                    mock_attach.return_value = None
-                    # After launch, session exists
-                    with patch(
-                        "kata.services.sessions.session_exists",
-                        side_effect=[False, True],
-                    ):
-                        launch_or_attach(project)
+        tmux_env.skip_migration()
+        tmux_env.mock_run()
+        tmux_env.mock_attach()
+        # After launch, session exists
+        tmux_env.set_exists(False, True)
+        launch_or_attach(project)
 
 
 class TestGetAllKataSessions:
@@ -286,17 +330,9 @@ class TestGetAllKataSessions:
 
     def test_get_sessions(self):
         """Test getting all sessions."""
-        mock_sessions = [
-            MagicMock(name="session1"),
-            MagicMock(name="session2"),
-        ]
-        mock_sessions[0].name = "session1"
-        mock_sessions[1].name = "session2"
-
-        mock_server = MagicMock()
-        mock_server.sessions = mock_sessions
+        server = _FakeServer(_FakeSessions([_FakeSession("session1"), _FakeSession("session2")]))
 
-        with patch("kata.services.sessions._get_tmux_server", return_value=mock_server):
+        with patch("kata.services.sessions._get_tmux_server", return_value=server):
             sessions = get_all_kata_sessions()
             assert len(sessions) == 2
             assert "session1" in sessions
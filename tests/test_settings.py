@@ -0,0 +1,139 @@
+"""Tests for settings persistence."""
+
+import json
+import os
+import subprocess
+import sys
+import textwrap
+import threading
+from pathlib import Path
+
+import pytest
+
+import kata.core.settings as settings_module
+from kata.core.settings import (
+    Settings,
+    SettingsPersistenceQueue,
+    flush_settings,
+    queue_settings_update,
+)
+
+
+@pytest.fixture
+def settings_file(tmp_path, monkeypatch):
+    """Point settings storage at a temporary directory, starting from defaults."""
+    path = tmp_path / "settings.json"
+    monkeypatch.setattr(settings_module, "KATA_CONFIG_DIR", tmp_path)
+    monkeypatch.setattr(settings_module, "SETTINGS_FILE", path)
+    monkeypatch.setattr(settings_module, "_settings", Settings())
+    return path
+
+
+@pytest.fixture
+def saves(monkeypatch):
+    """Record each settings write, signalling an event after every one.
+
+    Returns:
+        Tuple of (list of saved Settings, event set after each write)
+    """
+    saved: list[Settings] = []
+    written = threading.Event()
+    save = settings_module.save_settings
+
+    def recording_save(settings: Settings) -> None:
+        save(settings)
+        saved.append(settings)
+        written.set()
+
+    monkeypatch.setattr(settings_module, "save_settings", recording_save)
+    return saved, written
+
+
+def _use_queue(monkeypatch, delay: float) -> SettingsPersistenceQueue:
+    """Route queued updates through a fresh queue with the given delay."""
+    queue = SettingsPersistenceQueue(delay=delay)
+    monkeypatch.setattr(settings_module, "_persistence_queue", queue)
+    return queue
+
+
+class TestQueueSettingsUpdate:
+    """Tests for queued, coalesced settings writes."""
+
+    def test_rapid_updates_coalesce(self, settings_file, saves, monkeypatch):
+        """Test updates within the delay produce one write of the latest values."""
+        queue = _use_queue(monkeypatch, delay=0.05)
+        saved, written = saves
+
+        queue_settings_update(refresh_interval=10)
+        queue_settings_update(default_group="Work")
+        queue_settings_update(refresh_interval=20)
+
+        assert written.wait(5)
+        queue.flush()
+        assert len(saved) == 1
+        data = json.loads(settings_file.read_text())
+        assert data["refresh_interval"] == 20
+        assert data["default_group"] == "Work"
+
+    def test_flush_writes_pending_update(self, settings_file, saves, monkeypatch):
+        """Test flushing writes a queued update without waiting for the delay."""
+        _use_queue(monkeypatch, delay=60)
+        saved, _ = saves
+
+        queue_settings_update(theme="kata-ocean")
+        flush_settings()
+
+        assert len(saved) == 1
+        assert json.loads(settings_file.read_text())["theme"] == "kata-ocean"
+
+    def test_flush_without_pending_update(self, settings_file, saves, monkeypatch):
+        """Test flushing with nothing queued doesn't write."""
+        _use_queue(monkeypatch, delay=60)
+        saved, _ = saves
+
+        flush_settings()
+
+        assert saved == []
+        assert not settings_file.exists()
+
+    def test_flush_waits_for_write_in_progress(self, settings_file, monkeypatch):
+        """Test a flush returns only after a background write has finished."""
+        queue = _use_queue(monkeypatch, delay=0)
+        started = threading.Event()
+        release = threading.Event()
+        finished = threading.Event()
+
+        def slow_save(settings: Settings) -> None:
+            started.set()
+            release.wait(5)
+            finished.set()
+
+        monkeypatch.setattr(settings_module, "save_settings", slow_save)
+
+        queue_settings_update(loop_enabled=True)
+        assert started.wait(5)
+        threading.Timer(0.1, release.set).start()
+        queue.flush()
+
+        assert finished.is_set()
+
+    def test_pending_update_written_at_exit(self, tmp_path):
+        """Test a queued update is written when the interpreter exits."""
+        path = tmp_path / "settings.json"
+        script = textwrap.dedent(
+            f"""
+            import pathlib
+            import kata.core.settings as s
+
+            s.KATA_CONFIG_DIR = pathlib.Path({str(tmp_path)!r})
+            s.SETTINGS_FILE = pathlib.Path({str(path)!r})
+            s._settings = s.Settings()
+            s._persistence_queue._delay = 60
+            s.queue_settings_update(default_group="Exit")
+            """
+        )
+        env = {**os.environ, "PYTHONPATH": str(Path(__file__).resolve().parents[1])}
+
+        subprocess.run([sys.executable, "-c", script], check=True, env=env, timeout=30)
+
+        assert json.loads(path.read_text())["default_group"] == "Exit"
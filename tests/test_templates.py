@@ -4,7 +4,6 @@ from pathlib import Path
 from unittest.mock import patch
 
 import pytest
-import yaml
 
 from kata.core.models import Project, ProjectType
 from kata.core.templates import (
@@ -26,6 +25,26 @@ def project(tmp_path):
     )
 
 
+@pytest.fixture(scope="session")
+def shared_project(tmp_path_factory):
+    """Create a test project shared by tests that never write its template."""
+    return Project(
+        name="test-project",
+        path=str(tmp_path_factory.mktemp("project")),
+        group="Test",
+        config="test-project.yaml",
+    )
+
+
+@pytest.fixture(scope="session")
+def rendered_templates(shared_project):
+    """Render the shared project's template once per project type.
+
+    Tests must treat the rendered configs as read-only.
+    """
+    return {ptype: render_template(shared_project, ptype) for ptype in ProjectType}
+
+
 @pytest.fixture
 def mock_config_dirs():
     """Mock config dirs - configs are now stored in project directories."""
@@ -36,42 +55,42 @@ def mock_config_dirs():
 class TestRenderTemplate:
     """Tests for render_template function."""
 
-    def test_render_python_template(self, project):
+    def test_render_python_template(self, rendered_templates, shared_project):
         """Test rendering Python project template."""
-        config = render_template(project, ProjectType.PYTHON)
+        config = rendered_templates[ProjectType.PYTHON]
 
         assert config["session_name"] == "test-project"
-        assert config["start_directory"] == project.path
+        assert config["start_directory"] == shared_project.path
         assert len(config["windows"]) >= 2  # At least editor and shell
 
-    def test_render_node_template(self, project):
+    def test_render_node_template(self, rendered_templates):
         """Test rendering Node project template."""
-        config = render_template(project, ProjectType.NODE)
+        config = rendered_templates[ProjectType.NODE]
 
         assert config["session_name"] == "test-project"
         assert len(config["windows"]) >= 2
 
-    def test_render_go_template(self, project):
+    def test_render_go_template(self, rendered_templates):
         """Test rendering Go project template."""
-        config = render_template(project, ProjectType.GO)
+        config = rendered_templates[ProjectType.GO]
 
         assert config["session_name"] == "test-project"
         assert len(config["windows"]) >= 2
 
-    def test_render_generic_template(self, project):
+    def test_render_generic_template(self, rendered_templates):
         """Test rendering generic project template."""
-        config = render_template(project, ProjectType.GENERIC)
+        config = rendered_templates[ProjectType.GENERIC]
 
         assert config["session_name"] == "test-project"
         assert len(config["windows"]) >= 1
 
-    def test_template_has_valid_structure(self, project):
+    @pytest.mark.parametrize("project_type", list(ProjectType), ids=lambda t: t.name)
+    def test_template_has_valid_structure(self, rendered_templates, project_type):
         """Test that all templates produce valid structure."""
-        for project_type in ProjectType:
-            config = render_template(project, project_type)
-            assert config is not None
-            assert "session_name" in config
-            assert "windows" in config
+        config = rendered_templates[project_type]
+        assert config is not None
+        assert "session_name" in config
+        assert "windows" in config
 
 
 class TestWriteTemplate:
@@ -85,9 +104,9 @@ class TestWriteTemplate:
         assert config_path.name == ".kata.yaml"
         assert config_path.parent == Path(project.path)
 
-        content = config_path.read_text()
-        config = yaml.safe_load(content)
-        assert config["session_name"] == "test-project"
+        # A top-level key is a line of its own; no need to parse the YAML back
+        content = config_path.read_text(encoding="utf-8")
+        assert "session_name: test-project" in content.splitlines()
 
     def test_write_template_creates_directory(self, project, mock_config_dirs):
         """Test that write creates the configs directory."""
@@ -98,12 +117,12 @@ class TestWriteTemplate:
 class TestGetTemplatePath:
     """Tests for get_template_path function."""
 
-    def test_get_template_path(self, project):
+    def test_get_template_path(self, shared_project):
         """Test getting template path."""
-        path = get_template_path(project)
+        path = get_template_path(shared_project)
 
         assert path.name == ".kata.yaml"
-        assert path.parent == Path(project.path)
+        assert path.parent == Path(shared_project.path)
 
 
 class TestTemplateExists:
@@ -114,49 +133,50 @@ class TestTemplateExists:
         write_template(project, ProjectType.PYTHON)
         assert template_exists(project) is True
 
-    def test_template_exists_false(self, project):
+    def test_template_exists_false(self, shared_project):
         """Test when template doesn't exist."""
-        assert template_exists(project) is False
+        assert template_exists(shared_project) is False
 
 
 class TestTemplateContent:
     """Tests for template content specifics."""
 
-    def test_python_template_has_venv_activation(self, project):
+    def test_python_template_has_venv_activation(self, rendered_templates):
         """Test Python template includes venv activation."""
-        config = render_template(project, ProjectType.PYTHON)
+        config = rendered_templates[ProjectType.PYTHON]
 
         # Look for venv activation in shell panes
-        has_venv = False
-        for window in config.get("windows", []):
-            panes = window.get("panes", [])
-            for pane in panes:
-                if isinstance(pane, dict) and "shell_command" in pane:
-                    commands = pane["shell_command"]
-                    if any("venv" in str(cmd) for cmd in commands):
-                        has_venv = True
+        has_venv = any(
+            "venv" in str(cmd)
+            for window in config.get("windows", [])
+            for pane in window.get("panes", [])
+            if isinstance(pane, dict)
+            for cmd in pane.get("shell_command", [])
+        )
         # Check the template is valid
         assert config is not None
         assert has_venv is True
 
-    def test_node_template_has_npm_commands(self, project):
+    def test_node_template_has_npm_commands(self, rendered_templates):
         """Test Node template structure is valid."""
-        config = render_template(project, ProjectType.NODE)
+        config = rendered_templates[ProjectType.NODE]
 
         assert "windows" in config
         assert len(config["windows"]) > 0
 
-    def test_go_template_has_valid_structure(self, project):
+    def test_go_template_has_valid_structure(self, rendered_templates):
         """Test Go template structure is valid."""
-        config = render_template(project, ProjectType.GO)
+        config = rendered_templates[ProjectType.GO]
 
         assert "windows" in config
         assert "session_name" in config
         assert "start_directory" in config
 
-    def test_template_uses_correct_start_directory(self, project):
+    @pytest.mark.parametrize("project_type", list(ProjectType), ids=lambda t: t.name)
+    def test_template_uses_correct_start_directory(
+        self, rendered_templates, shared_project, project_type
+    ):
         """Test templates use project path as start directory."""
-        for project_type in ProjectType:
-            config = render_template(project, project_type)
+        config = rendered_templates[project_type]
 
-            assert config["start_directory"] == project.path
+        assert config["start_directory"] == shared_project.path
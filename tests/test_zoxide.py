@@ -1,8 +1,54 @@
 """Tests for zoxide utilities."""
 
-from unittest.mock import MagicMock, patch
+import subprocess
+from pathlib import Path
+from unittest.mock import MagicMock
 
-from kata.utils.zoxide import ZoxideEntry, is_zoxide_available, query_zoxide
+import pytest
+
+from kata.utils.zoxide import ZoxideEntry, _zoxide_path, is_zoxide_available, query_zoxide
+
+
+@pytest.fixture(autouse=True)
+def clear_zoxide_path_cache():
+    """Reset the cached zoxide lookup so each test sees its own PATH."""
+    _zoxide_path.cache_clear()
+    yield
+    _zoxide_path.cache_clear()
+
+
+@pytest.fixture
+def zoxide_available(monkeypatch):
+    """Report zoxide as installed."""
+    monkeypatch.setattr("kata.utils.zoxide.is_zoxide_available", lambda: True)
+
+
+@pytest.fixture
+def stub_zoxide(monkeypatch, zoxide_available):
+    """Report zoxide as installed and stub the result of running it.
+
+    Returns:
+        Function taking the stdout bytes and return code to report, or an
+        error for the run to raise instead
+    """
+
+    def stub(stdout: bytes = b"", returncode: int = 0, error: BaseException | None = None) -> None:
+        def fake_run(*args, **kwargs) -> subprocess.CompletedProcess[bytes]:
+            if error is not None:
+                raise error
+            return subprocess.CompletedProcess([], returncode, stdout=stdout)
+
+        monkeypatch.setattr(subprocess, "run", fake_run)
+
+    return stub
+
+
+@pytest.fixture
+def existing_dirs(monkeypatch):
+    """Fake zoxide's directory existence checks with a set of paths."""
+    dirs: set[str] = set()
+    monkeypatch.setattr("kata.utils.zoxide.os.path.isdir", dirs.__contains__)
+    return dirs
 
 
 class TestZoxideEntry:
@@ -34,165 +80,154 @@ class TestZoxideEntry:
 class TestIsZoxideAvailable:
     """Tests for is_zoxide_available function."""
 
-    def test_returns_true_when_zoxide_installed(self):
+    def test_returns_true_when_zoxide_installed(self, monkeypatch, tmp_path):
         """Test returns True when zoxide is in PATH."""
-        with patch("shutil.which", return_value="/usr/local/bin/zoxide"):
-            assert is_zoxide_available() is True
+        stub = tmp_path / "zoxide"
+        stub.touch()
+        stub.chmod(0o755)
+        monkeypatch.setenv("PATH", str(tmp_path))
+        assert is_zoxide_available() is True
 
-    def test_returns_false_when_zoxide_not_installed(self):
+    def test_returns_false_when_zoxide_not_installed(self, monkeypatch, tmp_path):
         """Test returns False when zoxide is not in PATH."""
-        with patch("shutil.which", return_value=None):
-            assert is_zoxide_available() is False
+        monkeypatch.setenv("PATH", str(tmp_path))
+        assert is_zoxide_available() is False
 
 
 class TestQueryZoxide:
     """Tests for query_zoxide function."""
 
-    def test_returns_empty_list_when_zoxide_not_available(self):
+    def test_returns_empty_list_when_zoxide_not_available(self, monkeypatch):
         """Test returns empty list when zoxide is not installed."""
-        with patch("kata.utils.zoxide.is_zoxide_available", return_value=False):
-            result = query_zoxide()
-            assert result == []
+        monkeypatch.setattr("kata.utils.zoxide.is_zoxide_available", lambda: False)
+        result = query_zoxide()
+        assert result == []
 
-    def test_returns_empty_list_on_zoxide_error(self):
+    def test_returns_empty_list_on_zoxide_error(self, stub_zoxide):
         """Test returns empty list when zoxide command fails."""
-        mock_result = MagicMock()
-        mock_result.returncode = 1
-
-        with patch("kata.utils.zoxide.is_zoxide_available", return_value=True):
-            with patch("subprocess.run", return_value=mock_result):
-                result = query_zoxide()
-                assert result == []
+        stub_zoxide(returncode=1)
+        result = query_zoxide()
+        assert result == []
 
-    def test_parses_zoxide_output_correctly(self, tmp_path):
+    def test_parses_zoxide_output_correctly(self, existing_dirs, stub_zoxide):
         """Test parses zoxide query output correctly."""
-        # Create a temporary directory that exists
-        project_dir = tmp_path / "myproject"
-        project_dir.mkdir()
+        # Only this directory exists
+        project_dir = "/work/myproject"
+        existing_dirs.add(project_dir)
 
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = f"100.5 {project_dir}\n50.0 /nonexistent/path\n"
+        stub_zoxide(f"100.5 {project_dir}\n50.0 /nonexistent/path\n".encode())
+        result = query_zoxide()
 
-        with patch("kata.utils.zoxide.is_zoxide_available", return_value=True):
-            with patch("subprocess.run", return_value=mock_result):
-                result = query_zoxide()
+        # Should only include the existing directory
+        assert len(result) == 1
+        assert result[0].path == project_dir
+        assert result[0].score == 100.5
+        assert result[0].name == "myproject"
 
-                # Should only include the existing directory
-                assert len(result) == 1
-                assert result[0].path == str(project_dir)
-                assert result[0].score == 100.5
-                assert result[0].name == "myproject"
-
-    def test_respects_limit_parameter(self, tmp_path):
+    def test_respects_limit_parameter(self, existing_dirs, stub_zoxide):
         """Test respects the limit parameter."""
-        # Create multiple temporary directories
-        dirs = []
-        for i in range(5):
-            d = tmp_path / f"project{i}"
-            d.mkdir()
-            dirs.append(d)
+        dirs = [f"/work/project{i}" for i in range(5)]
+        existing_dirs.update(dirs)
 
         output_lines = "\n".join(f"{100 - i * 10}.0 {d}" for i, d in enumerate(dirs))
 
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = output_lines
+        stub_zoxide(output_lines.encode())
+        result = query_zoxide(limit=3)
+        assert len(result) == 3
 
-        with patch("kata.utils.zoxide.is_zoxide_available", return_value=True):
-            with patch("subprocess.run", return_value=mock_result):
-                result = query_zoxide(limit=3)
-                assert len(result) == 3
+    def test_zero_limit_skips_query(self, monkeypatch, zoxide_available):
+        """Test a zero limit returns nothing without running zoxide."""
+        mock_run = MagicMock()
+        monkeypatch.setattr(subprocess, "run", mock_run)
+        assert query_zoxide(limit=0) == []
+        mock_run.assert_not_called()
 
-    def test_excludes_specified_paths(self, tmp_path):
+    def test_excludes_specified_paths(self, existing_dirs, stub_zoxide):
         """Test excludes paths in exclude_paths set."""
-        project1 = tmp_path / "project1"
-        project2 = tmp_path / "project2"
-        project1.mkdir()
-        project2.mkdir()
+        project1 = "/work/project1"
+        project2 = "/work/project2"
+        existing_dirs.update((project1, project2))
 
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = f"100.0 {project1}\n50.0 {project2}\n"
+        stub_zoxide(f"100.0 {project1}\n50.0 {project2}\n".encode())
+        result = query_zoxide(exclude_paths={project1})
 
-        with patch("kata.utils.zoxide.is_zoxide_available", return_value=True):
-            with patch("subprocess.run", return_value=mock_result):
-                result = query_zoxide(exclude_paths={str(project1)})
+        assert len(result) == 1
+        assert result[0].path == project2
 
-                assert len(result) == 1
-                assert result[0].path == str(project2)
+    def test_excludes_unnormalized_paths(self, existing_dirs, stub_zoxide):
+        """Test excluded paths match regardless of trailing separators."""
+        project1 = "/work/project1"
+        project2 = "/work/project2"
+        existing_dirs.update((project1, project2))
 
-    def test_excludes_home_directory(self, tmp_path):
-        """Test excludes the home directory."""
-        project_dir = tmp_path / "project"
-        project_dir.mkdir()
+        stub_zoxide(f"100.0 {project1}\n50.0 {project2}\n".encode())
+        result = query_zoxide(exclude_paths={f"{project1}/"})
 
-        mock_result = MagicMock()
-        mock_result.returncode = 0
+        assert [e.path for e in result] == [project2]
 
-        with patch("kata.utils.zoxide.is_zoxide_available", return_value=True):
-            with patch("subprocess.run", return_value=mock_result):
-                with patch("pathlib.Path.home", return_value=tmp_path):
-                    mock_result.stdout = f"100.0 {tmp_path}\n50.0 {project_dir}\n"
-                    result = query_zoxide()
+    def test_excludes_home_directory(self, existing_dirs, monkeypatch, stub_zoxide):
+        """Test excludes the home directory."""
+        home = Path("/home/user")
+        project_dir = "/home/user/project"
+        existing_dirs.update((str(home), project_dir))
 
-                    # Should only include project_dir, not home
-                    assert len(result) == 1
-                    assert result[0].path == str(project_dir)
+        stub_zoxide(f"100.0 {home}\n50.0 {project_dir}\n".encode())
+        monkeypatch.setattr("pathlib.Path.home", lambda: home)
+        result = query_zoxide()
 
-    def test_handles_empty_output(self):
-        """Test handles empty zoxide output."""
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = ""
+        # Should only include project_dir, not home
+        assert len(result) == 1
+        assert result[0].path == project_dir
 
-        with patch("kata.utils.zoxide.is_zoxide_available", return_value=True):
-            with patch("subprocess.run", return_value=mock_result):
-                result = query_zoxide()
-                assert result == []
+    def test_handles_empty_output(self, stub_zoxide):
+        """Test handles empty zoxide output."""
+        stub_zoxide()
+        result = query_zoxide()
+        assert result == []
 
-    def test_handles_malformed_lines(self, tmp_path):
+    def test_handles_malformed_lines(self, existing_dirs, stub_zoxide):
         """Test skips malformed output lines."""
-        project_dir = tmp_path / "project"
-        project_dir.mkdir()
+        project_dir = "/work/project"
+        existing_dirs.update((project_dir, "/path"))
 
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = f"malformed line\n100.0 {project_dir}\nnot a score /path\n"
+        stub_zoxide(f"malformed line\n100.0 {project_dir}\nnot a score /path\n".encode())
+        result = query_zoxide()
 
-        with patch("kata.utils.zoxide.is_zoxide_available", return_value=True):
-            with patch("subprocess.run", return_value=mock_result):
-                result = query_zoxide()
+        assert len(result) == 1
+        assert result[0].path == project_dir
 
-                assert len(result) == 1
-                assert result[0].path == str(project_dir)
+    def test_parses_right_aligned_scores(self, existing_dirs, stub_zoxide):
+        """Test parses scores padded with leading spaces."""
+        project_dir = "/work/project"
+        existing_dirs.add(project_dir)
 
-    def test_handles_timeout(self):
-        """Test handles subprocess timeout gracefully."""
-        import subprocess
+        stub_zoxide(f"   4.0 {project_dir}\n".encode())
+        result = query_zoxide()
 
-        with patch("kata.utils.zoxide.is_zoxide_available", return_value=True):
-            with patch("subprocess.run", side_effect=subprocess.TimeoutExpired("zoxide", 5)):
-                result = query_zoxide()
-                assert result == []
+        assert len(result) == 1
+        assert result[0].path == project_dir
+        assert result[0].score == 4.0
+
+    def test_handles_timeout(self, stub_zoxide):
+        """Test handles subprocess timeout gracefully."""
+        stub_zoxide(error=subprocess.TimeoutExpired("zoxide", 5))
+        result = query_zoxide()
+        assert result == []
 
-    def test_handles_file_not_found(self):
+    def test_handles_file_not_found(self, stub_zoxide):
         """Test handles FileNotFoundError gracefully."""
-        with patch("kata.utils.zoxide.is_zoxide_available", return_value=True):
-            with patch("subprocess.run", side_effect=FileNotFoundError):
-                result = query_zoxide()
-                assert result == []
+        stub_zoxide(error=FileNotFoundError())
+        result = query_zoxide()
+        assert result == []
 
-    def test_calls_zoxide_with_correct_args(self):
+    def test_calls_zoxide_with_correct_args(self, monkeypatch, zoxide_available):
         """Test calls zoxide with -l and -s flags."""
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = ""
+        mock_result = subprocess.CompletedProcess([], 0, stdout=b"")
 
-        with patch("kata.utils.zoxide.is_zoxide_available", return_value=True):
-            with patch("subprocess.run", return_value=mock_result) as mock_run:
-                query_zoxide()
+        mock_run = MagicMock(return_value=mock_result)
+        monkeypatch.setattr(subprocess, "run", mock_run)
+        query_zoxide()
 
-                mock_run.assert_called_once()
-                call_args = mock_run.call_args[0][0]
-                assert call_args == ["zoxide", "query", "-l", "-s"]
+        mock_run.assert_called_once()
+        call_args = mock_run.call_args[0][0]
+        assert call_args == ["zoxide", "query", "-l", "-s"]